@@ -1,11 +1,23 @@
+import heapq
 import math
 import re
 import string
+from array import array
 from collections import Counter
+from functools import lru_cache
+from itertools import compress
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from .number_stats import (
+    DEFAULT_PERCENTILES, HISTOGRAM_BINS, median, percentiles, mean_variance, histogram
+)
+from .sketches import SKETCH_CAPACITY, SpaceSaving, top_counts
 from .checkers import (
-    is_prime_check, is_perfect, is_happy, is_palindrome, is_perfect_square,
+    is_prime, is_happy, is_palindrome, is_perfect_square,
     is_perfect_cube, is_increasing, is_decreasing, is_fibonacci, is_armstrong,
-    get_proper_divisors, is_binary
+    is_triangular, is_binary, factorize, divisors_from_factors, divisor_sum
 )
 
 
@@ -23,24 +35,97 @@ def calculate_ic(text):
     return numerator / denominator if denominator != 0 else 0.0
 
 
+def entropy_from_counts(counts, total: int) -> float:
+    """Calculates the Shannon entropy from symbol counts."""
+    if total <= 0:
+        return 0.0
+    entropy = 0.0
+    for count in counts:
+        probability = count / total
+        entropy -= probability * math.log2(probability)
+    return entropy
+
+
 def calculate_entropy(text: str) -> float:
     """Calculates the Shannon entropy for the given text."""
     try:
         if not text:
             return 0.0
-        char_frequency = {}
-        text_length = len(text)
-        for char in text:
-            char_frequency[char] = char_frequency.get(char, 0) + 1
-        entropy = 0.0
-        for count in char_frequency.values():
-            probability = count / text_length
-            entropy -= probability * math.log2(probability)
-        return entropy
+        return entropy_from_counts(Counter(text).values(), len(text))
     except Exception as e:
         return float("nan")
 
 
+NUMPY_PROFILE_THRESHOLD = 1 << 16
+_PUNCTUATION = frozenset(string.punctuation)
+
+
+def _count_codepoints(text: str) -> tuple[dict, int]:
+    """Counts characters, in first-occurrence order, and words of a text.
+
+    Small inputs use Counter and str.split; large ones np.unique over the
+    UTF-32 codepoints, which also gives each character's first position, with
+    word starts found on a whitespace mask.
+    """
+    if np is None or len(text) < NUMPY_PROFILE_THRESHOLD:
+        return Counter(text), len(text.split())
+    codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    present, first, totals = np.unique(codepoints, return_index=True, return_counts=True)
+    order = np.argsort(first)
+    counts = {chr(cp): count for cp, count in zip(present[order].tolist(), totals[order].tolist())}
+    spaces = [ord(char) for char in counts if char.isspace()]
+    non_space = ~np.isin(codepoints, np.array(spaces, dtype=np.uint32))
+    word_count = int(non_space[0]) + int(np.count_nonzero(non_space[1:] & ~non_space[:-1]))
+    return counts, word_count
+
+
+def text_profile(text: str) -> dict:
+    """Computes character classes, frequencies, entropy, lines and words of a text at once.
+
+    The text itself is scanned only by C-level counting; every class total is
+    then derived from the per-character counts, so the cost beyond counting
+    grows with the number of distinct characters, not the length.
+    """
+    counts, word_count = _count_codepoints(text)
+    return profile_from_counts(counts, len(text), word_count)
+
+
+def profile_from_counts(counts, total: int, word_count: int) -> dict:
+    """Builds the text_profile dictionary from per-character counts and a word count."""
+    profile = {
+        "total_characters": total,
+        "character_frequency": dict(counts),
+        "letter_count": 0,
+        "digit_count": 0,
+        "uppercase_count": 0,
+        "lowercase_count": 0,
+        "punctuation_count": 0,
+        "space_count": 0,
+        "word_count": word_count,
+        "word_characters": 0,
+    }
+    for char, count in counts.items():
+        if char.isalpha():
+            profile["letter_count"] += count
+        if char.isdigit():
+            profile["digit_count"] += count
+        if char.isupper():
+            profile["uppercase_count"] += count
+        if char.islower():
+            profile["lowercase_count"] += count
+        if char in _PUNCTUATION:
+            profile["punctuation_count"] += count
+        if char.isspace():
+            profile["space_count"] += count
+        else:
+            profile["word_characters"] += count
+    profile["whitespace_characters"] = counts.get(" ", 0) + counts.get("\t", 0) + counts.get("\n", 0)
+    profile["line_count"] = counts.get("\n", 0) + 1 if total else 0
+    profile["unique_characters"] = len(counts)
+    profile["entropy"] = entropy_from_counts(counts.values(), total)
+    return profile
+
+
 def cesar_encrypt(text, shift):
     """Encrypts text using the Caesar cipher with a given shift."""
     encrypted_text = ""
@@ -95,56 +180,18 @@ def cesar_decrypt(text):
 
 def detect_cipher(text):
     """Analyzes text to detect the type of encoding or cipher used."""
-    if not text or not text.strip():
-        return {"error": "Input is empty."}
-
-    analysis = {}
-    cleaned_text = text.replace(" ", "").replace("\n", "")
-
-    # 1. Check for common non-alphabetic encodings first
-    if all(c in '01' for c in cleaned_text):
-        analysis["Conclusion"] = "Looks like Binary (Base2)."
-    elif all(c in '01234567' for c in cleaned_text):
-        analysis["Conclusion"] = "Looks like Octal (Base8)."
-    elif all(c in '0123456789abcdefABCDEF' for c in cleaned_text):
-        analysis["Conclusion"] = "Looks like Hexadecimal (Base16)."
-    elif len(cleaned_text) > 20 and re.fullmatch(r'[A-Za-z0-9+/=]*', cleaned_text):
-        try:
-            import base64
-            padded_text = cleaned_text + '=' * (-len(cleaned_text) % 4)
-            decoded = base64.b64decode(padded_text)
-            if sum(31 < x < 127 or x in b'\t\n\r' for x in decoded) / len(decoded) > 0.8:
-                analysis["Conclusion"] = "Looks like Base64 encoding."
-        except:
-            pass
-
-    # 2. If no encoding was detected, perform statistical analysis on the text
-    if not analysis:
-        ic = calculate_ic(text)
-        entropy = calculate_entropy(text)
-        ic_english = 0.067
-        ic_random = 1.0 / 26.0  # Approximately 0.0385
-
-        # Determine the most likely category based on IC and Entropy
-        unique_chars = len(set(text))
-        if unique_chars == 1:
-            conclusion = "The text consists of a single repeating character."
-        elif ic > 0.1:
-             conclusion = "Very high IC. The text is highly repetitive and not standard English. It might be a simple pattern or a single-character substitution from a small alphabet."
-        elif abs(ic - ic_english) < 0.01:
-            conclusion = "High probability of being a monoalphabetic substitution cipher (e.g., Caesar, Atbash, Simple Substitution)."
-        elif abs(ic - ic_random) < 0.01:
-            conclusion = "Likely a polyalphabetic cipher (e.g., Vigenère), modern encryption, or compressed data. The character distribution is close to random."
-        else:
-            conclusion = "The statistical properties are inconclusive. It might be a complex cipher, non-standard text, or too short for an accurate analysis."
-
-        analysis = {
-            "Index of Coincidence (IC)": f"{ic:.4f} (Random is ~0.038, English is ~0.067)",
-            "Shannon Entropy": f"{entropy:.4f} bits/char (English is ~4.0-4.5, Random is >7.5)",
-            "Conclusion": conclusion
-        }
-
-    return analysis
+    from .cipher_classifier import classify
+
+    result = classify(text)
+    if "error" in result:
+        return result
+    if result["format"] != "text":
+        return {"Conclusion": result["conclusion"]}
+    return {
+        "Index of Coincidence (IC)": f"{result['ic']:.4f} (Random is ~0.038, English is ~0.067)",
+        "Shannon Entropy": f"{result['entropy']:.4f} bits/char (English is ~4.0-4.5, Random is >7.5)",
+        "Conclusion": result["conclusion"]
+    }
 
 
 def character_stats(text: str) -> dict:
@@ -152,39 +199,32 @@ def character_stats(text: str) -> dict:
     try:
         if not text:
             return {"error": "No text provided"}
-        # Basic statistics
-        total_chars = len(text)
-        whitespace_count = text.count(
-            ' ') + text.count('\t') + text.count('\n')
-        non_whitespace_chars = total_chars - whitespace_count
-        digit_count = sum(c.isdigit() for c in text)
-        letter_count = sum(c.isalpha() for c in text)
-        uppercase_count = sum(c.isupper() for c in text)
-        lowercase_count = sum(c.islower() for c in text)
-        punctuation_count = sum(c in string.punctuation for c in text)
-        line_count = text.count('\n') + 1 if text else 0
-        words = text.split()
-        word_count = len(words)
-        avg_word_length = sum(len(word) for word in words) / \
-            word_count if word_count > 0 else 0
-
-        return {
-            "total_characters": total_chars,
-            "whitespace_characters": whitespace_count,
-            "non_whitespace_characters": non_whitespace_chars,
-            "digit_count": digit_count,
-            "letter_count": letter_count,
-            "uppercase_count": uppercase_count,
-            "lowercase_count": lowercase_count,
-            "punctuation_count": punctuation_count,
-            "line_count": line_count,
-            "word_count": word_count,
-            "average_word_length": round(avg_word_length, 2)
-        }
+        return character_stats_from_profile(text_profile(text))
     except Exception as e:
         return {"error": f"Character analysis failed: {str(e)}"}
 
 
+def character_stats_from_profile(profile: dict) -> dict:
+    """Builds the character_stats dictionary from a text profile."""
+    word_count = profile["word_count"]
+    avg_word_length = profile["word_characters"] / \
+        word_count if word_count > 0 else 0
+
+    return {
+        "total_characters": profile["total_characters"],
+        "whitespace_characters": profile["whitespace_characters"],
+        "non_whitespace_characters": profile["total_characters"] - profile["whitespace_characters"],
+        "digit_count": profile["digit_count"],
+        "letter_count": profile["letter_count"],
+        "uppercase_count": profile["uppercase_count"],
+        "lowercase_count": profile["lowercase_count"],
+        "punctuation_count": profile["punctuation_count"],
+        "line_count": profile["line_count"],
+        "word_count": word_count,
+        "average_word_length": round(avg_word_length, 2)
+    }
+
+
 def format_character_stats(stats: dict) -> str:
     """Formats the character statistics dictionary into a readable string."""
     if "error" in stats:
@@ -206,57 +246,242 @@ def format_character_stats(stats: dict) -> str:
     return "\n".join(output)
 
 
-def extract_numbers(text: str) -> list:
-    """Extracts all integer and float numbers from a string."""
-    try:
-        numbers = []
-        number_pattern = r'-?\d+\.?\d*'
-        for match in re.finditer(number_pattern, text):
-            number_str = match.group()
+NUMBER_PATTERN = re.compile(r'-?\d+\.?\d*')
+_INT, _FLOAT, _BIG = 0, 1, 2
+NUMPY_STATS_THRESHOLD = 1 << 16
+# Above this many numbers, frequency analysis switches to a bounded-memory sketch.
+FREQUENCY_SKETCH_THRESHOLD = 1 << 20
+
+
+def number_tail_start(text: str) -> int:
+    """Returns where the trailing run of digits, '.' and '-' of a text starts.
+
+    A number token only contains those characters, so a text that continues
+    in a later chunk can be scanned safely up to this index.
+    """
+    cut = len(text)
+    while cut and (text[cut - 1] in ".-" or text[cut - 1].isdecimal()):
+        cut -= 1
+    return cut
+
+
+class NumberScan:
+    """The numbers of a text, tokenized once into compact typed arrays.
+
+    Integers that fit in 64 bits go to ints (array 'q'), floats to floats
+    (array 'd') and larger integers to big_ints, keyed by token index; kinds
+    records the kind of every token so the original order can be rebuilt.
+    Text can be fed in chunks; a number token split across chunks is held
+    back until the next chunk or close().
+    """
+
+    def __init__(self):
+        self.ints = array("q")
+        self.floats = array("d")
+        self.big_ints = {}
+        self.kinds = bytearray()
+        self._carry = ""
+        self._numbers = None
+        self._frequency = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "NumberScan":
+        """Scans a complete text."""
+        scan = cls()
+        scan._add_tokens(NUMBER_PATTERN.findall(text))
+        return scan
+
+    def feed(self, chunk: str) -> "NumberScan":
+        """Scans the next chunk of a text."""
+        text = self._carry + chunk
+        cut = number_tail_start(text)
+        self._add_tokens(NUMBER_PATTERN.findall(text, 0, cut))
+        self._carry = text[cut:]
+        return self
+
+    def close(self) -> "NumberScan":
+        """Scans the number token held back at the end of the fed text."""
+        self._add_tokens(NUMBER_PATTERN.findall(self._carry))
+        self._carry = ""
+        return self
+
+    def _add_tokens(self, tokens: list) -> None:
+        if not tokens:
+            return
+        self._numbers = self._frequency = None
+        is_float = ['.' in token for token in tokens]
+        if True in is_float:
+            floats = list(map(float, compress(tokens, is_float)))
+            int_tokens = [token for token, flag in zip(tokens, is_float) if not flag]
+        else:
+            floats, int_tokens = [], tokens
+        try:
+            ints = array("q", map(int, int_tokens))
+        except (OverflowError, ValueError):
+            self._add_tokens_one_by_one(tokens)
+            return
+        self.kinds.extend(is_float)
+        self.floats.extend(floats)
+        self.ints.extend(ints)
+
+    def _add_tokens_one_by_one(self, tokens: list) -> None:
+        """Adds tokens that include big integers; integers too long to convert are skipped."""
+        for token in tokens:
+            if '.' in token:
+                self.floats.append(float(token))
+                self.kinds.append(_FLOAT)
+                continue
             try:
-                if '.' in number_str:
-                    numbers.append(float(number_str))
-                else:
-                    numbers.append(int(number_str))
+                value = int(token)
             except ValueError:
                 continue
-        return numbers
+            if -(1 << 63) <= value < (1 << 63):
+                self.ints.append(value)
+                self.kinds.append(_INT)
+            else:
+                self.big_ints[len(self.kinds)] = value
+                self.kinds.append(_BIG)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def numbers(self) -> list:
+        """Returns all numbers as Python ints and floats, in text order."""
+        if self._numbers is None:
+            self._numbers = self.head(len(self.kinds))
+        return self._numbers
+
+    def iter_numbers(self):
+        """Yields the numbers in text order without building a list."""
+        if self._numbers is not None:
+            yield from self._numbers
+            return
+        next_int, next_float = iter(self.ints).__next__, iter(self.floats).__next__
+        for index, kind in enumerate(self.kinds):
+            yield next_int() if kind == _INT else next_float() if kind == _FLOAT else self.big_ints[index]
+
+    def head(self, count: int) -> list:
+        """Returns the first count numbers without building the whole list."""
+        if self._numbers is not None:
+            return self._numbers[:count]
+        kinds = self.kinds[:count]
+        if _FLOAT not in kinds and _BIG not in kinds:
+            return self.ints[:len(kinds)].tolist()
+        next_int, next_float = iter(self.ints).__next__, iter(self.floats).__next__
+        return [next_int() if kind == _INT else next_float() if kind == _FLOAT else self.big_ints[index]
+                for index, kind in enumerate(kinds)]
+
+    def int_sum(self) -> int:
+        """Returns the exact sum of all integers."""
+        return sum(self.ints) + sum(self.big_ints.values())
+
+    def sum(self):
+        """Returns the integer sum plus the floats summed in order (an int if there are no floats)."""
+        total = self.int_sum()
+        return total + sum(self.floats) if self.floats else total
+
+    def _first_index(self, kind: int, value) -> int:
+        """Returns the token index of the first number of a kind equal to value."""
+        if kind == _BIG:
+            return min(index for index, big in self.big_ints.items() if big == value)
+        position = (self.ints if kind == _INT else self.floats).index(value)
+        seen = -1
+        for index, token_kind in enumerate(self.kinds):
+            if token_kind == kind:
+                seen += 1
+                if seen == position:
+                    return index
+
+    def _extreme(self, pick):
+        """Returns min or max over all numbers; ties go to the first occurrence, as with a list."""
+        candidates = [(pick(values), kind) for kind, values in
+                      ((_INT, self.ints), (_FLOAT, self.floats), (_BIG, self.big_ints.values())) if values]
+        value = pick(value for value, _ in candidates)
+        kinds = [kind for candidate, kind in candidates if candidate == value]
+        if len(kinds) > 1:
+            return min(((self._first_index(kind, value), candidate) for candidate, kind in candidates
+                        if kind in kinds), key=lambda x: x[0])[1]
+        return value
+
+    def min(self):
+        """Returns the smallest number."""
+        return self._extreme(min)
+
+    def max(self):
+        """Returns the largest number."""
+        return self._extreme(max)
+
+    def first(self):
+        """Returns the first number, or None if there are none."""
+        head = self.head(1)
+        return head[0] if head else None
+
+    def counts(self) -> dict:
+        """Counts the integers, floats, positive, negative, zero and even numbers."""
+        ints, floats, bigs = self.ints, self.floats, self.big_ints.values()
+        integers = len(ints) + len(bigs)
+        odd = sum(map((1).__and__, ints)) + sum(big & 1 for big in bigs)
+        negative = sum(map((0).__gt__, ints)) + sum(map((0.0).__gt__, floats)) + sum(big < 0 for big in bigs)
+        zero = ints.count(0) + floats.count(0.0)
+        return {
+            "integers": integers,
+            "floats": len(floats),
+            "positive": len(self.kinds) - negative - zero,
+            "negative": negative,
+            "zero": zero,
+            "even": integers - odd,
+            "odd": odd,
+        }
+
+    def frequency(self) -> Counter:
+        """Counts each distinct number, in order of first occurrence."""
+        if self._frequency is None:
+            self._frequency = Counter(self.numbers())
+        return self._frequency
+
+
+@lru_cache(maxsize=4)
+def scan_numbers(text: str) -> NumberScan:
+    """Returns the shared NumberScan of a text; repeated analyses of one text scan it once."""
+    return NumberScan.from_text(text)
+
+
+def _number_scan(text) -> NumberScan:
+    return text if isinstance(text, NumberScan) else scan_numbers(text)
+
+
+def extract_numbers(text: str) -> list:
+    """Extracts all integer and float numbers from a string."""
+    try:
+        return list(_number_scan(text).numbers())
     except Exception as e:
         return []
 
 
+def format_extracted_numbers(text, limit: int = 20) -> str:
+    """Lists the numbers of a text, or the first limit of them."""
+    scan = _number_scan(text)
+    if len(scan) <= limit:
+        return f"Extracted numbers: {scan.numbers()}"
+    return f"Extracted {len(scan)} numbers. First {limit}: {scan.head(limit)}"
+
+
 def number_analysis(text: str) -> dict:
-    """Performs a detailed analysis of the numbers found in a text."""
+    """Performs a detailed analysis of the numbers found in a text (or a NumberScan)."""
     try:
-        numbers = extract_numbers(text)
-        if not numbers:
+        scan = _number_scan(text)
+        if not len(scan):
             return {"error": "No numbers found in text"}
-        total_numbers = len(numbers)
-        sum_numbers = sum(numbers)
-        avg_number = sum_numbers / total_numbers if total_numbers > 0 else 0
-        min_number = min(numbers)
-        max_number = max(numbers)
-        integers = [n for n in numbers if isinstance(n, int)]
-        floats = [n for n in numbers if isinstance(n, float)]
-        positive = [n for n in numbers if n > 0]
-        negative = [n for n in numbers if n < 0]
-        zero = [n for n in numbers if n == 0]
-        even = [n for n in integers if n % 2 == 0]
-        odd = [n for n in integers if n % 2 != 0]
+        total_numbers = len(scan)
+        sum_numbers = scan.sum()
         return {
             "total_numbers": total_numbers,
             "sum": sum_numbers,
-            "average": round(avg_number, 4),
-            "min": min_number,
-            "max": max_number,
-            "integers": len(integers),
-            "floats": len(floats),
-            "positive": len(positive),
-            "negative": len(negative),
-            "zero": len(zero),
-            "even": len(even),
-            "odd": len(odd),
-            "numbers_list": numbers
+            "average": round(sum_numbers / total_numbers, 4),
+            "min": scan.min(),
+            "max": scan.max(),
+            **scan.counts(),
+            "numbers_list": list(scan.numbers())
         }
     except Exception as e:
         return {"error": f"Number analysis failed: {str(e)}"}
@@ -286,38 +511,69 @@ def format_number_analysis(stats: dict) -> str:
     return "\n".join(output)
 
 
-def number_frequency_analysis(text: str) -> dict:
-    """Analyzes the frequency of each number in a text."""
+def number_frequency_analysis(text: str, top_k: int = 15, approximate: bool = None,
+                              capacity: int = SKETCH_CAPACITY) -> dict:
+    """Analyzes the frequency of each number in a text (or a NumberScan).
+
+    With approximate=None the exact counts are used up to
+    FREQUENCY_SKETCH_THRESHOLD numbers and a Space-Saving sketch of capacity
+    counters beyond that; see sketch_frequency_result for its output.
+    """
     try:
-        numbers = extract_numbers(text)
-        if not numbers:
+        scan = _number_scan(text)
+        if not len(scan):
             return {"error": "No numbers found in text"}
-        number_frequency = {}
-        for number in numbers:
-            if number not in number_frequency:
-                number_frequency[number] = 0
-            number_frequency[number] += 1
-        most_common = sorted(number_frequency.items(),
-                             key=lambda x: x[1], reverse=True)[:15]
+        if approximate is None:
+            approximate = len(scan) > FREQUENCY_SKETCH_THRESHOLD
+        if approximate:
+            sketch = SpaceSaving(capacity)
+            sketch.update_many(scan.iter_numbers())
+            return sketch_frequency_result(sketch, top_k)
+        number_frequency = dict(scan.frequency())
+        most_common = top_counts(number_frequency, top_k)
         return {
             "number_frequency": number_frequency,
             "most_common_numbers": most_common,
-            "unique_numbers": len(number_frequency)
+            "unique_numbers": len(number_frequency),
+            "total_numbers": len(scan)
         }
     except Exception as e:
         return {"error": f"Number frequency analysis failed: {str(e)}"}
 
 
+def sketch_frequency_result(sketch: SpaceSaving, top_k: int = 15) -> dict:
+    """Builds the number_frequency_analysis dictionary from a Space-Saving sketch.
+
+    number_frequency only holds the monitored numbers. Each count may exceed
+    the true count by its entry in "errors" (at most "max_error"), and
+    unique_numbers is None once the sketch has evicted anything.
+    """
+    top = sketch.top()
+    return {
+        "number_frequency": {item: count for item, count, _ in top},
+        "most_common_numbers": [(item, count) for item, count, _ in top[:top_k]],
+        "unique_numbers": len(sketch) if sketch.is_exact() else None,
+        "total_numbers": sketch.total,
+        "approximate": not sketch.is_exact(),
+        "errors": {item: error for item, _, error in top[:top_k]},
+        "max_error": sketch.min_count()
+    }
+
+
 def format_number_frequency(stats: dict) -> str:
     """Formats the number frequency analysis into a readable string."""
     if "error" in stats:
         return stats["error"]
     output = []
     output.append("=== NUMBER FREQUENCY ANALYSIS ===")
-    output.append(f"Unique numbers: {stats['unique_numbers']}")
+    total = stats.get("total_numbers") or sum(stats['number_frequency'].values())
+    if stats.get("approximate"):
+        output.append(f"Approximate counts of {total} numbers (each may be over by at most {stats['max_error']})")
+    else:
+        output.append(f"Unique numbers: {stats['unique_numbers']}")
     output.append("\nMost common numbers:")
     for number, count in stats['most_common_numbers']:
-        percentage = (count / sum(stats['number_frequency'].values())) * 100
+        percentage = (count / total) * 100
         output.append(f"{number}: {count} occurrences ({percentage:.2f}%)")
     return "\n".join(output)
 
@@ -326,36 +582,36 @@ def character_frequency_analysis(text: str) -> dict:
     try:
         if not text:
             return {"error": "No text provided"}
-        char_frequency = {}
-        total_chars = len(text)
-        for char in text:
-            if char not in char_frequency:
-                char_frequency[char] = 0
-            char_frequency[char] += 1
-        most_common = sorted(char_frequency.items(),
-                             key=lambda x: x[1], reverse=True)[:20]
-        letter_count = sum(c.isalpha() for c in text)
-        digit_count = sum(c.isdigit() for c in text)
-        space_count = sum(c.isspace() for c in text)
-        punctuation_count = sum(c in string.punctuation for c in text)
-        other_count = total_chars - \
-            (letter_count + digit_count + space_count + punctuation_count)
-        return {
-            "total_characters": total_chars,
-            "unique_characters": len(char_frequency),
-            "character_frequency": char_frequency,
-            "most_common_characters": most_common,
-            "letter_count": letter_count,
-            "digit_count": digit_count,
-            "space_count": space_count,
-            "punctuation_count": punctuation_count,
-            "other_count": other_count,
-            "entropy": calculate_entropy(text)
-        }
+        return character_frequency_from_profile(text_profile(text))
     except Exception as e:
         return {"error": f"Character frequency analysis failed: {str(e)}"}
 
 
+def character_frequency_from_profile(profile: dict) -> dict:
+    """Builds the character_frequency_analysis dictionary from a text profile."""
+    char_frequency = profile["character_frequency"]
+    total_chars = profile["total_characters"]
+    most_common = top_counts(char_frequency, 20)
+    letter_count = profile["letter_count"]
+    digit_count = profile["digit_count"]
+    space_count = profile["space_count"]
+    punctuation_count = profile["punctuation_count"]
+    other_count = total_chars - \
+        (letter_count + digit_count + space_count + punctuation_count)
+    return {
+        "total_characters": total_chars,
+        "unique_characters": profile["unique_characters"],
+        "character_frequency": char_frequency,
+        "most_common_characters": most_common,
+        "letter_count": letter_count,
+        "digit_count": digit_count,
+        "space_count": space_count,
+        "punctuation_count": punctuation_count,
+        "other_count": other_count,
+        "entropy": profile["entropy"]
+    }
+
+
 def format_character_frequency(stats: dict) -> str:
     if "error" in stats:
         return stats["error"]
@@ -400,44 +656,98 @@ def format_entropy_only(stats: dict) -> str:
     return "\n".join(output)
 
 
-def calculate_basic_statistics(text: str) -> dict:
-    try:
-        numbers = extract_numbers(text)
-        if not numbers:
-            return {"error": "No numbers found for statistical analysis"}
+# Integers of this magnitude or more are not exact in float64.
+_FLOAT_EXACT_LIMIT = 1 << 53
 
-        n = len(numbers)
-        mean = sum(numbers) / n
 
-        sorted_numbers = sorted(numbers)
-        if n % 2 == 0:
-            mid1 = sorted_numbers[n//2 - 1]
-            mid2 = sorted_numbers[n//2]
-            median = (mid1 + mid2) / 2
-        else:
-            median = sorted_numbers[n//2]
+def _ordered_array(scan: NumberScan):
+    """Returns the numbers of a scan without big integers as an array in text order, and their kinds.
 
-        frequency = {}
-        for num in numbers:
-            frequency[num] = frequency.get(num, 0) + 1
-        max_freq = max(frequency.values())
-        modes = [num for num, freq in frequency.items() if freq == max_freq]
+    Integers alone stay int64, so they are compared exactly; mixed with
+    floats they share a float64 array, which is returned only while every
+    integer is exact in float64 (None otherwise).
+    """
+    kinds = np.frombuffer(bytes(scan.kinds), dtype=np.uint8)
+    ints = np.frombuffer(scan.ints, dtype=np.int64)
+    if not scan.floats:
+        return ints, kinds
+    if len(ints) and max(-int(ints.min()), int(ints.max())) >= _FLOAT_EXACT_LIMIT:
+        return None, kinds
+    values = np.empty(len(kinds))
+    values[kinds == _INT] = ints
+    values[kinds == _FLOAT] = np.frombuffer(scan.floats, dtype=np.float64)
+    return values, kinds
 
-        variance = sum((x - mean) ** 2 for x in numbers) / n
-        std_dev = variance ** 0.5
+
+def _array_median_and_modes(values, kinds) -> tuple:
+    """Computes the median and the modes of an ordered array, restoring int or float types."""
+    def typed(i):
+        return int(values[i]) if kinds[i] == _INT else float(values[i])
+
+    n = len(values)
+    if n % 2:
+        middle = typed(np.argpartition(values, n // 2)[n // 2])
+    else:
+        low, high = np.partition(values, [n // 2 - 1, n // 2])[n // 2 - 1:n // 2 + 1]
+        middle = (low.item() + high.item()) / 2
+    _, first, counts = np.unique(values, return_index=True, return_counts=True)
+    modes = [typed(i) for i in np.sort(first[counts == counts.max()])]
+    return middle, modes
+
+
+def calculate_basic_statistics(text: str, percentile_points=DEFAULT_PERCENTILES, bins: int = HISTOGRAM_BINS) -> dict:
+    """Computes the statistics of the numbers in a text (or a NumberScan).
+
+    The median is found by selection unless several percentiles need a sort
+    anyway, sums are compensated, and large inputs without big integers go
+    through NumPy.
+    """
+    try:
+        scan = _number_scan(text)
+        if not len(scan):
+            return {"error": "No numbers found for statistical analysis"}
+
+        n = len(scan)
+        mean = (scan.int_sum() + math.fsum(scan.floats)) / n
+        is_sorted = False
+        values = None
+        if np is not None and n >= NUMPY_STATS_THRESHOLD and not scan.big_ints:
+            values, kinds = _ordered_array(scan)
+        if values is not None:
+            middle, modes = _array_median_and_modes(values, kinds)
+        else:
+            values = scan.numbers()
+            # Selection beats sorting for the median alone; with several
+            # percentiles one sort serves them all.
+            if len(percentile_points) > 2:
+                is_sorted = True
+                values = sorted(values)
+            middle = median(values, is_sorted)
+            frequency = scan.frequency()
+            max_freq = max(frequency.values())
+            modes = [num for num, freq in frequency.items() if freq == max_freq]
+        _, variance = mean_variance(values, mean)
 
         return {
             "count": n,
             "mean": mean,
-            "median": median,
+            "median": middle,
             "modes": modes,
             "variance": variance,
-            "standard_deviation": std_dev,
+            "standard_deviation": variance ** 0.5,
+            "min": scan.min(),
+            "max": scan.max(),
+            "percentiles": percentiles(values, percentile_points, is_sorted),
+            "histogram": histogram(values, bins),
         }
     except Exception as e:
         return {"error": f"Statistics calculation failed: {e}"}
 
 
+def _format_stat(value) -> str:
+    return str(value) if isinstance(value, int) else f"{value:.4g}"
+
+
 def format_basic_statistics(stats: dict) -> str:
     if "error" in stats:
         return stats["error"]
@@ -446,37 +756,65 @@ def format_basic_statistics(stats: dict) -> str:
     output.append(f"Count: {stats['count']}")
     output.append(f"Mean: {stats['mean']:.4f}")
     output.append(f"Median: {stats['median']}")
-    output.append(f"Mode(s): {', '.join(map(str, stats['modes']))}")
+    if "modes" in stats:
+        output.append(f"Mode(s): {', '.join(map(str, stats['modes']))}")
     output.append(f"Variance: {stats['variance']:.4f}")
     output.append(f"Standard Deviation: {stats['standard_deviation']:.4f}")
+    if "min" in stats:
+        output.append(f"Minimum: {stats['min']}")
+        output.append(f"Maximum: {stats['max']}")
+    if stats.get("percentiles"):
+        output.append("Percentiles: " + ", ".join(f"P{q}: {_format_stat(v)}" for q, v in stats["percentiles"].items()))
+    if stats.get("histogram"):
+        output.append("\n=== HISTOGRAM ===")
+        peak = max(count for _, _, count in stats["histogram"]) or 1
+        for low, high, count in stats["histogram"]:
+            output.append(f"[{_format_stat(low)}, {_format_stat(high)}]: {count} {'#' * round(20 * count / peak)}")
     return "\n".join(output)
 
 
-def _is_triangular(n):
-    """Checks if a number is a triangular number."""
-    if n < 0: return False
-    if n == 0: return True
-    val = 8 * n + 1
-    sqrt_val = int(val**0.5)
-    return sqrt_val * sqrt_val == val
+# Factorization budget of the divisor-based properties, which stay unknown when it runs out.
+SPECIAL_PROPERTIES_FACTOR_BUDGET = 1.0
+# Longer divisor lists are summarized by their count.
+MAX_LISTED_DIVISORS = 100
+
+
+def _divisor_properties(num: int) -> dict:
+    if num < 1:
+        return {"Is Perfect": False, "Is Abundant": False, "Is Deficient": False, "Proper Divisors": "None"}
+    factors, cofactor = factorize(num, SPECIAL_PROPERTIES_FACTOR_BUDGET)
+    if cofactor != 1:
+        unknown = f"Unknown (factorization timed out after {SPECIAL_PROPERTIES_FACTOR_BUDGET:g}s)"
+        return {"Is Perfect": unknown, "Is Abundant": unknown, "Is Deficient": unknown, "Proper Divisors": unknown}
+    div_sum = divisor_sum(factors) - num
+    divisor_count = math.prod(e + 1 for e in factors.values()) - 1
+    if not divisor_count:
+        listed = "None"
+    elif divisor_count <= MAX_LISTED_DIVISORS:
+        listed = str(divisors_from_factors(factors)[:-1])
+    else:
+        listed = f"{divisor_count} divisors"
+    return {
+        "Is Perfect": div_sum == num,
+        "Is Abundant": div_sum > num,
+        "Is Deficient": div_sum < num,
+        "Proper Divisors": listed,
+    }
 
 def analyze_special_properties(text: str) -> dict:
     try:
-        numbers = extract_numbers(text)
-        if not numbers or not isinstance(numbers[0], int):
+        num = _number_scan(text).first()
+        if not isinstance(num, int):
             return {"error": "No valid integer found at the start of the text."}
 
-        num = numbers[0]
-        divisors = get_proper_divisors(num)
-        div_sum = sum(divisors)
-        is_perf = (div_sum == num and num != 0)
+        divisors = _divisor_properties(num)
 
         return {
             f"Analysis for {num}": {
-                "Is Prime": is_prime_check(str(num)) == "True",
-                "Is Perfect": is_perf,
-                "Is Abundant": not is_perf and div_sum > num,
-                "Is Deficient": not is_perf and div_sum < num,
+                "Is Prime": is_prime(num),
+                "Is Perfect": divisors["Is Perfect"],
+                "Is Abundant": divisors["Is Abundant"],
+                "Is Deficient": divisors["Is Deficient"],
                 "Is Happy": is_happy(num),
                 "Is Palindromic": is_palindrome(num),
                 "Is Perfect Square": is_perfect_square(str(num)) == "True",
@@ -486,8 +824,8 @@ def analyze_special_properties(text: str) -> dict:
                 "Has Decreasing Digits": is_decreasing(num),
                 "Is Fibonacci": is_fibonacci(num),
                 "Is Narcissistic (Armstrong)": is_armstrong(num),
-                "Is Triangular": _is_triangular(num),
-                "Proper Divisors": str(divisors) if divisors else "None"
+                "Is Triangular": is_triangular(num),
+                "Proper Divisors": divisors["Proper Divisors"]
             }
         }
     except Exception as e:
@@ -507,22 +845,175 @@ def format_special_properties(stats: dict) -> str:
     return "\n".join(output)
 
 
-def detect_repeated_sequences(text: str, min_length: int = 2, max_length: int = 10) -> dict:
+def _suffix_array(text: str, limit: int) -> tuple[list, list]:
+    """Sorts the suffixes of text by their first limit characters with prefix doubling.
+
+    Returns the suffix array and the rank array of every doubling level; level j
+    ranks the first 2**j characters, so equal ranks mean a common prefix.
+    """
+    n = len(text)
+    alphabet = {c: r for r, c in enumerate(sorted(set(text)), 1)}
+    rank = [alphabet[c] for c in text]
+    sa = sorted(range(n), key=rank.__getitem__)
+    levels = [rank]
+    span, distinct = 1, len(alphabet)
+    while span < limit and distinct < n:
+        base = distinct + 1
+        keys = [a * base + b for a, b in zip(rank, rank[span:] + [0] * span)]
+        sa.sort(key=keys.__getitem__)
+        rank = [0] * n
+        distinct, previous = 0, None
+        for i in sa:
+            if keys[i] != previous:
+                distinct += 1
+                previous = keys[i]
+            rank[i] = distinct
+        levels.append(rank)
+        span *= 2
+    return sa, levels
+
+
+def _lcp_array(sa: list, levels: list, limit: int) -> list:
+    """Returns lcp[i], the common prefix length of suffixes sa[i - 1] and sa[i], capped at limit."""
+    # Rank 0 past the end never equals a real rank, so no bounds checks are needed.
+    steps = [(1 << j, levels[j] + [0]) for j in reversed(range(len(levels)))]
+    lcp = [0] * len(sa)
+    for i in range(1, len(sa)):
+        a, b = sa[i - 1], sa[i]
+        length = 0
+        for step, rank in steps:
+            if rank[a + length] == rank[b + length]:
+                length += step
+        lcp[i] = min(length, limit)
+    return lcp
+
+
+def _lcp_intervals(lcp: list):
+    """Yields (depth, left, right, parent_depth) for every internal node of the suffix tree.
+
+    The suffixes sa[left..right] share exactly depth characters, so every
+    substring of length parent_depth + 1 to depth has the same occurrences.
+    """
+    stack = [(0, 0)]
+    for i in range(1, len(lcp) + 1):
+        current = lcp[i] if i < len(lcp) else 0
+        left = i - 1
+        while current < stack[-1][0]:
+            depth, left = stack.pop()
+            yield depth, left, i - 1, max(current, stack[-1][0])
+        if current > stack[-1][0]:
+            stack.append((current, left))
+
+
+def _non_overlapping(starts: list, length: int) -> list:
+    """Returns the occurrences str.count would count: greedy, left to right, without overlap."""
+    taken, free = [], 0
+    for start in starts:
+        if start >= free:
+            taken.append(start)
+            free = start + length
+    return taken
+
+
+def _count_groups(starts: list, shortest: int, longest: int) -> list:
+    """Splits the lengths shortest..longest into (count, low, high) runs with equal non-overlapping counts >= 2."""
+    gap = min(b - a for a, b in zip(starts, starts[1:]))
+    if longest <= gap:
+        return [(len(starts), shortest, longest)]
+    groups = []
+    low = shortest
+    while low <= longest:
+        count = len(_non_overlapping(starts, low))
+        if count < 2:
+            break
+        # The count never grows with the length, so binary search the end of the run.
+        lo, hi = low, longest
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if len(_non_overlapping(starts, mid)) == count:
+                lo = mid
+            else:
+                hi = mid - 1
+        groups.append((count, low, lo))
+        low = lo + 1
+    return groups
+
+
+def _group_keys(groups: list, first: int, node: int, sort_by: str):
+    """Yields the ranking keys of one suffix tree node from best to worst."""
+    for count, low, high in groups:
+        for length in range(high, low - 1, -1):
+            yield (count, length, -first, node) if sort_by == "count" else (length, count, -first, node)
+
+
+def detect_repeated_sequences(text: str, min_length: int = 2, max_length: int = 10, top_k: int = 15,
+                              sort_by: str = "count", positions: bool = False) -> dict:
+    """Finds the substrings that occur at least twice without overlapping, using a suffix array.
+
+    :param text: The text to search.
+    :param min_length: The shortest sequence length.
+    :param max_length: The longest sequence length, or None for no limit.
+    :param top_k: The number of sequences returned, or None for all of them.
+    :param sort_by: "count" (most frequent, then longest) or "length" (longest, then most frequent);
+                    ties go to the sequence that occurs first.
+    :param positions: Whether to add a "positions" dictionary with the start offset of every
+                      counted occurrence, e.g. for Kasiski spacing analysis.
+    :return: {"repeated_sequences": [(sequence, count), ...]} with counts as given by str.count.
+    """
     try:
-        sequences = {}
+        if sort_by not in ("count", "length"):
+            return {"error": f"Unknown sort order: {sort_by}"}
         text_length = len(text)
-        if text_length < min_length * 2:
-            return {"repeated_sequences": []}
-        for seq_length in range(min_length, min(max_length, text_length // 2) + 1):
-            for i in range(text_length - seq_length + 1):
-                sequence = text[i:i + seq_length]
-                if sequence.strip() == "":
-                    continue
-                count = text.count(sequence)
-                if count > 1 and sequence not in sequences:
-                    sequences[sequence] = count
-        sorted_sequences = sorted(sequences.items(),
-                                  key=lambda x: (-x[1], -len(x[0])))
-        return {"repeated_sequences": sorted_sequences[:15]}
+        limit = text_length // 2 if max_length is None else min(max_length, text_length // 2)
+        found = []
+        occurrences = {}
+        if text_length >= min_length * 2 and limit >= max(min_length, 1):
+            sa, levels = _suffix_array(text, limit)
+            lcp = _lcp_array(sa, levels, limit)
+            nodes = []
+            for depth, left, right, parent in _lcp_intervals(lcp):
+                shortest = max(parent + 1, min_length)
+                if shortest <= depth:
+                    # An upper bound of the node's best key, so top_k can stop early.
+                    bound = min(right - left + 1, text_length // shortest) if sort_by == "count" else depth
+                    nodes.append((bound, shortest, depth, left, right))
+            nodes.sort(key=lambda node: node[0], reverse=True)
+
+            # Keys are ordered so that larger is better; best[0] is the worst key kept.
+            best = []
+            for node, (bound, shortest, longest, left, right) in enumerate(nodes):
+                if top_k is not None and len(best) >= top_k and bound < best[0][0]:
+                    break
+                starts = sorted(sa[left:right + 1])
+                first = starts[0]
+                if text[first].isspace():
+                    segment = text[first:first + longest]
+                    shortest = max(shortest, len(segment) - len(segment.lstrip()) + 1)
+                    if shortest > longest:
+                        continue
+                groups = _count_groups(starts, shortest, longest)
+                if sort_by == "length":
+                    groups.reverse()
+                occurrences[node] = starts
+                for key in _group_keys(groups, first, node, sort_by):
+                    if top_k is None:
+                        best.append(key)
+                    elif len(best) < top_k:
+                        heapq.heappush(best, key)
+                    elif key > best[0]:
+                        heapq.heapreplace(best, key)
+                    else:
+                        break
+            for key in sorted(best, reverse=True):
+                count, length = key[:2] if sort_by == "count" else key[1::-1]
+                found.append((-key[2], length, count, key[3]))
+        result = {"repeated_sequences": [(text[first:first + length], count) for first, length, count, _ in found]}
+        if positions:
+            result["positions"] = {
+                text[first:first + length]: _non_overlapping(occurrences[node], length)
+                for first, length, _, node in found
+            }
+        return result
     except Exception as e:
-        return {"error": f"Sequence detection failed: {str(e)}"}
\ No newline at end of file
+        return {"error": f"Sequence detection failed: {str(e)}"}
+
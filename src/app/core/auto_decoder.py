@@ -0,0 +1,255 @@
+import heapq
+import math
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from .data import Bases_set, ENGLISH_FREQUENCIES, COMMON_ENGLISH_WORDS, REVERSE_EMOJI_MAP
+from .converters import (
+    basen_to_word, morse_to_text, braille_to_text, rot_n_decrypt, ascii_decode, emoji_to_text,
+)
+from .cipher_classifier import (
+    charset_mask, BINARY, OCTAL, HEX, BASE32, BASE64, BASE64_URL, BASE85, MORSE, BRAILLE,
+)
+from .parallel import worker_count
+
+DEFAULT_MAX_DEPTH = 6
+DEFAULT_TIME_BUDGET = 2.0
+DEFAULT_MAX_NODES = 5000
+# A result scoring at least this is taken as the plaintext and ends the search.
+SOLVED_SCORE = 0.65
+# Outputs with fewer printable characters than this are dead branches.
+MIN_PRINTABLE = 0.9
+# Only the best few of the 25 ROT shifts of a node are kept.
+ROT_CANDIDATES = 3
+# Base36/58/62 decoding is quadratic in the input length.
+BIG_BASE_MAX_LENGTH = 4096
+
+_LOG_FREQUENCIES = {letter: math.log2(p) for letter, p in ENGLISH_FREQUENCIES.items()}
+# Average log2-probability per letter of English text and of uniformly random letters.
+_ENGLISH_LOG_LIKELIHOOD = sum(p * _LOG_FREQUENCIES[letter] for letter, p in ENGLISH_FREQUENCIES.items())
+_RANDOM_LOG_LIKELIHOOD = sum(_LOG_FREQUENCIES.values()) / len(_LOG_FREQUENCIES)
+_WORD = re.compile(r"[A-Za-z]+")
+_DECIMAL_CODES = re.compile(r"[0-9\s]+")
+_BASE36 = re.compile(r"[0-9A-Za-z]+")
+_BASE58 = re.compile(r"[1-9A-HJ-NP-Za-km-z]+")
+
+
+def _clamp(value: float) -> float:
+    return min(max(value, 0.0), 1.0)
+
+
+def printable_ratio(text: str) -> float:
+    """Returns the fraction of characters that are printable or common whitespace."""
+    if not text:
+        return 0.0
+    return sum(c.isprintable() or c in "\n\r\t" for c in text) / len(text)
+
+
+def plaintext_score(text: str) -> float:
+    """Scores how much text looks like English plaintext, from 0 to 1.
+
+    Combines the printable ratio with the English log-likelihood of the
+    letters, the share of letters, the share of them in common English words and how
+    close the entropy is to that of English (about 4.1 bits per character).
+    """
+    printable = printable_ratio(text)
+    if printable < MIN_PRINTABLE:
+        return 0.0
+    counts = Counter(text)
+    letters = {c.upper(): n for c, n in counts.items() if c.isascii() and c.isalpha()}
+    letter_total = sum(letters.values())
+    non_space = len(text) - sum(n for c, n in counts.items() if c.isspace())
+    if not letter_total or not non_space:
+        return 0.0
+    log_likelihood = sum(n * _LOG_FREQUENCIES[c] for c, n in letters.items()) / letter_total
+    likelihood = _clamp((log_likelihood - _RANDOM_LOG_LIKELIHOOD) / (_ENGLISH_LOG_LIKELIHOOD - _RANDOM_LOG_LIKELIHOOD))
+    # Letter frequencies are meaningless for a handful of letters.
+    likelihood *= min(1.0, letter_total / 20)
+    letter_share = letter_total / non_space
+    words = [w.lower() for w in _WORD.findall(text)]
+    word_share = sum(len(w) for w in words if w in COMMON_ENGLISH_WORDS) / letter_total
+    entropy = -sum(n / len(text) * math.log2(n / len(text)) for n in counts.values())
+    entropy_fit = _clamp(1 - abs(entropy - 4.1) / 2.5)
+    return printable * (0.35 * likelihood * letter_share + 0.35 * word_share + 0.15 * letter_share + 0.15 * entropy_fit)
+
+
+def _base_decoder(base: int):
+    return lambda text: basen_to_word(text, base)
+
+
+def _rot_decoder(n: int):
+    return lambda text: rot_n_decrypt(text, n)
+
+
+def _accepts(name: str, text: str, mask: int) -> bool:
+    """Returns whether the charset of text fits the decoder, so hopeless decodes are never tried."""
+    if name == "Base2":
+        return bool(mask & BINARY)
+    if name == "Base8":
+        return bool(mask & OCTAL)
+    if name in ("Base10", "ASCII"):
+        return bool(_DECIMAL_CODES.fullmatch(text))
+    if name == "Base16":
+        return bool(mask & HEX)
+    if name == "Base32":
+        return bool(charset_mask(set(text.upper())) & BASE32)
+    if name == "Base64":
+        return bool(mask & BASE64)
+    if name == "Base64 URL":
+        return bool(mask & BASE64_URL)
+    if name == "Base85":
+        return bool(mask & BASE85)
+    if name in ("Base36", "Base62"):
+        return len(text) <= BIG_BASE_MAX_LENGTH and bool(_BASE36.fullmatch(text))
+    if name == "Base58":
+        return len(text) <= BIG_BASE_MAX_LENGTH and bool(_BASE58.fullmatch(text))
+    if name == "Morse":
+        return bool(mask & MORSE) and any(c in ".-" for c in text)
+    if name == "Braille":
+        return bool(mask & BRAILLE)
+    if name == "Emoji":
+        return any(c in REVERSE_EMOJI_MAP for c in text)
+    return True
+
+
+DECODERS = [(f"Base{'64 URL' if base == -1 else base}", _base_decoder(base)) for base in sorted(Bases_set, key=lambda b: (b < 0, b))]
+DECODERS += [
+    ("ASCII", ascii_decode),
+    ("Morse", morse_to_text),
+    ("Braille", braille_to_text),
+    ("Emoji", emoji_to_text),
+]
+ROT_DECODERS = [(f"ROT-{n}", _rot_decoder(n)) for n in range(1, 26)]
+
+
+@lru_cache(maxsize=4096)
+def _expand(text: str, after_rot: bool) -> tuple:
+    """Applies every applicable decoder to text and returns the surviving (name, output, score) steps.
+
+    A step survives when it succeeds, changes the text, does not make it
+    longer and leaves it mostly printable; decoders only ever shrink their
+    input or keep its length, which with the no-double-ROT rule bounds every chain.
+    """
+    stripped = text.strip()
+    mask = charset_mask(set(stripped))
+    steps = []
+    for name, decoder in DECODERS:
+        if not _accepts(name, stripped, mask):
+            continue
+        try:
+            output = decoder(stripped)
+        except Exception:
+            continue
+        if not isinstance(output, str) or not output.strip() or output == text or len(output) > len(text):
+            continue
+        if name in ("Morse", "Braille") and output.count("?") > len(output) // 4:
+            continue
+        if printable_ratio(output) < MIN_PRINTABLE:
+            continue
+        steps.append((name, output, plaintext_score(output)))
+    if not after_rot and any(c.isascii() and c.isalpha() for c in stripped):
+        rotations = [(name, output, plaintext_score(output)) for name, output in
+                     ((name, decoder(text)) for name, decoder in ROT_DECODERS)]
+        steps.extend(heapq.nlargest(ROT_CANDIDATES, rotations, key=lambda x: x[2]))
+    return tuple(steps)
+
+
+def _expand_node(node: tuple) -> tuple:
+    text, after_rot = node
+    return _expand(text, after_rot)
+
+
+def auto_decode(text: str, max_depth: int = DEFAULT_MAX_DEPTH, time_budget: float = DEFAULT_TIME_BUDGET,
+                max_nodes: int = DEFAULT_MAX_NODES, top_k: int = 5, max_workers: int = 1) -> dict:
+    """Searches chains of decoders for the most plaintext-like result.
+
+    A best-first search expands the most promising text first, where every
+    candidate is scored with plaintext_score(). Texts already reached by a
+    shorter or equal chain are not expanded again, and the search stops at
+    the first result scoring SOLVED_SCORE or when a budget runs out.
+
+    :param text: The encoded text.
+    :param max_depth: The longest decoder chain explored.
+    :param time_budget: The wall-clock budget in seconds.
+    :param max_nodes: The maximum number of texts expanded.
+    :param top_k: The number of results returned.
+    :param max_workers: Worker processes that expand frontier texts in parallel (1 searches in this process).
+    :return: {"results": [{"chain", "output", "score"}], "explored", "elapsed", "solved", "exhausted"},
+             or {"error": ...}.
+    """
+    text = text.strip() if text else ""
+    if not text:
+        return {"error": "Input is empty."}
+    start = time.perf_counter()
+    deadline = start + time_budget
+    workers = worker_count(max_workers)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    seen = {text: 0}
+    frontier = [(-plaintext_score(text), 0, text, ())]
+    results = []
+    explored = 0
+    tick = 1
+    solved = False
+    try:
+        while frontier and not solved and explored < max_nodes and time.perf_counter() < deadline:
+            batch = [heapq.heappop(frontier) for _ in range(min(len(frontier), workers))]
+            nodes = [(node_text, bool(chain) and chain[-1].startswith("ROT")) for _, _, node_text, chain in batch]
+            if executor is None:
+                expansions = map(_expand_node, nodes)
+            else:
+                expansions = executor.map(_expand_node, nodes)
+            for (_, _, _, chain), steps in zip(batch, expansions):
+                explored += 1
+                for name, output, score in steps:
+                    depth = len(chain) + 1
+                    if seen.get(output, depth + 1) <= depth:
+                        continue
+                    seen[output] = depth
+                    result = (score, (*chain, name), output)
+                    results.append(result)
+                    if score >= SOLVED_SCORE:
+                        solved = True
+                    if depth < max_depth:
+                        # Shorter chains win ties, so the search favours peeling fewer layers.
+                        heapq.heappush(frontier, (-score + depth * 1e-3, tick, output, result[1]))
+                        tick += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    best = heapq.nlargest(top_k, results, key=lambda x: (x[0], -len(x[1])))
+    return {
+        "results": [{"chain": list(chain), "output": output, "score": score} for score, chain, output in best],
+        "explored": explored,
+        "elapsed": time.perf_counter() - start,
+        "solved": solved,
+        "exhausted": not frontier,
+    }
+
+
+def format_auto_decode(result: dict) -> str:
+    """Formats an auto_decode() result into a readable string."""
+    if "error" in result:
+        return result["error"]
+    output = ["=== AUTO DECODE ==="]
+    output.append(f"Explored {result['explored']} candidates in {result['elapsed']:.2f}s")
+    if not result["results"]:
+        output.append("No decoding chain produced readable text.")
+        return "\n".join(output)
+    for i, entry in enumerate(result["results"], 1):
+        output.append("")
+        output.append(f"{i}. {' → '.join(entry['chain'])} (score {entry['score']:.2f})")
+        output.append(entry["output"])
+    return "\n".join(output)
+
+
+def decode_base_if_encoded(text: str, base: int):
+    """Returns the Base-N decoding of text when it reads more like plaintext than text itself, else None."""
+    try:
+        decoded = basen_to_word(text, base)
+    except Exception:
+        return None
+    if not decoded or printable_ratio(decoded) < MIN_PRINTABLE:
+        return None
+    return decoded if plaintext_score(decoded) >= plaintext_score(text) else None
@@ -0,0 +1,157 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import time
+import bcrypt
+from argon2 import PasswordHasher
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+from .converters import set_kdf_parameters
+from .data import KDF_PARAMETERS
+
+BENCHMARK_PASSWORD = b"correct horse battery staple"
+BENCHMARK_SALT = b"\x00" * 16
+
+
+def default_settings_path() -> str:
+    """Returns the location of the application settings file."""
+    if platform.system() == "Windows":
+        user_data_dir = os.path.join(os.getenv('APPDATA'), "AltermApp")
+    else:
+        user_data_dir = os.path.expanduser("~/.config/alterm-app")
+    return os.path.join(user_data_dir, "settings.json")
+
+
+def _median_ms(fn, samples: int) -> float:
+    """Returns the median wall time of fn() in milliseconds."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def benchmark_bcrypt(rounds: int, samples: int = 3) -> float:
+    """Measures one bcrypt hash at the given cost in milliseconds."""
+    salt = bcrypt.gensalt(rounds=rounds)
+    return _median_ms(lambda: bcrypt.hashpw(BENCHMARK_PASSWORD, salt), samples)
+
+
+def benchmark_scrypt(n: int, r: int = 8, p: int = 1, samples: int = 3) -> float:
+    """Measures one scrypt derivation at the given cost in milliseconds."""
+    return _median_ms(
+        lambda: Scrypt(salt=BENCHMARK_SALT, length=32, n=n, r=r, p=p).derive(BENCHMARK_PASSWORD),
+        samples)
+
+
+def benchmark_argon2(time_cost: int, memory_cost: int, parallelism: int, samples: int = 3) -> float:
+    """Measures one Argon2 hash at the given cost in milliseconds."""
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    return _median_ms(lambda: hasher.hash(BENCHMARK_PASSWORD), samples)
+
+
+def calibrate_bcrypt(target_ms: float, samples: int = 3) -> dict:
+    """Finds the highest bcrypt cost whose hash time stays within target_ms.
+
+    Each extra round doubles the work, so the search stops at the first cost
+    that overshoots the target.
+    """
+    rounds = 4
+    while rounds < 31 and benchmark_bcrypt(rounds + 1, samples) <= target_ms:
+        rounds += 1
+    return {"rounds": rounds}
+
+
+def calibrate_scrypt(target_ms: float, max_memory: int, r: int = 8, p: int = 1, samples: int = 3) -> dict:
+    """Finds the highest power-of-two scrypt N within target_ms and max_memory bytes.
+
+    scrypt needs about 128 * r * N bytes, which bounds N before timing starts.
+    """
+    n = 2**10
+    while 128 * r * n * 2 <= max_memory and benchmark_scrypt(n * 2, r, p, samples) <= target_ms:
+        n *= 2
+    return {"n": n, "r": r, "p": p}
+
+
+def calibrate_argon2(target_ms: float, max_memory: int, parallelism: int = None, samples: int = 3) -> dict:
+    """Finds Argon2 parameters using max_memory bytes and as many passes as target_ms allows.
+
+    Memory hardness is preferred over extra passes: the memory cost is fixed
+    at the budget and halved only if a single pass is already too slow.
+    """
+    parallelism = parallelism or min(os.cpu_count() or 1, 4)
+    memory_cost = max(8 * parallelism, max_memory // 1024)
+    while memory_cost > 8 * parallelism and benchmark_argon2(1, memory_cost, parallelism, samples) > target_ms:
+        memory_cost = max(8 * parallelism, memory_cost // 2)
+    time_cost = 1
+    while time_cost < 100 and benchmark_argon2(time_cost + 1, memory_cost, parallelism, samples) <= target_ms:
+        time_cost += 1
+    return {"time_cost": time_cost, "memory_cost": memory_cost, "parallelism": parallelism}
+
+
+def calibrate(target_ms: float = 250, max_memory: int = 64 * 1024 * 1024,
+              algorithms=("bcrypt", "scrypt", "argon2"), samples: int = 3) -> dict:
+    """Benchmarks each KDF on this machine and returns parameters in the KDF_PARAMETERS layout.
+
+    :param target_ms: The latency one hash may take, in milliseconds.
+    :param max_memory: The memory one hash may use, in bytes.
+    :param algorithms: The KDFs to calibrate; "derive_key" reuses the scrypt search.
+    :param samples: How many timings to take per candidate (the median is used).
+    :return: A dictionary of calibrated parameters per algorithm.
+    :raises ValueError: If an algorithm is unknown or the limits are not positive.
+    """
+    if target_ms <= 0 or max_memory <= 0:
+        raise ValueError("The target latency and memory must be positive")
+    result = {}
+    for name in algorithms:
+        if name == "bcrypt":
+            result[name] = calibrate_bcrypt(target_ms, samples)
+        elif name in ("scrypt", "derive_key"):
+            result[name] = result.get("scrypt") or result.get("derive_key") or \
+                calibrate_scrypt(target_ms, max_memory, samples=samples)
+        elif name == "argon2":
+            result[name] = calibrate_argon2(target_ms, max_memory, samples=samples)
+        else:
+            raise ValueError(f"Unknown KDF: {name}")
+    return result
+
+
+def save_kdf_parameters(parameters: dict, settings_path: str = None) -> None:
+    """Merges calibrated parameters into the "kdf_parameters" entry of the settings file."""
+    settings_path = settings_path or default_settings_path()
+    try:
+        with open(settings_path, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        settings = {}
+    stored = settings.get("kdf_parameters", {})
+    stored.update(parameters)
+    settings["kdf_parameters"] = stored
+    os.makedirs(os.path.dirname(os.path.abspath(settings_path)), exist_ok=True)
+    with open(settings_path, 'w', encoding='utf-8') as f:
+        json.dump(settings, f, indent=4)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate bcrypt, scrypt and Argon2 cost parameters.")
+    parser.add_argument("--target-ms", type=float, default=250, help="target latency per hash")
+    parser.add_argument("--max-memory-mib", type=int, default=64, help="memory limit per hash")
+    parser.add_argument("--samples", type=int, default=3, help="timings per candidate")
+    parser.add_argument("--algorithms", nargs="+", default=["bcrypt", "scrypt", "argon2"],
+                        choices=sorted(KDF_PARAMETERS),
+                        help="KDFs to calibrate; derive_key only affects new ciphertexts")
+    parser.add_argument("--write", action="store_true", help="save the result in the settings file")
+    parser.add_argument("--settings", help="settings file to update")
+    args = parser.parse_args(argv)
+
+    parameters = calibrate(args.target_ms, args.max_memory_mib * 1024 * 1024, args.algorithms, args.samples)
+    set_kdf_parameters(parameters)
+    print(json.dumps(parameters, indent=4))
+    if args.write:
+        save_kdf_parameters(parameters, args.settings)
+
+
+if __name__ == "__main__":
+    main()
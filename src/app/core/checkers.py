@@ -1,28 +1,146 @@
 from .data import (
     ERROR_MESSAGES, LANGUAGE_PATTERNS
 )
+import bisect
+import functools
 import math
+import random
 import re
 import time
 import json
 import xml.etree.ElementTree as ET
 from html.parser import HTMLParser
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _small_primes(limit: int) -> tuple:
+    """Returns the primes below limit with a sieve of Eratosthenes."""
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return tuple(i for i in range(limit) if sieve[i])
+
+
+SMALL_PRIME_LIMIT = 1000
+SMALL_PRIMES = _small_primes(SMALL_PRIME_LIMIT)
+_SMALL_PRIMORIAL = math.prod(SMALL_PRIMES)
+# (bound, bases): Miller-Rabin with these bases is exact below the bound (Jaeschke, 1993;
+# Sinclair's seven bases for 64-bit integers; Sorenson and Webster, 2015).
+_MILLER_RABIN_BASES = (
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (1 << 64, (2, 325, 9375, 28178, 450775, 9780504, 1795265022)),
+    (318665857834031151167461, SMALL_PRIMES[:12]),
+)
+MILLER_RABIN_LIMIT = _MILLER_RABIN_BASES[-1][0]
+
+
+def _strong_probable_prime(n: int, a: int) -> bool:
+    """Runs one Miller-Rabin round: whether odd n is a strong probable prime to base a."""
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Returns the Jacobi symbol (a/n) for odd positive n."""
+    a %= n
+    result = 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas_probable_prime(n: int) -> bool:
+    """Runs the strong Lucas test with Selfridge's parameters on odd n that is not a perfect square."""
+    D = 5
+    while True:
+        jacobi = _jacobi(D, n)
+        if jacobi == -1:
+            break
+        if jacobi == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+    d, s = n + 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    # U_k, V_k and Q^k for k = 1, doubled (and incremented) along the bits of d.
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = P * U + V, D * U + P * V
+            U = (U + n if U & 1 else U) // 2 % n
+            V = (V + n if V & 1 else V) // 2 % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def is_prime(n: int) -> bool:
+    """Checks whether an integer is prime.
+
+    Numbers below SMALL_PRIME_LIMIT squared are settled by trial division with
+    the precomputed small primes, numbers below MILLER_RABIN_LIMIT (all 64-bit
+    integers included) by deterministic Miller-Rabin, and larger ones by the
+    Baillie-PSW test, for which no counterexample is known.
+    """
+    if n < 2:
+        return False
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT:
+        for p in SMALL_PRIMES:
+            if p * p > n:
+                return True
+            if n % p == 0:
+                return n == p
+        return True
+    if math.gcd(n, _SMALL_PRIMORIAL) != 1:
+        return False
+    if n < MILLER_RABIN_LIMIT:
+        bases = next(bases for bound, bases in _MILLER_RABIN_BASES if n < bound)
+        return all(_strong_probable_prime(n, a) for a in bases)
+    if not _strong_probable_prime(n, 2):
+        return False
+    root = math.isqrt(n)
+    return root * root != n and _strong_lucas_probable_prime(n)
 
 
 def is_prime_check(n):
     """Checks if a given number is prime."""
     try:
-        n = int(n)
-        if n < 2:
-            return "False"
-        if n == 2:
-            return "True"
-        if n % 2 == 0:
-            return "False"
-        for i in range(3, int(n**0.5) + 1, 2):
-            if n % i == 0:
-                return "False"
-        return "True"
+        return "True" if is_prime(int(n)) else "False"
     except Exception:
         return "Error: Invalid input"
 
@@ -39,21 +157,262 @@ def is_divisible(n, divisor):
         return "Error: Invalid input"
 
 
+# Pollard-Brent multiplies this many differences before taking one gcd.
+RHO_BATCH = 128
+RHO_MAX_ITERATIONS = 1 << 16
+FACTOR_TIME_BUDGET = 5.0
+# (B1, curves) stages of ECM, for factors of roughly 15, 20 and 25 digits.
+ECM_SCHEDULE = ((2000, 25), (11000, 90), (50000, 300))
+_ECM_STAGE2_STEP = 100
+
+
+class _Deadline:
+    """A monotonic time budget; None means no budget."""
+
+    def __init__(self, seconds: float = None):
+        self.end = None if seconds is None else time.monotonic() + seconds
+
+    def expired(self) -> bool:
+        return self.end is not None and time.monotonic() > self.end
+
+
+def _pollard_brent(n: int, deadline: _Deadline, rng: random.Random):
+    """Returns a non-trivial factor of the odd composite n with Brent's variant of Pollard's rho, or None.
+
+    Differences are multiplied together and the gcd is taken once per
+    RHO_BATCH steps; when a batch overshoots to n, its steps are replayed one by one.
+    """
+    for _ in range(8):
+        y, c = rng.randrange(1, n), rng.randrange(1, n)
+        g = r = q = 1
+        iterations = 0
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += RHO_BATCH
+            r <<= 1
+            iterations += r
+            if g == 1 and (iterations > RHO_MAX_ITERATIONS or deadline.expired()):
+                return None
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+    return None
+
+
+def _ecm_double(x: int, z: int, a24: int, n: int) -> tuple:
+    s, d = (x + z) * (x + z) % n, (x - z) * (x - z) % n
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+def _ecm_add(p: tuple, q: tuple, diff: tuple, n: int) -> tuple:
+    u = (p[0] - p[1]) * (q[0] + q[1])
+    v = (p[0] + p[1]) * (q[0] - q[1])
+    return diff[1] * (u + v) * (u + v) % n, diff[0] * (u - v) * (u - v) % n
+
+
+def _ecm_multiply(k: int, point: tuple, a24: int, n: int) -> tuple:
+    """Returns k * point with the Montgomery ladder on x:z coordinates."""
+    low, high = point, _ecm_double(*point, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == "1":
+            low, high = _ecm_add(high, low, point, n), _ecm_double(*high, a24, n)
+        else:
+            low, high = _ecm_double(*low, a24, n), _ecm_add(high, low, point, n)
+    return low
+
+
+def _ecm_curve(n: int, b1: int, primes: tuple, rng: random.Random):
+    """Runs one curve of Lenstra's ECM (Suyama's parametrization) and returns a factor of n or None.
+
+    Stage 1 multiplies the starting point by every prime power up to b1;
+    stage 2 looks for one more prime up to 100 * b1 with the standard continuation.
+    """
+    sigma = rng.randrange(6, n - 1)
+    u, v = (sigma * sigma - 5) % n, 4 * sigma % n
+    denominator = 16 * pow(u, 3, n) * v % n
+    g = math.gcd(denominator, n)
+    if g != 1:
+        return g if g != n else None
+    a24 = pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n) % n
+    point = (pow(u, 3, n), pow(v, 3, n))
+    for p in primes:
+        if p > b1:
+            break
+        power = p
+        while power * p <= b1:
+            power *= p
+        point = _ecm_multiply(power, point, a24, n)
+    g = math.gcd(point[1], n)
+    if g != 1:
+        return g if g != n else None
+
+    step = _ECM_STAGE2_STEP
+    # multiples[d] = 2d * point, and betas[d] = X * Z of it.
+    multiples = [None, _ecm_double(*point, a24, n)]
+    multiples.append(_ecm_double(*multiples[1], a24, n))
+    for d in range(3, step + 1):
+        multiples.append(_ecm_add(multiples[d - 1], multiples[1], multiples[d - 2], n))
+    betas = [m and m[0] * m[1] % n for m in multiples]
+    start = b1 - 1 if b1 % 2 == 0 else b1
+    r_point = _ecm_multiply(start, point, a24, n)
+    t_point = _ecm_multiply(start - 2 * step, point, a24, n)
+    product = 1
+    index = bisect.bisect_right(primes, start)
+    for r in range(start, 100 * b1, 2 * step):
+        alpha = r_point[0] * r_point[1] % n
+        while index < len(primes) and primes[index] <= r + 2 * step:
+            delta = (primes[index] - r) // 2
+            m = multiples[delta]
+            product = product * ((r_point[0] - m[0]) * (r_point[1] + m[1]) - alpha + betas[delta]) % n
+            index += 1
+        r_point, t_point = _ecm_add(r_point, multiples[step], t_point, n), r_point
+    g = math.gcd(product, n)
+    return g if 1 < g < n else None
+
+
+@functools.lru_cache(maxsize=4)
+def _primes_up_to(limit: int) -> tuple:
+    return _small_primes(limit + 1)
+
+
+def _ecm(n: int, deadline: _Deadline, rng: random.Random):
+    """Returns a non-trivial factor of the composite n with ECM, or None when the schedule or budget runs out."""
+    for b1, curves in ECM_SCHEDULE:
+        primes = _primes_up_to(100 * b1)
+        for _ in range(curves):
+            if deadline.expired():
+                return None
+            factor = _ecm_curve(n, b1, primes, rng)
+            if factor:
+                return factor
+    return None
+
+
+def integer_root(n: int, k: int) -> int:
+    """Returns the integer k-th root of n >= 0 (the largest r with r ** k <= n) by Newton's method."""
+    if n < 0:
+        raise ValueError("Cannot take the integer root of a negative number")
+    if n < 2:
+        return n
+    root = 1 << -(-n.bit_length() // k)
+    while True:
+        better = ((k - 1) * root + n // root ** (k - 1)) // k
+        if better >= root:
+            return root
+        root = better
+
+
+def is_perfect_power(n: int, k: int) -> bool:
+    """Checks if n is a k-th power of an integer, exactly for integers of any size; negative n needs an odd k."""
+    if n < 0:
+        return k % 2 == 1 and is_perfect_power(-n, k)
+    return integer_root(n, k) ** k == n
+
+
+def _perfect_power(n: int):
+    """Returns (root, p) with root ** p == n for a prime exponent p, or None."""
+    for p in SMALL_PRIMES:
+        if p > n.bit_length():
+            return None
+        root = integer_root(n, p)
+        if root ** p == n:
+            return root, p
+    return None
+
+
+def factorize(n: int, time_budget: float = None, use_ecm: bool = True) -> tuple[dict, int]:
+    """Factors a positive integer into primes.
+
+    Small primes are removed by trial division with the SMALL_PRIMES table;
+    every remaining cofactor is tested with is_prime() and otherwise split
+    with Pollard-Brent rho, falling back to ECM for cofactors whose factors
+    are too large for rho.
+
+    :param n: The integer to factor (its absolute value is used).
+    :param time_budget: Seconds after which factoring stops (None for no limit).
+    :param use_ecm: Whether ECM may be used when rho gives up.
+    :return: ({prime: exponent}, cofactor), where cofactor is the product of
+             the parts that could not be split in time (1 if fully factored).
+    """
+    n = abs(n)
+    if n == 0:
+        raise ValueError("0 has no prime factorization")
+    factors = {}
+    for p in SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    deadline = _Deadline(time_budget)
+    rng = random.Random(n)
+    cofactor = 1
+    pending = [(n, 1)] if n > 1 else []
+    while pending:
+        m, multiplicity = pending.pop()
+        if is_prime(m):
+            factors[m] = factors.get(m, 0) + multiplicity
+            continue
+        power = _perfect_power(m)
+        if power:
+            pending.append((power[0], multiplicity * power[1]))
+            continue
+        factor = _pollard_brent(m, deadline, rng)
+        if factor is None and use_ecm:
+            factor = _ecm(m, deadline, rng)
+        if factor is None:
+            cofactor *= m ** multiplicity
+            continue
+        pending.append((factor, multiplicity))
+        pending.append((m // factor, multiplicity))
+    return dict(sorted(factors.items())), cofactor
+
+
+def divisors_from_factors(factors: dict) -> list:
+    """Returns the sorted divisors generated from a {prime: exponent} factorization."""
+    divisors = [1]
+    for p, exponent in factors.items():
+        powers = [p ** k for k in range(1, exponent + 1)]
+        divisors += [d * power for d in divisors for power in powers]
+    return sorted(divisors)
+
+
+def divisor_sum(factors: dict) -> int:
+    """Returns the sum of all divisors from a {prime: exponent} factorization."""
+    return math.prod((p ** (e + 1) - 1) // (p - 1) for p, e in factors.items())
+
+
+def _complete_factorization(n: int) -> dict:
+    factors, cofactor = factorize(n, FACTOR_TIME_BUDGET)
+    if cofactor != 1:
+        raise ValueError("Number is too large for prime factorization in a reasonable time.")
+    return factors
+
+
 def find_divisors(n):
     """Finds all divisors of a given integer."""
     try:
         n = int(n)
         if n == 0:
             return "All integers except 0"
-        if n < 0:
-            n = abs(n)
-        divisors = []
-        for i in range(1, int(n**0.5) + 1):
-            if n % i == 0:
-                divisors.append(i)
-                if i*i != n:
-                    divisors.append(n // i)
-        return sorted(divisors)
+        factors, cofactor = factorize(n, FACTOR_TIME_BUDGET)
+        if cofactor != 1:
+            return "Error: Number is too large for prime factorization in a reasonable time."
+        return divisors_from_factors(factors)
     except Exception:
         return "Error: Invalid input"
 
@@ -64,29 +423,11 @@ def prime_factors(n):
         n = int(n)
         if n < 2:
             return "No prime factors for numbers less than 2."
-        if n > 10**18:
-            return "Error: Number is too large for prime factorization in a reasonable time."
-
-        factors = []
-        start_time = time.time()
-
-        while n % 2 == 0:
-            factors.append(2)
-            n //= 2
-        f = 3
-        while f * f <= n:
-            if time.time() - start_time > 5:  # Timeout after 5 seconds
-                factors.append("... (timed out after 5s)")
-                return factors
-            if n % f == 0:
-                factors.append(f)
-                n //= f
-            else:
-                f += 2
-        if n > 1:
-            factors.append(n)
-
-        return factors
+        factors, cofactor = factorize(n, FACTOR_TIME_BUDGET)
+        result = [p for p, e in factors.items() for _ in range(e)]
+        if cofactor != 1:
+            result.append(f"... (timed out after {FACTOR_TIME_BUDGET:g}s)")
+        return result
     except Exception:
         return "Error: Invalid input"
 
@@ -106,9 +447,7 @@ def is_perfect_square(n):
 def is_perfect_cube(n):
     """Checks if a number is a perfect cube."""
     try:
-        n = int(n)
-        root = round(n ** (1/3))
-        return "True" if root * root * root == n else "False"
+        return "True" if is_perfect_power(int(n), 3) else "False"
     except Exception:
         return "Error: Invalid input"
 
@@ -117,12 +456,7 @@ def get_proper_divisors(n):
     """Returns a sorted list of proper divisors for a given number (excluding the number itself)."""
     if n <= 1:
         return []
-    divisors = {1}
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            divisors.add(i)
-            divisors.add(n // i)
-    return sorted(list(divisors))
+    return divisors_from_factors(_complete_factorization(n))[:-1]
 
 
 def is_palindrome(n):
@@ -132,34 +466,49 @@ def is_palindrome(n):
 
 def is_perfect(n):
     """Checks if a number is a perfect number (sum of proper divisors equals the number)."""
-    if n < 1:
+    if n <= 1:
         return False
-    divisors_sum = 1
-    for i in range(2, int(n**0.5) + 1):
-        if n % i == 0:
-            divisors_sum += i
-            if i*i != n:
-                divisors_sum += n // i
-    return divisors_sum == n and n != 1
+    return divisor_sum(_complete_factorization(n)) == 2 * n
+
+
+# k * 9**k has fewer than k digits from here on, so no longer Armstrong numbers exist.
+ARMSTRONG_MAX_DIGITS = 60
+# Digit-square sums of 0 to 999, for the happy-number check three digits at a time.
+DIGIT_SQUARES = tuple(sum(int(c) ** 2 for c in str(n)) for n in range(1000))
+
+
+def _digit_counts(digits: str) -> list:
+    return [digits.count(c) for c in "0123456789"]
 
 
 def is_armstrong(n):
     """Checks if a number is an Armstrong number (narcissistic number)."""
     if n < 0:
         return False
-    s = str(n)
-    order = len(s)
-    sum_val = sum(int(digit)**order for digit in s)
-    return n == sum_val
+    digits = str(n)
+    order = len(digits)
+    if order > ARMSTRONG_MAX_DIGITS:
+        return False
+    return n == sum(count * d ** order for d, count in enumerate(_digit_counts(digits)))
+
+
+def digit_square_sum(n: int) -> int:
+    """Returns the sum of the squares of the decimal digits of n >= 0."""
+    if n.bit_length() > 64:
+        return sum(count * d * d for d, count in enumerate(_digit_counts(str(n))))
+    total = 0
+    while n:
+        n, chunk = divmod(n, 1000)
+        total += DIGIT_SQUARES[chunk]
+    return total
 
 
 def is_happy(n):
     """Checks if a number is a 'happy number'."""
     if n <= 0: return False
-    seen = set()
-    while n != 1 and n not in seen:
-        seen.add(n)
-        n = sum(int(digit)**2 for digit in str(n))
+    # Every unhappy number ends in the cycle through 4.
+    while n != 1 and n != 4:
+        n = digit_square_sum(n)
     return n == 1
 
 
@@ -175,13 +524,103 @@ def is_decreasing(n):
     return all(s[i] >= s[i+1] for i in range(len(s) - 1))
 
 
+def _is_square(n: int) -> bool:
+    return n >= 0 and math.isqrt(n) ** 2 == n
+
+
 def is_fibonacci(n):
-    """Checks if a number is a Fibonacci number."""
+    """Checks if a number is a Fibonacci number (n >= 0 with 5n² + 4 or 5n² - 4 a perfect square)."""
     if n < 0: return False
-    a, b = 0, 1
-    while a < n:
+    return _is_square(5 * n * n + 4) or _is_square(5 * n * n - 4)
+
+
+def is_triangular(n):
+    """Checks if a number is a triangular number (n >= 0 with 8n + 1 a perfect square)."""
+    return n >= 0 and _is_square(8 * n + 1)
+
+
+BATCH_CHECKS = {
+    "square": _is_square,
+    "cube": lambda n: is_perfect_power(n, 3),
+    "triangular": is_triangular,
+    "fibonacci": is_fibonacci,
+    "armstrong": is_armstrong,
+    "happy": is_happy,
+}
+# NumPy arrays below this bound are checked with float roots, which are exact there.
+_NUMPY_EXACT_LIMIT = 1 << 50
+# Happiness of every digit-square sum of a number below _NUMPY_EXACT_LIMIT (at most 16 digits).
+_HAPPY_TABLE = bytes(is_happy(n) for n in range(81 * 16 + 1))
+
+
+def _fibonacci_below(limit: int) -> list:
+    numbers, a, b = [], 0, 1
+    while a < limit:
+        numbers.append(a)
         a, b = b, a + b
-    return a == n
+    return numbers
+
+
+def _digit_columns(values):
+    """Returns the digit counts and the digit columns (least significant first) of non-negative int64 values."""
+    lengths = np.ones_like(values)
+    digits = []
+    rest = values.copy()
+    while rest.any():
+        digits.append(rest % 10)
+        rest //= 10
+        lengths += rest > 0
+    return lengths, digits
+
+
+def _numpy_checks(values, checks) -> dict:
+    """Vectorized BATCH_CHECKS for int64 values below _NUMPY_EXACT_LIMIT in magnitude."""
+    columns = {}
+    magnitude = np.abs(values)
+    lengths, digits = _digit_columns(magnitude)
+    for name in checks:
+        if name == "square":
+            columns[name] = (values >= 0) & (np.round(np.sqrt(magnitude)).astype(np.int64) ** 2 == values)
+        elif name == "cube":
+            columns[name] = np.round(np.cbrt(values)).astype(np.int64) ** 3 == values
+        elif name == "triangular":
+            odd = 8 * magnitude + 1
+            columns[name] = (values >= 0) & (np.round(np.sqrt(odd)).astype(np.int64) ** 2 == odd)
+        elif name == "fibonacci":
+            columns[name] = np.isin(values, _fibonacci_below(_NUMPY_EXACT_LIMIT))
+        elif name == "armstrong":
+            total = sum(d ** lengths for d in digits) if digits else np.zeros_like(values)
+            columns[name] = (values >= 0) & (total == values)
+        elif name == "happy":
+            total = sum(d * d for d in digits) if digits else np.zeros_like(values)
+            columns[name] = (values > 0) & np.frombuffer(_HAPPY_TABLE, dtype=np.uint8)[total].astype(bool)
+    return columns
+
+
+def check_batch(numbers, checks=None) -> dict:
+    """Runs several of the BATCH_CHECKS over a sequence of integers.
+
+    NumPy integer arrays below 2**50 in magnitude are checked with vectorized
+    float roots and digit columns; everything else goes through the scalar
+    checkers, which are exact for integers of any size.
+
+    :param numbers: A sequence or NumPy array of integers.
+    :param checks: Names from BATCH_CHECKS (defaults to all of them).
+    :return: {name: column}, with NumPy boolean columns for NumPy input and lists of bools otherwise.
+    :raises ValueError: If a check name is unknown.
+    """
+    checks = list(BATCH_CHECKS) if checks is None else list(checks)
+    unknown = [name for name in checks if name not in BATCH_CHECKS]
+    if unknown:
+        raise ValueError(f"Unknown checks: {', '.join(unknown)}")
+    is_array = np is not None and isinstance(numbers, np.ndarray)
+    if is_array and numbers.dtype.kind in "iu" and (not numbers.size or np.abs(numbers).max() < _NUMPY_EXACT_LIMIT):
+        return _numpy_checks(numbers.astype(np.int64), checks)
+    numbers = [int(n) for n in numbers]
+    columns = {name: [bool(BATCH_CHECKS[name](n)) for n in numbers] for name in checks}
+    if is_array:
+        columns = {name: np.array(column, dtype=bool) for name, column in columns.items()}
+    return columns
 
 
 def is_binary(n):
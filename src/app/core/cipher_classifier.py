@@ -0,0 +1,293 @@
+import base64
+import binascii
+import math
+import re
+import string
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from .analyzers import entropy_from_counts
+from .parallel import worker_count
+
+# Character classes; a text belongs to a class when every character does.
+BINARY, OCTAL, HEX, BASE32, BASE64, BASE64_URL, ASCII85, BASE85, MORSE, BRAILLE, URL = (1 << i for i in range(11))
+_ALL_CLASSES = (1 << 11) - 1
+# Whitespace is ignored by every class, as line breaks and grouping are common in encoded data.
+_IGNORED = " \n\r\t"
+_STRIP = str.maketrans("", "", _IGNORED)
+
+_B64_ALPHABET = string.ascii_letters + string.digits
+_B85_ALPHABET = _B64_ALPHABET + "!#$%&()*+-;<=>?@^_`{|}~"
+_URL_ALPHABET = _B64_ALPHABET + "-._~:/?#[]@!$&'()*+,;=%"
+
+
+def _build_table() -> dict:
+    classes = [
+        (BINARY, "01"),
+        (OCTAL, "01234567"),
+        (HEX, string.hexdigits),
+        (BASE32, string.ascii_uppercase + "234567="),
+        (BASE64, _B64_ALPHABET + "+/="),
+        (BASE64_URL, _B64_ALPHABET + "-_="),
+        (ASCII85, "".join(chr(c) for c in range(33, 118)) + "z<>~"),
+        (BASE85, _B85_ALPHABET),
+        (MORSE, ".-/"),
+        (URL, _URL_ALPHABET),
+    ]
+    table = {}
+    for bit, alphabet in classes:
+        for ch in alphabet:
+            table[ch] = table.get(ch, 0) | bit
+    for ch in _IGNORED:
+        table[ch] = _ALL_CLASSES
+    return table
+
+
+_CHAR_CLASSES = _build_table()
+_PRINTABLE = bytes(b for b in range(256) if 31 < b < 127 or b in b"\t\n\r")
+_PERCENT_ENCODED = re.compile(r"(?:[^%]|%[0-9A-Fa-f]{2})*%[0-9A-Fa-f]{2}(?:[^%]|%[0-9A-Fa-f]{2})*")
+
+HEX_DIGEST_LENGTHS = {
+    8: ("CRC-32", "Adler-32"),
+    32: ("MD5", "NTLM", "MD4"),
+    40: ("SHA-1", "RIPEMD-160"),
+    56: ("SHA-224", "SHA3-224"),
+    64: ("SHA-256", "SHA3-256", "BLAKE2s", "scrypt"),
+    96: ("SHA-384", "SHA3-384"),
+    128: ("SHA-512", "SHA3-512", "BLAKE2b"),
+}
+# Digest sizes in bytes, for Base64-encoded digests.
+RAW_DIGEST_LENGTHS = {16: "MD5", 20: "SHA-1", 28: "SHA-224", 32: "SHA-256", 48: "SHA-384", 64: "SHA-512"}
+# Modular crypt formats, as produced by bcrypt_hash() and argon2_hash() among others.
+CRYPT_FORMATS = [
+    (re.compile(r"\$2[abxy]?\$(?P<cost>\d{2})\$[./A-Za-z0-9]{53}"), "bcrypt"),
+    (re.compile(r"\$(?P<variant>argon2(?:id|i|d))\$(?:v=\d+\$)?m=(?P<m>\d+),t=(?P<t>\d+),p=(?P<p>\d+)\$[A-Za-z0-9+/]+\$[A-Za-z0-9+/]+"), "Argon2"),
+    (re.compile(r"\$scrypt\$ln=(?P<ln>\d+),r=(?P<r>\d+),p=(?P<p>\d+)\$[A-Za-z0-9+/=]+\$[A-Za-z0-9+/=]+"), "scrypt"),
+    (re.compile(r"\$7\$[./A-Za-z0-9]{11,}\$[./A-Za-z0-9]{43}"), "scrypt"),
+    (re.compile(r"\$y\$[./A-Za-z0-9]+\$[./A-Za-z0-9]*\$[./A-Za-z0-9]{43}"), "yescrypt"),
+    (re.compile(r"\$6\$(?:rounds=\d+\$)?[^$]{1,16}\$[./A-Za-z0-9]{86}"), "SHA-512-crypt"),
+    (re.compile(r"\$5\$(?:rounds=\d+\$)?[^$]{1,16}\$[./A-Za-z0-9]{43}"), "SHA-256-crypt"),
+    (re.compile(r"\$1\$[^$]{1,8}\$[./A-Za-z0-9]{22}"), "MD5-crypt"),
+    (re.compile(r"\$apr1\$[^$]{1,8}\$[./A-Za-z0-9]{22}"), "Apache MD5"),
+    (re.compile(r"\$pbkdf2-(?P<prf>sha1|sha256|sha512)\$(?P<rounds>\d+)\$[./A-Za-z0-9+]+\$[./A-Za-z0-9+]+"), "PBKDF2"),
+]
+
+IC_ENGLISH = 0.067
+IC_RANDOM = 1.0 / 26.0
+BATCH_CHUNK_SIZE = 256
+
+
+def _char_class(ch: str) -> int:
+    bits = _CHAR_CLASSES.get(ch)
+    if bits is None:
+        return BRAILLE if "⠀" <= ch <= "⣿" else 0
+    return bits
+
+
+def charset_mask(chars) -> int:
+    """Returns the bitmask of the character classes every one of chars belongs to."""
+    mask = _ALL_CLASSES
+    for ch in chars:
+        mask &= _char_class(ch)
+    return mask
+
+
+def _printable_ratio(data: bytes) -> float:
+    if not data:
+        return 0.0
+    return (len(data) - len(data.translate(None, _PRINTABLE))) / len(data)
+
+
+def _valid_padding(cleaned: str, limit: int) -> bool:
+    stripped = cleaned.rstrip("=")
+    return "=" not in stripped and len(cleaned) - len(stripped) <= limit
+
+
+def _mixed_alphabet(chars) -> bool:
+    """Returns whether chars mix letter cases or include digits or symbols.
+
+    Encoded data nearly always does; ciphertext of a single case, the usual
+    input of the classical ciphers, does not.
+    """
+    upper = lower = False
+    for ch in chars:
+        if ch.isupper():
+            upper = True
+        elif ch.islower():
+            lower = True
+        elif ch not in _IGNORED:
+            return True
+    return upper and lower
+
+
+def _base64_digest(data: str, decoded: bytes):
+    """Returns the digest name when data is the canonical, padded Base64 of a digest, else None."""
+    size = len(decoded)
+    if size not in RAW_DIGEST_LENGTHS or len(data) % 4:
+        return None
+    if len(data) - len(data.rstrip("=")) != -size % 3:
+        return None
+    return RAW_DIGEST_LENGTHS[size] if _mixed_alphabet(set(data)) else None
+
+
+def _decode(decoder, data: str):
+    try:
+        return decoder(data)
+    except (binascii.Error, ValueError):
+        return None
+
+
+def identify_hash(text: str) -> dict:
+    """Identifies a hash by its prefix, length and alphabet.
+
+    :param text: A single hash, e.g. a hex digest or a modular crypt string such as "$2b$12$...".
+    :return: {"encoding": "crypt" | "hex" | "base64", "candidates": [...], "bits": ...} plus the
+             "parameters" of a crypt hash, or {"error": ...} if nothing matches.
+    """
+    text = text.strip()
+    if not text:
+        return {"error": "Input is empty."}
+    if text.startswith("$"):
+        for pattern, name in CRYPT_FORMATS:
+            match = pattern.fullmatch(text)
+            if match:
+                parameters = {k: v for k, v in match.groupdict().items() if v is not None}
+                return {"encoding": "crypt", "candidates": [name], "parameters": parameters}
+        return {"error": "Unknown modular crypt format."}
+    mask = charset_mask(set(text))
+    if mask & HEX and len(text) in HEX_DIGEST_LENGTHS:
+        return {"encoding": "hex", "candidates": list(HEX_DIGEST_LENGTHS[len(text)]), "bits": len(text) * 4}
+    if mask & (BASE64 | BASE64_URL) and _valid_padding(text, 2) and not len(text) % 4:
+        decoder = base64.b64decode if mask & BASE64 else base64.urlsafe_b64decode
+        decoded = _decode(decoder, text)
+        digest = _base64_digest(text, decoded) if decoded is not None else None
+        if digest:
+            return {"encoding": "base64", "candidates": [digest], "bits": len(decoded) * 8}
+    return {"error": "Not a recognised hash digest."}
+
+
+def _statistical_conclusion(ic: float, unique_characters: int) -> str:
+    if unique_characters == 1:
+        return "The text consists of a single repeating character."
+    if ic > 0.1:
+        return "Very high IC. The text is highly repetitive and not standard English. It might be a simple pattern or a single-character substitution from a small alphabet."
+    if abs(ic - IC_ENGLISH) < 0.01:
+        return "High probability of being a monoalphabetic substitution cipher (e.g., Caesar, Atbash, Simple Substitution)."
+    if abs(ic - IC_RANDOM) < 0.01:
+        return "Likely a polyalphabetic cipher (e.g., Vigenère), modern encryption, or compressed data. The character distribution is close to random."
+    return "The statistical properties are inconclusive. It might be a complex cipher, non-standard text, or too short for an accurate analysis."
+
+
+def _detect_encoding(text: str, counts: Counter, mask: int, length: int):
+    """Returns (format, conclusion) for a recognised encoding, or None."""
+    cleaned = None
+
+    def compact():
+        nonlocal cleaned
+        if cleaned is None:
+            cleaned = text.translate(_STRIP)
+        return cleaned
+
+    has_whitespace = length != len(text)
+    if "$" in counts and not has_whitespace:
+        identified = identify_hash(text)
+        if identified.get("encoding") == "crypt":
+            return "crypt", f"Looks like a password hash ({identified['candidates'][0]})."
+    if mask & BINARY:
+        return "binary", "Looks like Binary (Base2)."
+    if mask & OCTAL:
+        return "octal", "Looks like Octal (Base8)."
+    if mask & HEX:
+        if not has_whitespace and length in HEX_DIGEST_LENGTHS:
+            return "hex_digest", (f"Looks like Hexadecimal (Base16); {length} hex digits match the digest "
+                                  f"length of {' / '.join(HEX_DIGEST_LENGTHS[length])}.")
+        return "hex", "Looks like Hexadecimal (Base16)."
+    if mask & BRAILLE:
+        return "braille", "Looks like Braille."
+    if mask & MORSE and ("." in counts or "-" in counts):
+        return "morse", "Looks like Morse code."
+    if mask & URL and "%" in counts and _PERCENT_ENCODED.fullmatch(compact()):
+        return "url", "Looks like URL encoding (percent-encoded)."
+    # Plain letters of one case decode as Base32/64/85 often enough to need a mixed alphabet.
+    mixed = _mixed_alphabet(counts)
+    if mask & BASE32 and length >= 16 and mixed and _valid_padding(compact(), 6):
+        data = compact()
+        decoded = _decode(base64.b32decode, data + "=" * (-len(data) % 8))
+        if decoded is not None and (_printable_ratio(decoded) > 0.8 or data.endswith("=")):
+            return "base32", "Looks like Base32 encoding."
+    if mask & (BASE64 | BASE64_URL) and length > 20 and mixed and _valid_padding(compact(), 2):
+        data = compact()
+        decoder = base64.b64decode if mask & BASE64 else base64.urlsafe_b64decode
+        decoded = _decode(decoder, data + "=" * (-len(data) % 4))
+        if decoded is not None:
+            variant = "Base64" if mask & BASE64 else "URL-safe Base64"
+            if _printable_ratio(decoded) > 0.8:
+                return "base64", f"Looks like {variant} encoding."
+            digest = _base64_digest(data, decoded) if not has_whitespace else None
+            if digest:
+                return "base64_digest", f"Looks like a {variant}-encoded {len(decoded)}-byte digest ({digest})."
+    if mask & (ASCII85 | BASE85) and length >= 20 and mixed:
+        data = compact()
+        if mask & ASCII85:
+            decoded = _decode(lambda s: base64.a85decode(s, adobe=s.startswith("<~")), data)
+            if decoded is not None and _printable_ratio(decoded) > 0.8:
+                return "ascii85", "Looks like Ascii85 (Base85) encoding."
+        if mask & BASE85:
+            decoded = _decode(base64.b85decode, data)
+            if decoded is not None and _printable_ratio(decoded) > 0.8:
+                return "base85", "Looks like Base85 (RFC 1924) encoding."
+    return None
+
+
+def classify(text: str) -> dict:
+    """Classifies a sample from one pass over its characters.
+
+    A single Counter pass yields the histogram from which the charset
+    bitmask (the classes every character belongs to), the folded letter
+    histogram for the index of coincidence and the entropy are derived;
+    only a matching encoding is trial-decoded.
+
+    :return: {"format", "conclusion", "ic", "entropy", "unique_characters", "length"},
+             or {"error": ...} for empty input.
+    """
+    if not text or not text.strip():
+        return {"error": "Input is empty."}
+    counts = Counter(text)
+    mask = charset_mask(counts)
+    letters = Counter()
+    for ch, count in counts.items():
+        if ch.isalpha():
+            for upper in ch.upper():
+                letters[upper] += count
+    letter_total = sum(letters.values())
+    pairs = sum(c * (c - 1) for c in letters.values())
+    ic = pairs / (letter_total * (letter_total - 1)) if letter_total > 1 else 0.0
+    entropy = entropy_from_counts(counts.values(), len(text))
+    length = len(text) - sum(counts.get(ch, 0) for ch in _IGNORED)
+
+    detected = _detect_encoding(text, counts, mask, length)
+    if detected is None:
+        detected = "text", _statistical_conclusion(ic, len(counts))
+    return {
+        "format": detected[0],
+        "conclusion": detected[1],
+        "ic": ic,
+        "entropy": entropy,
+        "unique_characters": len(counts),
+        "length": len(text),
+    }
+
+
+def classify_batch(samples, max_workers: int = None, chunksize: int = BATCH_CHUNK_SIZE) -> list[dict]:
+    """Classifies many samples, in order, across a process pool.
+
+    :param samples: An iterable of strings.
+    :param max_workers: The number of worker processes (1 classifies in this process).
+    :param chunksize: The number of samples sent to a worker at a time.
+    :return: The classify() result of every sample.
+    """
+    samples = list(samples)
+    workers = min(worker_count(max_workers), math.ceil(len(samples) / chunksize))
+    if workers <= 1:
+        return [classify(sample) for sample in samples]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(classify, samples, chunksize=chunksize))
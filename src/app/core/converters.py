@@ -1,25 +1,36 @@
 from .data import (
     MORSE_DICT, MORSE_TO_TEXT, BRAILLE_DICT, BRAILLE_NUMBER_PREFIX, BRAILLE_TO_TEXT,
     GRID_DICT, EMOJI_MAP, REVERSE_EMOJI_MAP, ERROR_MESSAGES, digits, alphabet_base36,
-    alphabet_base58, alphabet_base62, ELGAMAL_PARAMETERS, COLOR_NAME_MAP
+    alphabet_base58, alphabet_base62, ELGAMAL_PARAMETERS, KDF_PARAMETERS, COLOR_NAME_MAP
 )
 import sys
 import base64
 import bcrypt
+import functools
 import hashlib
+import hmac
 import json
 import math
+import mmap
 import os
 import random
 import re
 import secrets
+import struct
+import threading
 import time
 import uuid
 import zlib
 import pyfiglet
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from cryptography.exceptions import InvalidTag, UnsupportedAlgorithm
+from cryptography.hazmat.primitives.keywrap import aes_key_wrap, aes_key_unwrap, InvalidUnwrap
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import padding, serialization, hashes
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from cryptography.hazmat.primitives.asymmetric import rsa, padding as asym_padding, ec, dh
@@ -28,6 +39,7 @@ from Crypto.Cipher import DES as CryptoDES
 from Crypto.Cipher import DES3 as Crypto3DES
 from Crypto.Cipher import Blowfish as CryptoBlowfish
 from PyQt6.QtGui import QColor
+from .parallel import worker_count, imap_unordered
 
 
 def decimal_to_binary(decimal_str: str) -> str:
@@ -808,19 +820,57 @@ def basen_to_word(encoded: str, base: int) -> str:
     raise ValueError(ERROR_MESSAGES["unsupported_base"].format(base=base))
 
 
-def derive_key(password: str, salt: bytes, length: int = 32) -> bytes:
+def derive_key(password: str, salt: bytes, length: int = 32, params: dict = None) -> bytes:
     """Derives a cryptographic key from a password and salt using Scrypt.
 
     :param password: The user's password.
     :param salt: A random salt.
     :param length: The desired key length in bytes.
+    :param params: The scrypt cost {"n", "r", "p"} (defaults to KDF_PARAMETERS["derive_key"]).
     :return: The derived key as bytes.
     """
-    kdf = Scrypt(salt=salt, length=length, n=2**14,
-                 r=8, p=1, backend=default_backend())
+    params = params or KDF_PARAMETERS["derive_key"]
+    kdf = Scrypt(salt=salt, length=length, n=params["n"],
+                 r=params["r"], p=params["p"], backend=default_backend())
     return kdf.derive(password.encode())
 
 
+# Ciphertexts start with this tag and the scrypt cost of their key, so changing
+# KDF_PARAMETERS["derive_key"] leaves existing ciphertexts decryptable.
+KDF_HEADER_MAGIC = b"CKS1"
+_KDF_HEADER = struct.Struct(">4sBII")
+# The cost of the untagged ciphertexts written before the header existed.
+LEGACY_DERIVE_KEY_PARAMETERS = {"n": 2**14, "r": 8, "p": 1}
+# Headers above this cost are rejected before deriving, so a crafted ciphertext cannot
+# make decryption take gigabytes or minutes: 4x the memory calibrate() allows by default.
+MAX_DERIVE_KEY_LOG_N = 20
+MAX_DERIVE_KEY_WORK = 4 * 64 * 1024 * 1024
+
+
+def _kdf_header() -> tuple:
+    """Returns (header, parameters) for a new ciphertext, with the current derive_key cost."""
+    params = dict(KDF_PARAMETERS["derive_key"])
+    header = _KDF_HEADER.pack(KDF_HEADER_MAGIC, params["n"].bit_length() - 1, params["r"], params["p"])
+    return header, params
+
+
+def _split_kdf_header(data: bytes) -> tuple:
+    """Returns (parameters, rest) of a decoded ciphertext; untagged ones use LEGACY_DERIVE_KEY_PARAMETERS.
+
+    A legacy salt starts with the tag by chance with probability 2**-32.
+
+    :raises ValueError: If the header holds an invalid cost or one above MAX_DERIVE_KEY_WORK.
+    """
+    if data[:len(KDF_HEADER_MAGIC)] == KDF_HEADER_MAGIC and len(data) >= _KDF_HEADER.size:
+        _, log_n, r, p = _KDF_HEADER.unpack_from(data)
+        if log_n > MAX_DERIVE_KEY_LOG_N:
+            raise ValueError(f"Ciphertext scrypt cost n = 2**{log_n} exceeds 2**{MAX_DERIVE_KEY_LOG_N}")
+        params = {"n": 1 << log_n, "r": r, "p": p}
+        _check_kdf_parameters("derive_key", params)
+        return params, data[_KDF_HEADER.size:]
+    return dict(LEGACY_DERIVE_KEY_PARAMETERS), data
+
+
 def pad_data(data: bytes, block_size: int = 128) -> bytes:
     """Pads data to be a multiple of the block size using PKCS7 padding.
 
@@ -848,17 +898,18 @@ def aes_encrypt(text: str, password: str) -> str:
 
     :param text: The plaintext to encrypt.
     :param password: The password to derive the key from.
-    :return: A Base64 encoded string containing salt, IV, and ciphertext.
+    :return: A Base64 encoded string containing the KDF header, salt, IV, and ciphertext.
     """
+    header, params = _kdf_header()
     salt = os.urandom(16)
-    key = derive_key(password, salt, 32)
+    key = derive_key(password, salt, 32, params)
     iv = os.urandom(16)
     cipher = Cipher(algorithms.AES(key), modes.CBC(iv),
                     backend=default_backend())
     encryptor = cipher.encryptor()
     padded_text = pad_data(text.encode())
     ct = encryptor.update(padded_text) + encryptor.finalize()
-    return base64.b64encode(salt + iv + ct).decode()
+    return base64.b64encode(header + salt + iv + ct).decode()
 
 
 def aes_decrypt(ciphertext_b64: str, password: str) -> str:
@@ -868,11 +919,11 @@ def aes_decrypt(ciphertext_b64: str, password: str) -> str:
     :param password: The password used for encryption.
     :return: The decrypted plaintext.
     """
-    data = base64.b64decode(ciphertext_b64)
+    params, data = _split_kdf_header(base64.b64decode(ciphertext_b64))
     salt = data[:16]
     iv = data[16:32]
     ct = data[32:]
-    key = derive_key(password, salt, 32)
+    key = derive_key(password, salt, 32, params)
     cipher = Cipher(algorithms.AES(key), modes.CBC(iv),
                     backend=default_backend())
     decryptor = cipher.decryptor()
@@ -885,16 +936,17 @@ def chacha20_encrypt(text: str, password: str) -> str:
 
     :param text: The plaintext to encrypt.
     :param password: The password to derive the key from.
-    :return: A Base64 encoded string containing salt, nonce, and ciphertext.
+    :return: A Base64 encoded string containing the KDF header, salt, nonce, and ciphertext.
     """
+    header, params = _kdf_header()
     salt = os.urandom(16)
-    key = derive_key(password, salt, 32)
+    key = derive_key(password, salt, 32, params)
     nonce = os.urandom(16)
     algorithm = algorithms.ChaCha20(key, nonce)
     cipher = Cipher(algorithm, mode=None, backend=default_backend())
     encryptor = cipher.encryptor()
     ct = encryptor.update(text.encode()) + encryptor.finalize()
-    return base64.b64encode(salt + nonce + ct).decode()
+    return base64.b64encode(header + salt + nonce + ct).decode()
 
 
 def chacha20_decrypt(ciphertext_b64: str, password: str) -> str:
@@ -904,11 +956,11 @@ def chacha20_decrypt(ciphertext_b64: str, password: str) -> str:
     :param password: The password used for encryption.
     :return: The decrypted plaintext.
     """
-    data = base64.b64decode(ciphertext_b64)
+    params, data = _split_kdf_header(base64.b64decode(ciphertext_b64))
     salt = data[:16]
     nonce = data[16:32]
     ct = data[32:]
-    key = derive_key(password, salt, 32)
+    key = derive_key(password, salt, 32, params)
     algorithm = algorithms.ChaCha20(key, nonce)
     cipher = Cipher(algorithm, mode=None, backend=default_backend())
     decryptor = cipher.decryptor()
@@ -920,15 +972,16 @@ def des_encrypt(text: str, password: str) -> str:
 
     :param text: The plaintext to encrypt.
     :param password: The password to derive the key from.
-    :return: A Base64 encoded string containing salt, IV, and ciphertext.
+    :return: A Base64 encoded string containing the KDF header, salt, IV, and ciphertext.
     """
+    header, params = _kdf_header()
     salt = os.urandom(16)
-    key = derive_key(password, salt, 8)
+    key = derive_key(password, salt, 8, params)
     iv = os.urandom(8)
     cipher = CryptoDES.new(key, CryptoDES.MODE_CBC, iv)
     padded_text = pad_data(text.encode(), 64)
     ct = cipher.encrypt(padded_text)
-    return base64.b64encode(salt + iv + ct).decode()
+    return base64.b64encode(header + salt + iv + ct).decode()
 
 
 def des_decrypt(ciphertext_b64: str, password: str) -> str:
@@ -938,10 +991,10 @@ def des_decrypt(ciphertext_b64: str, password: str) -> str:
     :param password: The password used for encryption.
     :return: The decrypted plaintext.
     """
-    data = base64.b64decode(ciphertext_b64)
+    params, data = _split_kdf_header(base64.b64decode(ciphertext_b64))
     salt = data[:16]
     iv, ct = data[16:24], data[24:]
-    key = derive_key(password, salt, 8)
+    key = derive_key(password, salt, 8, params)
     cipher = CryptoDES.new(key, CryptoDES.MODE_CBC, iv)
     padded_text = cipher.decrypt(ct)
     return unpad_data(padded_text, 64).decode()
@@ -952,15 +1005,16 @@ def triple_des_encrypt(text: str, password: str) -> str:
 
     :param text: The plaintext to encrypt.
     :param password: The password to derive the key from.
-    :return: A Base64 encoded string containing salt, IV, and ciphertext.
+    :return: A Base64 encoded string containing the KDF header, salt, IV, and ciphertext.
     """
+    header, params = _kdf_header()
     salt = os.urandom(16)
-    key = derive_key(password, salt, 24)
+    key = derive_key(password, salt, 24, params)
     iv = os.urandom(8)
     cipher = Crypto3DES.new(key, Crypto3DES.MODE_CBC, iv)
     padded_text = pad_data(text.encode(), 64)
     ct = cipher.encrypt(padded_text)
-    return base64.b64encode(salt + iv + ct).decode()
+    return base64.b64encode(header + salt + iv + ct).decode()
 
 
 def triple_des_decrypt(ciphertext_b64: str, password: str) -> str:
@@ -970,10 +1024,10 @@ def triple_des_decrypt(ciphertext_b64: str, password: str) -> str:
     :param password: The password used for encryption.
     :return: The decrypted plaintext.
     """
-    data = base64.b64decode(ciphertext_b64)
+    params, data = _split_kdf_header(base64.b64decode(ciphertext_b64))
     salt = data[:16]
     iv, ct = data[16:24], data[24:]
-    key = derive_key(password, salt, 24)
+    key = derive_key(password, salt, 24, params)
     cipher = Crypto3DES.new(key, Crypto3DES.MODE_CBC, iv)
     padded_text = cipher.decrypt(ct)
     return unpad_data(padded_text, 64).decode()
@@ -984,15 +1038,16 @@ def blowfish_encrypt(text: str, password: str) -> str:
 
     :param text: The plaintext to encrypt.
     :param password: The password to derive the key from.
-    :return: A Base64 encoded string containing salt, IV, and ciphertext.
+    :return: A Base64 encoded string containing the KDF header, salt, IV, and ciphertext.
     """
+    header, params = _kdf_header()
     salt = os.urandom(16)
-    key = derive_key(password, salt, 32)
+    key = derive_key(password, salt, 32, params)
     iv = os.urandom(8)
     cipher = CryptoBlowfish.new(key, CryptoBlowfish.MODE_CBC, iv)
     padded_text = pad_data(text.encode(), 64)
     ct = cipher.encrypt(padded_text)
-    return base64.b64encode(salt + iv + ct).decode()
+    return base64.b64encode(header + salt + iv + ct).decode()
 
 
 def blowfish_decrypt(ciphertext_b64: str, password: str) -> str:
@@ -1002,10 +1057,10 @@ def blowfish_decrypt(ciphertext_b64: str, password: str) -> str:
     :param password: The password used for encryption.
     :return: The decrypted plaintext.
     """
-    data = base64.b64decode(ciphertext_b64)
+    params, data = _split_kdf_header(base64.b64decode(ciphertext_b64))
     salt = data[:16]
     iv, ct = data[16:24], data[24:]
-    key = derive_key(password, salt, 32)
+    key = derive_key(password, salt, 32, params)
     cipher = CryptoBlowfish.new(key, CryptoBlowfish.MODE_CBC, iv)
     padded_text = cipher.decrypt(ct)
     return unpad_data(padded_text, 64).decode()
@@ -1040,10 +1095,10 @@ def rsa_encrypt(text: str, public_key_pem: str) -> str:
     """Encrypts text using an RSA public key (hybrid encryption with AES-GCM).
 
     :param text: The plaintext to encrypt.
-    :param public_key_pem: The PEM-encoded RSA public key.
+    :param public_key_pem: The PEM-encoded RSA public key or a loaded key object.
     :return: A Base64 encoded string containing the encrypted components.
     """
-    public_key = serialization.load_pem_public_key(public_key_pem.encode())
+    public_key = _public_key(public_key_pem)
     symmetric_key = os.urandom(32)
     iv = os.urandom(12) 
     cipher = Cipher(algorithms.AES(symmetric_key), modes.GCM(iv), backend=default_backend())
@@ -1062,11 +1117,11 @@ def rsa_decrypt(ciphertext_b64: str, private_key_pem: str, password: str = None)
     """Decrypts text using an RSA private key (hybrid encryption).
 
     :param ciphertext_b64: The Base64 encoded ciphertext from rsa_encrypt.
-    :param private_key_pem: The PEM-encoded RSA private key.
+    :param private_key_pem: The PEM-encoded RSA private key or a loaded key object.
     :param password: The password for the private key, if it's encrypted.
     :return: The decrypted plaintext.
     """
-    private_key = serialization.load_pem_private_key(private_key_pem.encode(), password=password.encode() if password else None)
+    private_key = _private_key(private_key_pem, password)
     data = base64.b64decode(ciphertext_b64)
     
     # Unbundle components
@@ -1091,14 +1146,11 @@ def rsa_sign(text: str, private_key_pem: str, password: str = None) -> str:
     """Signs a message using an RSA private key.
 
     :param text: The message to sign.
-    :param private_key_pem: The PEM-encoded RSA private key.
+    :param private_key_pem: The PEM-encoded RSA private key or a loaded key object.
     :param password: The password for the private key, if encrypted.
     :return: The Base64 encoded signature.
     """
-    private_key = serialization.load_pem_private_key(
-        private_key_pem.encode(),
-        password=password.encode() if password else None
-    )
+    private_key = _private_key(private_key_pem, password)
     signature = private_key.sign(
         text.encode(),
         asym_padding.PSS(
@@ -1115,10 +1167,10 @@ def rsa_verify(text: str, signature_b64: str, public_key_pem: str) -> bool:
 
     :param text: The original message.
     :param signature_b64: The Base64 encoded signature to verify.
-    :param public_key_pem: The PEM-encoded RSA public key.
+    :param public_key_pem: The PEM-encoded RSA public key or a loaded key object.
     :return: True if the signature is valid, False otherwise.
     """
-    public_key = serialization.load_pem_public_key(public_key_pem.encode())
+    public_key = _public_key(public_key_pem)
     signature = base64.b64decode(signature_b64)
     try:
         public_key.verify(
@@ -1135,6 +1187,168 @@ def rsa_verify(text: str, signature_b64: str, public_key_pem: str) -> bool:
         return False
 
 
+RSA_STREAM_MAGIC = b"RSAS\x01"
+RSA_STREAM_CHUNK_SIZE = 1 << 16
+RSA_STREAM_MAX_CHUNK_SIZE = 1 << 26
+_RSA_OAEP = asym_padding.OAEP(mgf=asym_padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+
+
+def _read_exact(src, size: int) -> bytes:
+    """Reads up to size bytes, looping over short reads."""
+    parts = []
+    while size:
+        part = src.read(size)
+        if not part:
+            break
+        parts.append(part)
+        size -= len(part)
+    return b"".join(parts)
+
+
+def _stream_nonce(prefix: bytes, counter: int, last: bool) -> bytes:
+    """Builds a 96-bit chunk nonce: 7-byte prefix || 32-bit counter || last-chunk flag."""
+    if counter >= 1 << 32:
+        raise ValueError("Stream too long")
+    return prefix + counter.to_bytes(4, 'big') + (b"\x01" if last else b"\x00")
+
+
+def rsa_encrypt_stream(src, dst, public_key_pem, chunk_size: int = RSA_STREAM_CHUNK_SIZE) -> int:
+    """Encrypts a binary stream of any size to an RSA public key.
+
+    A random AES-256 key is wrapped with RSA-OAEP and the payload is sealed in
+    AES-GCM chunks whose nonces carry a counter and a last-chunk flag, so
+    chunks cannot be reordered, dropped or truncated without detection. The
+    header is authenticated with every chunk. Memory use is bounded by chunk_size.
+
+    :param src: A readable binary file object.
+    :param dst: A writable binary file object.
+    :param public_key_pem: The PEM-encoded RSA public key or a loaded key object.
+    :param chunk_size: The plaintext size of each chunk in bytes.
+    :return: The number of plaintext bytes encrypted.
+    :raises ValueError: On encryption failure.
+    """
+    try:
+        if not 0 < chunk_size <= RSA_STREAM_MAX_CHUNK_SIZE:
+            raise ValueError("Invalid chunk size")
+        public_key = _public_key(public_key_pem)
+        symmetric_key = AESGCM.generate_key(bit_length=256)
+        encrypted_symmetric_key = public_key.encrypt(symmetric_key, _RSA_OAEP)
+        prefix = os.urandom(7)
+        header = (RSA_STREAM_MAGIC + len(encrypted_symmetric_key).to_bytes(2, 'big') +
+                  encrypted_symmetric_key + prefix + chunk_size.to_bytes(4, 'big'))
+        dst.write(header)
+        aead = AESGCM(symmetric_key)
+        total, counter = 0, 0
+        chunk = _read_exact(src, chunk_size)
+        while True:
+            following = _read_exact(src, chunk_size) if len(chunk) == chunk_size else b""
+            last = not following
+            dst.write(aead.encrypt(_stream_nonce(prefix, counter, last), chunk, header))
+            total += len(chunk)
+            if last:
+                return total
+            chunk, counter = following, counter + 1
+    except Exception as e:
+        raise ValueError(f"RSA stream encryption failed: {e}")
+
+
+def rsa_decrypt_stream(src, dst, private_key_pem, password: str = None) -> int:
+    """Decrypts a stream produced by rsa_encrypt_stream.
+
+    Plaintext is written chunk by chunk as each chunk authenticates; on error
+    the data already written must be discarded by the caller.
+
+    :param src: A readable binary file object.
+    :param dst: A writable binary file object.
+    :param private_key_pem: The PEM-encoded RSA private key or a loaded key object.
+    :param password: The password for the private key, if it's encrypted.
+    :return: The number of plaintext bytes decrypted.
+    :raises ValueError: On a malformed, tampered or truncated stream.
+    """
+    try:
+        private_key = _private_key(private_key_pem, password)
+        magic = _read_exact(src, len(RSA_STREAM_MAGIC) + 2)
+        if magic[:len(RSA_STREAM_MAGIC)] != RSA_STREAM_MAGIC or len(magic) != len(RSA_STREAM_MAGIC) + 2:
+            raise ValueError("Not an RSA stream")
+        key_len = int.from_bytes(magic[-2:], 'big')
+        rest = _read_exact(src, key_len + 7 + 4)
+        if len(rest) != key_len + 11:
+            raise ValueError("Truncated header")
+        header = magic + rest
+        encrypted_symmetric_key, prefix = rest[:key_len], rest[key_len:key_len + 7]
+        chunk_size = int.from_bytes(rest[-4:], 'big')
+        if not 0 < chunk_size <= RSA_STREAM_MAX_CHUNK_SIZE:
+            raise ValueError("Invalid chunk size")
+        aead = AESGCM(private_key.decrypt(encrypted_symmetric_key, _RSA_OAEP))
+        block_size = chunk_size + 16
+        total, counter = 0, 0
+        block = _read_exact(src, block_size)
+        while True:
+            following = _read_exact(src, block_size) if len(block) == block_size else b""
+            last = not following
+            plaintext = aead.decrypt(_stream_nonce(prefix, counter, last), block, header)
+            dst.write(plaintext)
+            total += len(plaintext)
+            if last:
+                return total
+            block, counter = following, counter + 1
+    except InvalidTag:
+        raise ValueError("RSA stream decryption failed: authentication failed (wrong key, tampered or truncated data)")
+    except Exception as e:
+        raise ValueError(f"RSA stream decryption failed: {e}")
+
+
+def rsa_encrypt_file(input_path: str, output_path: str, public_key_pem,
+                     chunk_size: int = RSA_STREAM_CHUNK_SIZE) -> int:
+    """Encrypts a file of any size to an RSA public key with rsa_encrypt_stream."""
+    with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+        return rsa_encrypt_stream(src, dst, public_key_pem, chunk_size)
+
+
+def rsa_decrypt_file(input_path: str, output_path: str, private_key_pem, password: str = None) -> int:
+    """Decrypts a file produced by rsa_encrypt_file.
+
+    The plaintext is written to a temporary file that replaces output_path only
+    once every chunk has authenticated.
+    """
+    temp_path = output_path + ".part"
+    try:
+        with open(input_path, "rb") as src, open(temp_path, "wb") as dst:
+            total = rsa_decrypt_stream(src, dst, private_key_pem, password)
+        os.replace(temp_path, output_path)
+        return total
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def rsa_encrypt_batch(texts, public_key_pem, max_workers: int = None) -> list[str]:
+    """Encrypts many messages to one RSA public key, loading the key once.
+
+    :param texts: An iterable of plaintext strings.
+    :param public_key_pem: The PEM-encoded RSA public key or a loaded key object.
+    :param max_workers: The number of worker threads.
+    :return: The Base64 ciphertexts (rsa_encrypt format) in input order.
+    """
+    public_key = _public_key(public_key_pem)
+    with ThreadPoolExecutor(max_workers=worker_count(max_workers)) as executor:
+        return list(executor.map(lambda text: rsa_encrypt(text, public_key), texts))
+
+
+def rsa_decrypt_batch(ciphertexts, private_key_pem, password: str = None, max_workers: int = None) -> list[str]:
+    """Decrypts many rsa_encrypt ciphertexts with one RSA private key, loading the key once.
+
+    :param ciphertexts: An iterable of Base64 ciphertexts.
+    :param private_key_pem: The PEM-encoded RSA private key or a loaded key object.
+    :param password: The password for the private key, if it's encrypted.
+    :param max_workers: The number of worker threads.
+    :return: The plaintexts in input order.
+    """
+    private_key = _private_key(private_key_pem, password)
+    with ThreadPoolExecutor(max_workers=worker_count(max_workers)) as executor:
+        return list(executor.map(lambda ciphertext: rsa_decrypt(ciphertext, private_key), ciphertexts))
+
+
 def ecc_generate_keys(curve_name: str = "SECP256R1") -> tuple[str, str]:
     """Generates ECC private and public keys for a given curve.
 
@@ -1162,55 +1376,169 @@ def ecc_generate_keys(curve_name: str = "SECP256R1") -> tuple[str, str]:
     return priv_pem.decode(), pub_pem.decode()
 
 
+ECC_MULTI_RECIPIENT_MAGIC = 0x10
+ECC_KEY_ID_SIZE = 8
+
+
+def _ecc_point(public_key, compressed: bool = True) -> bytes:
+    """Encodes an EC public key as an X9.62 point."""
+    return public_key.public_bytes(
+        encoding=serialization.Encoding.X962,
+        format=serialization.PublicFormat.CompressedPoint if compressed
+        else serialization.PublicFormat.UncompressedPoint
+    )
+
+
+def _ecc_key_id(public_key) -> bytes:
+    """Identifies a recipient by a truncated SHA-256 of its compressed point."""
+    return hashlib.sha256(_ecc_point(public_key)).digest()[:ECC_KEY_ID_SIZE]
+
+
+def _ecc_public_key(key):
+    public_key = _public_key(key)
+    if not isinstance(public_key, ec.EllipticCurvePublicKey):
+        raise TypeError("Public key is not a valid ECC key.")
+    return public_key
+
+
 def ecc_encrypt(plaintext: str, public_pem: str) -> str:
     """Encrypts text using an ECC public key (ECIES).
 
+    The ephemeral public key is stored as a compressed X9.62 point.
+
     :param plaintext: The text to encrypt.
-    :param public_pem: The PEM-encoded ECC public key.
+    :param public_pem: The PEM-encoded ECC public key or a loaded key object.
     :return: The Base64 encoded ciphertext.
     :raises ValueError: On encryption failure.
     """
     try:
         # ECIES implementation (hybrid)
-        public_key = serialization.load_pem_public_key(public_pem.encode())
-        
+        public_key = _ecc_public_key(public_pem)
+
         # Generate ephemeral key for this encryption
         ephemeral_private_key = ec.generate_private_key(public_key.curve)
-        ephemeral_public_key = ephemeral_private_key.public_key()
-        
+
         # Derive shared secret
         shared_key = ephemeral_private_key.exchange(ec.ECDH(), public_key)
         derived_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b'ecc-encryption').derive(shared_key)
-        
+
         # Encrypt data with AES-GCM
         iv = os.urandom(12)
         encryptor = Cipher(algorithms.AES(derived_key), modes.GCM(iv)).encryptor()
         ciphertext = encryptor.update(plaintext.encode()) + encryptor.finalize()
-        
+
         # Prepend ephemeral public key and IV to ciphertext
-        ephemeral_pub_bytes = ephemeral_public_key.public_bytes(
-            encoding=serialization.Encoding.X962, format=serialization.PublicFormat.UncompressedPoint
-        )
-        
+        ephemeral_pub_bytes = _ecc_point(ephemeral_private_key.public_key())
+
         return base64.b64encode(ephemeral_pub_bytes + iv + encryptor.tag + ciphertext).decode()
     except Exception as e:
         raise ValueError(f"ECC encryption failed: {e}")
 
 
+def ecc_encrypt_multi(plaintext: str, public_pems) -> str:
+    """Encrypts text once for several ECC recipients sharing a curve.
+
+    One ephemeral key and one AES-GCM body are produced. The random content
+    key is wrapped (RFC 3394) for each recipient under a key derived from
+    ECDH with that recipient. The layout is 0x10 || ephemeral point ||
+    recipient count || (key id || wrapped key) * count || IV || tag || body,
+    and everything before the IV is authenticated.
+
+    :param plaintext: The text to encrypt.
+    :param public_pems: An iterable of PEM-encoded ECC public keys or loaded key objects.
+    :return: The Base64 encoded ciphertext.
+    :raises ValueError: On encryption failure or recipients on different curves.
+    """
+    try:
+        public_keys = [_ecc_public_key(key) for key in public_pems]
+        if not public_keys:
+            raise ValueError("No recipients")
+        if len(public_keys) > 0xFFFF:
+            raise ValueError("Too many recipients")
+        curve = public_keys[0].curve
+        if any(key.curve.name != curve.name for key in public_keys):
+            raise ValueError("All recipients must use the same curve")
+
+        ephemeral_private_key = ec.generate_private_key(curve)
+        ephemeral_point = _ecc_point(ephemeral_private_key.public_key())
+        content_key = os.urandom(32)
+        header = [bytes([ECC_MULTI_RECIPIENT_MAGIC]), ephemeral_point, len(public_keys).to_bytes(2, 'big')]
+        for public_key in public_keys:
+            recipient_point = _ecc_point(public_key)
+            shared_key = ephemeral_private_key.exchange(ec.ECDH(), public_key)
+            wrapping_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                                info=b'ecc-multi-recipient' + ephemeral_point + recipient_point).derive(shared_key)
+            header.append(_ecc_key_id(public_key) + aes_key_wrap(wrapping_key, content_key))
+        header = b"".join(header)
+
+        iv = os.urandom(12)
+        encryptor = Cipher(algorithms.AES(content_key), modes.GCM(iv)).encryptor()
+        encryptor.authenticate_additional_data(header)
+        ciphertext = encryptor.update(plaintext.encode()) + encryptor.finalize()
+        return base64.b64encode(header + iv + encryptor.tag + ciphertext).decode()
+    except Exception as e:
+        raise ValueError(f"ECC encryption failed: {e}")
+
+
+def _ecc_decrypt_multi(data: bytes, private_key) -> bytes:
+    """Finds this recipient's wrapped key in a multi-recipient ciphertext and decrypts the body."""
+    field_len = (private_key.curve.key_size + 7) // 8
+    point_end = 1 + 1 + field_len
+    count = int.from_bytes(data[point_end:point_end + 2], 'big')
+    entry_len = ECC_KEY_ID_SIZE + 40
+    header_end = point_end + 2 + count * entry_len
+    if len(data) < header_end + 28:
+        raise ValueError("Truncated ciphertext")
+
+    ephemeral_point = data[1:point_end]
+    ephemeral_public_key = ec.EllipticCurvePublicKey.from_encoded_point(private_key.curve, ephemeral_point)
+    recipient_point = _ecc_point(private_key.public_key())
+    key_id = _ecc_key_id(private_key.public_key())
+    shared_key = private_key.exchange(ec.ECDH(), ephemeral_public_key)
+    wrapping_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                        info=b'ecc-multi-recipient' + ephemeral_point + recipient_point).derive(shared_key)
+
+    content_key = None
+    for pos in range(point_end + 2, header_end, entry_len):
+        if data[pos:pos + ECC_KEY_ID_SIZE] != key_id:
+            continue
+        try:
+            content_key = aes_key_unwrap(wrapping_key, data[pos + ECC_KEY_ID_SIZE:pos + entry_len])
+            break
+        except InvalidUnwrap:
+            continue
+    if content_key is None:
+        raise ValueError("This key is not a recipient of the message")
+
+    iv = data[header_end:header_end + 12]
+    tag = data[header_end + 12:header_end + 28]
+    decryptor = Cipher(algorithms.AES(content_key), modes.GCM(iv, tag)).decryptor()
+    decryptor.authenticate_additional_data(data[:header_end])
+    return decryptor.update(data[header_end + 28:]) + decryptor.finalize()
+
+
 def ecc_decrypt(ciphertext_b64: str, private_pem: str) -> str:
     """Decrypts text using an ECC private key (ECIES).
 
+    The format is detected from the first byte: 0x02/0x03 for a compressed
+    ephemeral point, 0x04 for the older uncompressed form, and 0x10 for a
+    multi-recipient ciphertext.
+
     :param ciphertext_b64: The Base64 encoded ciphertext.
-    :param private_pem: The PEM-encoded ECC private key.
+    :param private_pem: The PEM-encoded ECC private key or a loaded key object.
     :return: The decrypted plaintext.
     :raises ValueError: On decryption failure.
     """
     try:
-        private_key = serialization.load_pem_private_key(private_pem.encode(), password=None)
+        private_key = _private_key(private_pem)
         data = base64.b64decode(ciphertext_b64)
-        
-        # Dynamically determine point length based on the curve
-        point_len = (private_key.curve.key_size + 7) // 8 * 2 + 1
+
+        if data[:1] == bytes([ECC_MULTI_RECIPIENT_MAGIC]):
+            return _ecc_decrypt_multi(data, private_key).decode()
+
+        # Determine the point length from the curve and the point encoding
+        field_len = (private_key.curve.key_size + 7) // 8
+        point_len = field_len * 2 + 1 if data[:1] == b"\x04" else field_len + 1
 
         ephemeral_pub_bytes = data[:point_len]
         iv_start = point_len
@@ -1218,11 +1546,11 @@ def ecc_decrypt(ciphertext_b64: str, private_pem: str) -> str:
         iv = data[iv_start:tag_start]
         tag = data[tag_start:tag_start + 16]
         ciphertext = data[point_len + 12 + 16:]
-        
+
         ephemeral_public_key = ec.EllipticCurvePublicKey.from_encoded_point(private_key.curve, ephemeral_pub_bytes)
         shared_key = private_key.exchange(ec.ECDH(), ephemeral_public_key)
         derived_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b'ecc-encryption').derive(shared_key)
-        
+
         cipher = Cipher(algorithms.AES(derived_key), modes.GCM(iv, tag))
         decryptor = cipher.decryptor()
         plaintext = decryptor.update(ciphertext) + decryptor.finalize()
@@ -1231,15 +1559,48 @@ def ecc_decrypt(ciphertext_b64: str, private_pem: str) -> str:
         raise ValueError(f"ECC decryption failed: {e}")
 
 
+def ecc_encrypt_batch(plaintexts, public_pems, max_workers: int = None) -> list[str]:
+    """Encrypts many messages to one or more ECC recipients, parsing the keys once.
+
+    Every message still gets its own ephemeral key.
+
+    :param plaintexts: An iterable of plaintext strings.
+    :param public_pems: One public key, or a list of keys for multi-recipient ciphertexts
+                        (PEM-encoded or loaded key objects).
+    :param max_workers: The number of worker threads.
+    :return: The Base64 ciphertexts in input order.
+    """
+    if isinstance(public_pems, (list, tuple)):
+        public_keys = [_ecc_public_key(key) for key in public_pems]
+        encrypt = lambda text: ecc_encrypt_multi(text, public_keys)
+    else:
+        public_key = _ecc_public_key(public_pems)
+        encrypt = lambda text: ecc_encrypt(text, public_key)
+    with ThreadPoolExecutor(max_workers=worker_count(max_workers)) as executor:
+        return list(executor.map(encrypt, plaintexts))
+
+
+def ecc_decrypt_batch(ciphertexts, private_pem, max_workers: int = None) -> list[str]:
+    """Decrypts many ECC ciphertexts with one private key, parsing it once.
+
+    :param ciphertexts: An iterable of Base64 ciphertexts in any ECC format.
+    :param private_pem: The PEM-encoded ECC private key or a loaded key object.
+    :param max_workers: The number of worker threads.
+    :return: The plaintexts in input order.
+    """
+    private_key = _private_key(private_pem)
+    with ThreadPoolExecutor(max_workers=worker_count(max_workers)) as executor:
+        return list(executor.map(lambda ciphertext: ecc_decrypt(ciphertext, private_key), ciphertexts))
+
+
 def ecc_sign(message: str, private_pem: str) -> str:
     """Signs a message using an ECC private key.
 
     :param message: The message to sign.
-    :param private_pem: The PEM-encoded ECC private key.
+    :param private_pem: The PEM-encoded ECC private key or a loaded key object.
     :return: The Base64 encoded signature.
     """
-    private_key = serialization.load_pem_private_key(
-        private_pem.encode(), password=None)
+    private_key = _private_key(private_pem)
     signature = private_key.sign(
         message.encode(),
         ec.ECDSA(hashes.SHA256())
@@ -1252,10 +1613,10 @@ def ecc_verify(message: str, signature_b64: str, public_pem: str) -> bool:
 
     :param message: The original message.
     :param signature_b64: The Base64 encoded signature.
-    :param public_pem: The PEM-encoded ECC public key.
+    :param public_pem: The PEM-encoded ECC public key or a loaded key object.
     :return: True if the signature is valid, False otherwise.
     """
-    public_key = serialization.load_pem_public_key(public_pem.encode())
+    public_key = _public_key(public_pem)
     signature = base64.b64decode(signature_b64)
     try:
         public_key.verify(signature, message.encode(),
@@ -1265,25 +1626,34 @@ def ecc_verify(message: str, signature_b64: str, public_pem: str) -> bool:
         return False
 
 
+ELGAMAL_COMPACT_VERSION = 1
+
+
+@functools.lru_cache(maxsize=1)
+def _elgamal_group():
+    """Builds the DH parameters object for ELGAMAL_PARAMETERS once."""
+    return dh.DHParameterNumbers(ELGAMAL_PARAMETERS["p"], ELGAMAL_PARAMETERS["g"]).parameters()
+
+
+def _elgamal_parameters(key):
+    """Returns the cached group for keys in it, or the key's own parameters otherwise."""
+    numbers = key.parameters().parameter_numbers()
+    if numbers.p == ELGAMAL_PARAMETERS["p"] and numbers.g == ELGAMAL_PARAMETERS["g"]:
+        return _elgamal_group()
+    return key.parameters()
+
+
 def elgamal_generate_keys(key_size: int = 2048) -> tuple[str, str]:
     """
     Generates ElGamal-like keys using Diffie-Hellman.
 
-    This uses standard, hardcoded DH parameters for speed and reliability.
+    This uses the standard 2048-bit MODP group from RFC 3526 (ELGAMAL_PARAMETERS).
     :param key_size: The key size (ignored, uses 2048-bit group).
     :return: A tuple of (private_key_pem, public_key_pem).
     :raises ValueError: On key generation failure.
     """
     try:
-        # The standard 2048-bit MODP group from RFC 3526.
-        # Hardcoding these values is the most robust way to avoid all previous errors.
-        p = 0xFFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F14374FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7EDEE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF0598DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3BE39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF6955817183995497CEA956AE515D2261898FA051015728E5A8AACAA68FFFFFFFFFFFFFFFF
-        g = 2
-
-        params_numbers = dh.DHParameterNumbers(p, g)
-        parameters = params_numbers.parameters(default_backend())
-
-        private_key = parameters.generate_private_key()
+        private_key = _elgamal_group().generate_private_key()
         public_key = private_key.public_key()
 
         priv_pem = private_key.private_bytes(
@@ -1304,30 +1674,31 @@ def elgamal_generate_keys(key_size: int = 2048) -> tuple[str, str]:
 def elgamal_encrypt(plaintext: str, public_pem: str) -> str:
     """Encrypts text using an ElGamal/DH public key (DHIES).
 
+    The ciphertext is 0x00 || version || ephemeral y (fixed width, big-endian)
+    || IV || tag || ciphertext, with the first 2 + width bytes authenticated.
+    The leading zero byte tells it apart from the older PEM-based format,
+    whose 2-byte length prefix never starts with zero.
+
     :param plaintext: The text to encrypt.
-    :param public_pem: The PEM-encoded public key.
+    :param public_pem: The PEM-encoded public key or a loaded key object.
     :return: The Base64 encoded ciphertext.
     :raises ValueError: On encryption failure.
     """
     try:
-        public_key = serialization.load_pem_public_key(public_pem.encode())
+        public_key = _public_key(public_pem)
         if not isinstance(public_key, dh.DHPublicKey):
             raise TypeError("Public key is not a valid DH (ElGamal) key.")
-        parameters = public_key.parameters()
-        ephemeral_private_key = parameters.generate_private_key()
+        ephemeral_private_key = _elgamal_parameters(public_key).generate_private_key()
         shared_key = ephemeral_private_key.exchange(public_key)
         derived_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b'elgamal-dhies-encryption').derive(shared_key)
+        width = (public_key.key_size + 7) // 8
+        y = ephemeral_private_key.public_key().public_numbers().y
+        header = bytes([0, ELGAMAL_COMPACT_VERSION]) + y.to_bytes(width, 'big')
         iv = os.urandom(12)
         encryptor = Cipher(algorithms.AES(derived_key), modes.GCM(iv)).encryptor()
+        encryptor.authenticate_additional_data(header)
         ciphertext = encryptor.update(plaintext.encode()) + encryptor.finalize()
-        ephemeral_public_pem = ephemeral_private_key.public_key().public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        key_len_bytes = len(ephemeral_public_pem).to_bytes(2, 'big')
-        tag = encryptor.tag
-
-        return base64.b64encode(key_len_bytes + ephemeral_public_pem + iv + tag + ciphertext).decode()
+        return base64.b64encode(header + iv + encryptor.tag + ciphertext).decode()
     except Exception as e:
         raise ValueError(f"ElGamal encryption failed: {e}")
 
@@ -1335,32 +1706,49 @@ def elgamal_encrypt(plaintext: str, public_pem: str) -> str:
 def elgamal_decrypt(ciphertext_b64: str, private_pem: str) -> str:
     """Decrypts text using an ElGamal/DH private key (DHIES).
 
+    Accepts both the compact format and the older format that embeds the
+    ephemeral key as a length-prefixed PEM block.
+
     :param ciphertext_b64: The Base64 encoded ciphertext.
-    :param private_pem: The PEM-encoded private key.
+    :param private_pem: The PEM-encoded private key or a loaded key object.
     :return: The decrypted plaintext.
     :raises ValueError: On decryption failure.
     """
     try:
-        private_key = serialization.load_pem_private_key(private_pem.encode(), password=None)
+        private_key = _private_key(private_pem)
         if not isinstance(private_key, dh.DHPrivateKey):
             raise TypeError("Private key is not a valid DH (ElGamal) key.")
-            
-        data = base64.b64decode(ciphertext_b64)
 
-        # Unbundle components
-        key_len = int.from_bytes(data[:2], 'big')
-        ephemeral_public_pem = data[2:2 + key_len]
-        iv = data[2 + key_len : 2 + key_len + 12]
-        tag = data[2 + key_len + 12 : 2 + key_len + 12 + 16]
-        ciphertext = data[2 + key_len + 12 + 16:]
+        data = base64.b64decode(ciphertext_b64)
+        aad = None
+
+        if data[:1] == b"\x00":
+            if data[1:2] != bytes([ELGAMAL_COMPACT_VERSION]):
+                raise ValueError("Unsupported ciphertext version")
+            parameter_numbers = private_key.parameters().parameter_numbers()
+            width = (private_key.key_size + 7) // 8
+            offset = 2 + width
+            y = int.from_bytes(data[2:offset], 'big')
+            if len(data) < offset + 28 or not 1 < y < parameter_numbers.p - 1:
+                raise ValueError("Invalid ephemeral public value")
+            ephemeral_public_key = dh.DHPublicNumbers(y, parameter_numbers).public_key()
+            aad = data[:offset]
+        else:
+            key_len = int.from_bytes(data[:2], 'big')
+            offset = 2 + key_len
+            ephemeral_public_key = serialization.load_pem_public_key(data[2:offset])
 
-        ephemeral_public_key = serialization.load_pem_public_key(ephemeral_public_pem)
+        iv = data[offset:offset + 12]
+        tag = data[offset + 12:offset + 12 + 16]
+        ciphertext = data[offset + 12 + 16:]
 
         shared_key = private_key.exchange(ephemeral_public_key)
         derived_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b'elgamal-dhies-encryption').derive(shared_key)
 
         cipher = Cipher(algorithms.AES(derived_key), modes.GCM(iv, tag))
         decryptor = cipher.decryptor()
+        if aad is not None:
+            decryptor.authenticate_additional_data(aad)
         plaintext = decryptor.update(ciphertext) + decryptor.finalize()
         return plaintext.decode()
     except Exception as e:
@@ -1379,6 +1767,162 @@ def _wrap_base64_body(body: str, header: str) -> str:
     return f"-----BEGIN {header}-----\n" + "\n".join(lines) + f"\n-----END {header}-----\n"
 
 
+KEY_CACHE_SIZE = 128
+_key_cache = OrderedDict()
+_key_cache_lock = threading.Lock()
+_PEM_BLOCK = re.compile(r"-----BEGIN ([A-Z0-9 ]+)-----(.*?)-----END \1-----", re.S)
+
+
+def _der_header(der: bytes, pos: int) -> tuple[int, int, int]:
+    """Reads a DER tag and length at pos and returns (tag, content_start, content_length)."""
+    tag, length = der[pos], der[pos + 1]
+    pos += 2
+    if length & 0x80:
+        size = length & 0x7F
+        length = int.from_bytes(der[pos:pos + size], 'big')
+        pos += size
+    return tag, pos, length
+
+
+def _der_key_format(der: bytes) -> tuple[str, str]:
+    """Identifies a DER key from the tags of its top-level SEQUENCE.
+
+    SubjectPublicKeyInfo is SEQUENCE { SEQUENCE, BIT STRING }, PKCS#8 starts
+    with INTEGER, SEQUENCE, SEC1 EC keys with INTEGER, OCTET STRING, and
+    PKCS#1 RSA keys are all INTEGERs (two for public, nine for private).
+
+    :param der: The DER-encoded key.
+    :return: A tuple of (key_type, pem_label).
+    :raises ValueError: If the structure is not a known key format.
+    """
+    try:
+        tag, pos, length = _der_header(der, 0)
+        if tag != 0x30:
+            raise ValueError("not a SEQUENCE")
+        end = min(pos + length, len(der))
+        tags = []
+        while pos < end:
+            tag, start, length = _der_header(der, pos)
+            tags.append(tag)
+            pos = start + length
+    except IndexError:
+        raise ValueError("Truncated key structure")
+    if tags[:2] == [0x30, 0x03]:
+        return "public", "PUBLIC KEY"
+    if tags[:2] == [0x30, 0x04]:
+        return "private", "ENCRYPTED PRIVATE KEY"
+    if tags[:2] == [0x02, 0x30]:
+        return "private", "PRIVATE KEY"
+    if tags[:2] == [0x02, 0x04]:
+        return "private", "EC PRIVATE KEY"
+    if tags == [0x02, 0x02]:
+        return "public", "RSA PUBLIC KEY"
+    if len(tags) >= 9 and set(tags) == {0x02}:
+        return "private", "RSA PRIVATE KEY"
+    raise ValueError("Unrecognized key structure")
+
+
+def _load_key_entry(key_text: str, password: str = None) -> tuple:
+    """Loads a key and returns (key_object, key_type, pem_text), caching by fingerprint."""
+    if not key_text or not key_text.strip():
+        raise ValueError("Empty key")
+    s = key_text.strip().replace("\\n", "\n")
+    match = _PEM_BLOCK.search(s) if "-----BEGIN " in s else None
+    if match:
+        label, body = match.group(1), match.group(2)
+    elif "-----BEGIN " in s:
+        raise ValueError("Malformed PEM block")
+    else:
+        label, body = None, s
+    # Traditional encrypted PEM carries Proc-Type/DEK-Info headers and
+    # cannot be reduced to DER without the password.
+    headers = ":" in body
+    try:
+        der = s.encode() if headers else base64.b64decode("".join(body.split()), validate=True)
+    except ValueError:
+        raise ValueError("Key is not valid Base64")
+    fingerprint = hashlib.sha256(der + b"\x00" + (password or "").encode()).digest()
+
+    with _key_cache_lock:
+        entry = _key_cache.get(fingerprint)
+        if entry is not None:
+            _key_cache.move_to_end(fingerprint)
+            return entry
+
+    pwd = password.encode() if password else None
+    try:
+        if headers:
+            key, key_type = serialization.load_pem_private_key(der, password=pwd), "private"
+            pem = s
+        else:
+            key_type, der_label = _der_key_format(der)
+            if key_type == "public":
+                key = serialization.load_der_public_key(der)
+            else:
+                key = serialization.load_der_private_key(der, password=pwd)
+            pem = s if label else _wrap_base64_body(body, der_label)
+    except (ValueError, TypeError, UnsupportedAlgorithm) as e:
+        raise ValueError(f"Could not load key: {e}")
+    entry = (key, key_type, pem if pem.endswith("\n") else pem + "\n")
+
+    with _key_cache_lock:
+        _key_cache[fingerprint] = entry
+        while len(_key_cache) > KEY_CACHE_SIZE:
+            _key_cache.popitem(last=False)
+    return entry
+
+
+def load_key(key_text: str, password: str = None):
+    """Loads a PEM key or raw Base64 key body into a key object.
+
+    The key type is read from the DER structure instead of trying each loader,
+    and loaded keys are kept in a bounded LRU cache keyed by a SHA-256
+    fingerprint of the decoded key, so repeated calls with the same key are cheap.
+
+    :param key_text: A full PEM block or a raw Base64 body.
+    :param password: The password for an encrypted private key.
+    :return: A tuple of (key_object, key_type), where key_type is 'public' or 'private'.
+    :raises ValueError: If the key cannot be parsed.
+    """
+    key, key_type, _ = _load_key_entry(key_text, password)
+    return key, key_type
+
+
+def load_keys(key_text: str, password: str = None) -> list:
+    """Loads every PEM block in key_text (or a single raw Base64 body) into key objects.
+
+    :param key_text: One or more PEM blocks, or a raw Base64 body.
+    :param password: The password for encrypted private keys.
+    :return: A list of key objects in the order they appear.
+    :raises ValueError: If any key cannot be parsed.
+    """
+    text = (key_text or "").replace("\\n", "\n")
+    blocks = [match.group(0) for match in _PEM_BLOCK.finditer(text)]
+    return [load_key(block, password)[0] for block in blocks or [text]]
+
+
+def clear_key_cache() -> None:
+    """Empties the loaded-key cache."""
+    with _key_cache_lock:
+        _key_cache.clear()
+
+
+def _public_key(key, password: str = None):
+    """Returns a public key object from PEM text, a public key or a private key."""
+    if isinstance(key, (str, bytes)):
+        key = load_key(key.decode() if isinstance(key, bytes) else key, password)[0]
+    return key.public_key() if hasattr(key, "public_key") else key
+
+
+def _private_key(key, password: str = None):
+    """Returns a private key object from PEM text or a private key."""
+    if isinstance(key, (str, bytes)):
+        key, key_type = load_key(key.decode() if isinstance(key, bytes) else key, password)
+        if key_type != "private":
+            raise ValueError("A private key is required")
+    return key
+
+
 def parse_pem_and_type(key_text: str) -> tuple[str, str]:
     """Parses a string to identify and format it as a PEM key.
 
@@ -1391,38 +1935,62 @@ def parse_pem_and_type(key_text: str) -> tuple[str, str]:
     """
     if not key_text or not key_text.strip():
         raise ValueError("Empty key")
-    s = key_text.strip().replace("\\n", "\n")
-    if "-----BEGIN " in s and "-----END " in s:
-        try:
-            serialization.load_pem_private_key(s.encode(), password=None)
-            return (s if s.endswith("\n") else s + "\n", "private")
-        except Exception:
-            pass
-        try:
-            serialization.load_pem_public_key(s.encode())
-            return (s if s.endswith("\n") else s + "\n", "public")
-        except Exception:
-            pass
-        raise ValueError(
-            "PEM found but type not recognized (neither private nor public)")
-    body = "".join(s.split())
-    for header in ("RSA PRIVATE KEY", "PRIVATE KEY"):
-        cand = _wrap_base64_body(body, header)
-        try:
-            serialization.load_pem_private_key(cand.encode(), password=None)
-            return (cand, "private")
-        except Exception:
-            pass
-    cand = _wrap_base64_body(body, "PUBLIC KEY")
     try:
-        serialization.load_pem_public_key(cand.encode())
-        return (cand, "public")
-    except Exception:
-        pass
-    raise ValueError("Could not interpret key as public or private PEM")
-
-
-ph = PasswordHasher()
+        _, key_type, pem = _load_key_entry(key_text)
+    except ValueError:
+        if "-----BEGIN " in key_text and "-----END " in key_text:
+            raise ValueError(
+                "PEM found but type not recognized (neither private nor public)")
+        raise ValueError("Could not interpret key as public or private PEM")
+    return pem, key_type
+
+
+ph = PasswordHasher(**KDF_PARAMETERS["argon2"])
+
+
+def _check_kdf_parameters(name: str, values: dict) -> None:
+    """Raises ValueError if the cost parameters of one KDF are out of range."""
+    if name == "bcrypt":
+        if not 4 <= values["rounds"] <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+    elif name in ("scrypt", "derive_key"):
+        n = values["n"]
+        if n < 2 or n & (n - 1):
+            raise ValueError(f"{name} n must be a power of two greater than 1")
+        if values["r"] < 1 or values["p"] < 1 or values["r"] * values["p"] >= 2**30:
+            raise ValueError(f"{name} r and p must be positive with r * p < 2**30")
+        # Ciphertexts record their cost, so derive_key stays within what decryption accepts.
+        if name == "derive_key" and (n > 1 << MAX_DERIVE_KEY_LOG_N or
+                                     128 * values["r"] * n * values["p"] > MAX_DERIVE_KEY_WORK):
+            raise ValueError(f"derive_key needs n <= 2**{MAX_DERIVE_KEY_LOG_N} and "
+                             f"128 * r * n * p <= {MAX_DERIVE_KEY_WORK} bytes")
+    elif min(values.values()) < 1:
+        raise ValueError(f"{name} parameters must be positive")
+
+
+def set_kdf_parameters(parameters: dict) -> None:
+    """Replaces the cost parameters of bcrypt, scrypt, Argon2 and derive_key.
+
+    :param parameters: A mapping like KDF_PARAMETERS; missing algorithms and
+                       fields keep their current values.
+    :raises ValueError: If an algorithm or field is unknown, or a value is out of range.
+    """
+    global ph
+    updated = {name: dict(values) for name, values in KDF_PARAMETERS.items()}
+    for name, values in (parameters or {}).items():
+        if name not in updated:
+            raise ValueError(f"Unknown KDF: {name}")
+        unknown = set(values) - set(updated[name])
+        if unknown:
+            raise ValueError(f"Unknown {name} parameters: {', '.join(sorted(unknown))}")
+        updated[name].update({key: int(value) for key, value in values.items()})
+        _check_kdf_parameters(name, updated[name])
+    try:
+        hasher = PasswordHasher(**updated["argon2"])
+    except Exception as e:
+        raise ValueError(f"Invalid Argon2 parameters: {e}")
+    KDF_PARAMETERS.update(updated)
+    ph = hasher
 
 
 def sha3_hash(text: str) -> str:
@@ -1468,36 +2036,46 @@ def bcrypt_hash(text: str) -> str:
     :return: The full bcrypt hash string including salt and parameters.
     """
     try:
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(text.encode(), salt)
-        return hashed.decode()
+        return _bcrypt_hash(text)
     except Exception as e:
         return f"{ERROR_MESSAGES.get('custom', 'Error')} bcrypt: {e}"
 
 
-def scrypt_hash(text: str, salt: bytes = None) -> str:
+def _bcrypt_hash(text: str) -> str:
+    salt = bcrypt.gensalt(rounds=KDF_PARAMETERS["bcrypt"]["rounds"])
+    return bcrypt.hashpw(text.encode(), salt).decode()
+
+
+def scrypt_hash(text: str, salt: bytes = None, n: int = None, r: int = None, p: int = None) -> str:
     """Hashes text using the scrypt algorithm.
 
     :param text: The input string.
     :param salt: An optional salt; if not provided, a new one is generated.
+    :param n: The CPU/memory cost (defaults to KDF_PARAMETERS["scrypt"]).
+    :param r: The block size (defaults to KDF_PARAMETERS["scrypt"]).
+    :param p: The parallelization factor (defaults to KDF_PARAMETERS["scrypt"]).
     :return: The hex-encoded scrypt hash.
     """
     try:
-        if salt is None:
-            salt = bcrypt.gensalt()
-        kdf = Scrypt(
-            salt=salt,
-            length=32,
-            n=2**14,
-            r=8,
-            p=1,
-        )
-        key = kdf.derive(text.encode())
-        return key.hex()
+        return _scrypt_hash(text, salt, n, r, p)
     except Exception as e:
         return f"{ERROR_MESSAGES.get('custom', 'Error')} scrypt: {e}"
 
 
+def _scrypt_hash(text: str, salt: bytes = None, n: int = None, r: int = None, p: int = None) -> str:
+    if salt is None:
+        salt = bcrypt.gensalt()
+    params = KDF_PARAMETERS["scrypt"]
+    kdf = Scrypt(
+        salt=salt,
+        length=32,
+        n=n or params["n"],
+        r=r or params["r"],
+        p=p or params["p"],
+    )
+    return kdf.derive(text.encode()).hex()
+
+
 def argon2_hash(text: str) -> str:
     """Hashes text using the Argon2 algorithm.
 
@@ -1505,11 +2083,139 @@ def argon2_hash(text: str) -> str:
     :return: The full Argon2 hash string including salt and parameters.
     """
     try:
-        return ph.hash(text)
+        return _argon2_hash(text)
     except Exception as e:
         return f"{ERROR_MESSAGES.get('custom', 'Error')} Argon2: {e}"
 
 
+def _argon2_hash(text: str) -> str:
+    # Looks ph up on each call, since set_kdf_parameters() replaces it.
+    return ph.hash(text)
+
+
+def bcrypt_verify(text: str, hashed: str) -> bool:
+    """Checks text against a bcrypt hash.
+
+    :param text: The candidate password.
+    :param hashed: The full bcrypt hash string.
+    :return: True if the password matches, False otherwise (including malformed hashes).
+    """
+    try:
+        return bcrypt.checkpw(text.encode(), hashed.encode())
+    except ValueError:
+        return False
+
+
+def scrypt_verify(text: str, hashed: str, salt: bytes, n: int = None, r: int = None, p: int = None) -> bool:
+    """Checks text against a hex-encoded scrypt hash.
+
+    :param text: The candidate password.
+    :param hashed: The hex-encoded hash returned by scrypt_hash.
+    :param salt: The salt the hash was created with.
+    :param n: The CPU/memory cost the hash was created with (defaults to KDF_PARAMETERS["scrypt"]).
+    :param r: The block size the hash was created with.
+    :param p: The parallelization factor the hash was created with.
+    :return: True if the password matches, False otherwise (including malformed hashes).
+    :raises ValueError: If scrypt rejects the cost parameters.
+    """
+    try:
+        expected = bytes.fromhex(hashed.strip())
+    except ValueError:
+        return False
+    return hmac.compare_digest(bytes.fromhex(_scrypt_hash(text, salt, n, r, p)), expected)
+
+
+def argon2_verify(text: str, hashed: str) -> bool:
+    """Checks text against an Argon2 hash string.
+
+    :param text: The candidate password.
+    :param hashed: The full Argon2 hash string.
+    :return: True if the password matches, False otherwise (including malformed hashes).
+    """
+    try:
+        return ph.verify(hashed, text)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def _scrypt_memory() -> int:
+    params = KDF_PARAMETERS["scrypt"]
+    return 128 * params["r"] * params["n"]
+
+
+def _argon2_memory() -> int:
+    return ph.memory_cost * 1024
+
+
+# The hash functions raise on failure, unlike the public *_hash wrappers that return an error string.
+PASSWORD_HASHERS = {
+    "bcrypt": (_bcrypt_hash, bcrypt_verify, lambda: 4096),
+    "scrypt": (_scrypt_hash, scrypt_verify, _scrypt_memory),
+    "Argon2": (_argon2_hash, argon2_verify, _argon2_memory),
+}
+
+
+def _password_hasher(algorithm: str):
+    try:
+        return PASSWORD_HASHERS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unsupported password hash algorithm: {algorithm}")
+
+
+def _hash_with_salt(item):
+    hash_fn, text = item
+    try:
+        if hash_fn is _scrypt_hash:
+            salt = secrets.token_bytes(16)
+            return hash_fn(text, salt), salt
+        return hash_fn(text), None
+    except Exception as e:
+        return None, str(e)
+
+
+def batch_hash_passwords(passwords, algorithm: str = "bcrypt", max_workers: int = None,
+                         memory_budget: int = None):
+    """Hashes many passwords in parallel and yields results as they complete.
+
+    bcrypt, scrypt and Argon2 release the GIL while hashing, so a thread pool
+    scales with the cores. The pool is further capped so that the workers'
+    combined memory cost (about 16 MiB per scrypt call, ph.memory_cost per
+    Argon2 call) stays within memory_budget.
+
+    :param passwords: An iterable of passwords; it is consumed lazily.
+    :param algorithm: "bcrypt", "scrypt" or "Argon2".
+    :param max_workers: An upper bound on the number of threads.
+    :param memory_budget: The memory in bytes the workers may use together.
+    :return: A generator of (index, hashed, salt) tuples in completion order;
+             salt is the generated salt for scrypt and None otherwise. When a
+             password cannot be hashed (e.g. longer than bcrypt's 72 bytes),
+             hashed is None and the third item is the error message.
+    :raises ValueError: If the algorithm is unknown.
+    """
+    hash_fn, _, memory = _password_hasher(algorithm)
+    workers = worker_count(max_workers, memory(), memory_budget)
+    items = ((hash_fn, text) for text in passwords)
+    for index, (hashed, salt) in imap_unordered(_hash_with_salt, items, workers):
+        yield index, hashed, salt
+
+
+def batch_verify_passwords(entries, algorithm: str = "bcrypt", max_workers: int = None,
+                           memory_budget: int = None):
+    """Verifies many passwords in parallel and yields results as they complete.
+
+    :param entries: An iterable of (password, hashed) pairs, or
+                    (password, hashed, salt) triples for scrypt.
+    :param algorithm: "bcrypt", "scrypt" or "Argon2".
+    :param max_workers: An upper bound on the number of threads.
+    :param memory_budget: The memory in bytes the workers may use together.
+    :return: A generator of (index, matches) tuples in completion order.
+    :raises ValueError: If the algorithm is unknown.
+    """
+    _, verify_fn, memory = _password_hasher(algorithm)
+    workers = worker_count(max_workers, memory(), memory_budget)
+    yield from imap_unordered(lambda entry: verify_fn(*entry), entries, workers)
+
+
 def md5_checksum(text: str) -> str:
     """Calculates the MD5 checksum for a given text.
 
@@ -1555,6 +2261,212 @@ def adler32_checksum(text: str) -> str:
         raise ValueError(f"Adler-32 checksum failed: {e}")
 
 
+CHECKSUM_CHUNK_SIZE = 1 << 20
+ADLER32_BASE = 65521
+
+
+def _gf2_matrix_times(mat: list[int], vec: int) -> int:
+    """Multiplies a 32x32 GF(2) matrix by a 32-bit vector.
+
+    :param mat: The matrix as a list of 32 column bit masks.
+    :param vec: The vector as an integer.
+    :return: The product vector.
+    """
+    result = 0
+    i = 0
+    while vec:
+        if vec & 1:
+            result ^= mat[i]
+        vec >>= 1
+        i += 1
+    return result
+
+
+def _gf2_matrix_square(mat: list[int]) -> list[int]:
+    """Squares a 32x32 GF(2) matrix.
+
+    :param mat: The matrix as a list of 32 column bit masks.
+    :return: The squared matrix.
+    """
+    return [_gf2_matrix_times(mat, mat[n]) for n in range(32)]
+
+
+@functools.lru_cache(maxsize=64)
+def _crc32_zeros_operator(length: int) -> tuple[int, ...]:
+    """Builds the GF(2) operator that advances a CRC32 over length zero bytes.
+
+    :param length: The number of zero bytes.
+    :return: The operator as a tuple of 32 column bit masks.
+    """
+    # Operator for a single zero bit, squared three times: one zero byte.
+    power = [0xEDB88320] + [1 << n for n in range(31)]
+    for _ in range(3):
+        power = _gf2_matrix_square(power)
+    operator = None
+    while length:
+        if length & 1:
+            operator = power if operator is None else [
+                _gf2_matrix_times(power, column) for column in operator]
+        length >>= 1
+        if length:
+            power = _gf2_matrix_square(power)
+    return tuple(operator)
+
+
+def crc32_combine(crc1: int, crc2: int, len2: int) -> int:
+    """Combines two CRC32 values as if their data had been concatenated.
+
+    This follows zlib's crc32_combine(): the first CRC is advanced over len2
+    zero bytes with a GF(2) operator built by repeated squaring, then the
+    second CRC is xored in. Operators are cached per length, so folding many
+    equally sized chunks costs one 32-step product each.
+
+    :param crc1: The CRC32 of the first block.
+    :param crc2: The CRC32 of the second block.
+    :param len2: The length in bytes of the second block.
+    :return: The CRC32 of the first block followed by the second.
+    """
+    if len2 <= 0:
+        return crc1
+    return (_gf2_matrix_times(_crc32_zeros_operator(len2), crc1) ^ crc2) & 0xFFFFFFFF
+
+
+def adler32_combine(adler1: int, adler2: int, len2: int) -> int:
+    """Combines two Adler-32 values as if their data had been concatenated.
+
+    This is the zlib adler32_combine() algorithm.
+
+    :param adler1: The Adler-32 of the first block.
+    :param adler2: The Adler-32 of the second block.
+    :param len2: The length in bytes of the second block.
+    :return: The Adler-32 of the first block followed by the second.
+    """
+    if len2 < 0:
+        return 0xFFFFFFFF
+    rem = len2 % ADLER32_BASE
+    sum1 = adler1 & 0xFFFF
+    sum2 = (rem * sum1) % ADLER32_BASE
+    sum1 += (adler2 & 0xFFFF) + ADLER32_BASE - 1
+    sum2 += ((adler1 >> 16) & 0xFFFF) + ((adler2 >> 16) & 0xFFFF) + ADLER32_BASE - rem
+    if sum1 >= ADLER32_BASE:
+        sum1 -= ADLER32_BASE
+    if sum1 >= ADLER32_BASE:
+        sum1 -= ADLER32_BASE
+    if sum2 >= (ADLER32_BASE << 1):
+        sum2 -= (ADLER32_BASE << 1)
+    if sum2 >= ADLER32_BASE:
+        sum2 -= ADLER32_BASE
+    return sum1 | (sum2 << 16)
+
+
+def _chunked_checksum(data, value: int, checksum, combine, empty: int,
+                      chunk_size: int, max_workers: int = None) -> int:
+    """Computes a combinable checksum over data split into chunks.
+
+    zlib releases the GIL while checksumming large buffers, so the chunks are
+    processed on a thread pool and folded together in order with combine().
+
+    :param data: A bytes-like object.
+    :param value: The running checksum of the data that precedes this block.
+    :param checksum: zlib.crc32 or zlib.adler32.
+    :param combine: crc32_combine or adler32_combine.
+    :param empty: The checksum of zero bytes for this algorithm.
+    :param chunk_size: The size in bytes of each chunk.
+    :param max_workers: The number of threads (defaults to the CPU count).
+    :return: The checksum of the prefix followed by data.
+    """
+    view = memoryview(data).cast("B")
+    length = len(view)
+    if length <= chunk_size:
+        return checksum(view, value) & 0xFFFFFFFF
+    chunks = [view[i:i + chunk_size] for i in range(0, length, chunk_size)]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        partials = executor.map(lambda chunk: checksum(chunk, empty) & 0xFFFFFFFF, chunks)
+        for chunk, part in zip(chunks, partials):
+            value = combine(value, part, len(chunk))
+    return value & 0xFFFFFFFF
+
+
+def crc32_chunked(data, value: int = 0, chunk_size: int = CHECKSUM_CHUNK_SIZE,
+                  max_workers: int = None) -> int:
+    """Calculates a CRC32 checksum over data using several threads.
+
+    :param data: A bytes-like object.
+    :param value: An existing CRC32 to append data to (0 to start afresh).
+    :param chunk_size: The size in bytes of each chunk.
+    :param max_workers: The number of threads (defaults to the CPU count).
+    :return: The CRC32 as an integer, identical to zlib.crc32(data, value).
+    """
+    return _chunked_checksum(data, value, zlib.crc32, crc32_combine, 0,
+                             chunk_size, max_workers)
+
+
+def adler32_chunked(data, value: int = 1, chunk_size: int = CHECKSUM_CHUNK_SIZE,
+                    max_workers: int = None) -> int:
+    """Calculates an Adler-32 checksum over data using several threads.
+
+    :param data: A bytes-like object.
+    :param value: An existing Adler-32 to append data to (1 to start afresh).
+    :param chunk_size: The size in bytes of each chunk.
+    :param max_workers: The number of threads (defaults to the CPU count).
+    :return: The Adler-32 as an integer, identical to zlib.adler32(data, value).
+    """
+    return _chunked_checksum(data, value, zlib.adler32, adler32_combine, 1,
+                             chunk_size, max_workers)
+
+
+def _file_checksum(path: str, offset: int, chunked, value: int,
+                   chunk_size: int, max_workers: int = None) -> int:
+    """Runs a chunked checksum over a memory-mapped file.
+
+    :param path: The path of the file.
+    :param offset: The number of leading bytes already covered by value.
+    :param chunked: crc32_chunked or adler32_chunked.
+    :param value: The checksum of the first offset bytes.
+    :param chunk_size: The size in bytes of each chunk.
+    :param max_workers: The number of threads (defaults to the CPU count).
+    :return: The checksum of the whole file.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= offset:
+            return value
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return chunked(view[offset:], value, chunk_size, max_workers)
+
+
+def crc32_file(path: str, value: int = 0, offset: int = 0,
+               chunk_size: int = CHECKSUM_CHUNK_SIZE, max_workers: int = None) -> int:
+    """Calculates the CRC32 of a file, optionally resuming from a known prefix.
+
+    Passing the CRC32 and length of a previously checksummed prefix (for
+    example a log file before it grew) only reads the bytes after offset.
+
+    :param path: The path of the file.
+    :param value: The CRC32 of the first offset bytes.
+    :param offset: The number of leading bytes already covered by value.
+    :param chunk_size: The size in bytes of each chunk.
+    :param max_workers: The number of threads (defaults to the CPU count).
+    :return: The CRC32 of the whole file as an integer.
+    """
+    return _file_checksum(path, offset, crc32_chunked, value, chunk_size, max_workers)
+
+
+def adler32_file(path: str, value: int = 1, offset: int = 0,
+                 chunk_size: int = CHECKSUM_CHUNK_SIZE, max_workers: int = None) -> int:
+    """Calculates the Adler-32 of a file, optionally resuming from a known prefix.
+
+    :param path: The path of the file.
+    :param value: The Adler-32 of the first offset bytes.
+    :param offset: The number of leading bytes already covered by value.
+    :param chunk_size: The size in bytes of each chunk.
+    :param max_workers: The number of threads (defaults to the CPU count).
+    :return: The Adler-32 of the whole file as an integer.
+    """
+    return _file_checksum(path, offset, adler32_chunked, value, chunk_size, max_workers)
+
+
 def sha1_hash(text: str) -> str:
     """Hashes text using the SHA-1 algorithm.
 
@@ -1571,6 +2483,33 @@ def sha1_hash(text: str) -> str:
         raise ValueError(f"SHA-1 hashing failed: {e}")
 
 
+HASH_ALGORITHMS = {
+    "MD5": hashlib.md5,
+    "SHA-1": hashlib.sha1,
+    "SHA-256": hashlib.sha256,
+    "SHA-512": hashlib.sha512,
+    "SHA-3": hashlib.sha3_256,
+}
+
+
+def file_digest(path: str, algorithm: str = "SHA-256") -> str:
+    """Hashes the contents of a file with one of the HASH_ALGORITHMS.
+
+    :param path: The path of the file.
+    :param algorithm: The algorithm name, as used by the hashing tabs.
+    :return: The hex-encoded digest.
+    :raises ValueError: If the algorithm is unknown or the file cannot be read.
+    """
+    try:
+        constructor = HASH_ALGORITHMS[algorithm]
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, constructor).hexdigest()
+    except KeyError:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    except Exception as e:
+        raise ValueError(f"{algorithm} file hashing failed: {e}")
+
+
 def convert_color(color_input: str, target_format: str) -> str:
     """Converts a color from one format to another.
 
@@ -105,6 +105,15 @@ ENGLISH_FREQUENCIES = {
     'Y': 0.01974, 'Z': 0.00074
 }
 
+COMMON_ENGLISH_WORDS = frozenset("""
+    the be to of and a in that have i it for not on with he as you do at this but his by from they
+    we say her she or an will my one all would there their what so up out if about who get which go
+    me when make can like time no just him know take people into year your good some could them see
+    other than then now look only come its over think also back after use two how our work first well
+    way even new want because any these give day most us is are was were has had been hello world
+    secret message flag key password text code cipher test data
+""".split())
+
 ERROR_MESSAGES = {
     "invalid_input": "Invalid Input",
     "decimal_to_binary": "Error Decimal→Binary: {e}",
@@ -208,12 +217,16 @@ SHORT_NAMES = {
     "Divisibility Checker": "DC",
     "Divisors Finder": "DF",
     "Factors Finder": "Factors",
+    "Directory Hash": "Dir Hash",
+    "Hash Identifier": "Hash ID",
+    "Range Properties": "Range Props",
     "Perfect Square Checker": "P. Square",
     "Perfect Cube Checker": "P. Cube",
     "Num to Roman": "Num",
     "Roman to Num": "Roman",
     "Character Frequency": "Frequency",
     "Repeated sequences detection": "Repeated",
+    "Entropy Profile": "Profile",
     "Extract Num": "Extract",
     "Number Frequency": "Frequency",
     "Temperature": "Temp",
@@ -274,7 +287,10 @@ PRESERVE_NEWLINES_MODES = [
     "Random Equation Generator",
     "Random ID Generator",
     "Random IP adress Generator",
-    "Coprimes Generator"
+    "Coprimes Generator",
+    "Prime numbers",
+    "Triangular numbers",
+    "Range Properties"
 ]
 
 FULL_NAMES = {v: k for k, v in SHORT_NAMES.items()}
@@ -299,6 +315,8 @@ MENU_STRUCTURE = {
             ("Random Letters Generator", "Enter length"),
             ("Random Number Generator", "Enter length"),
             ("Coprimes Generator", "Enter first n"),
+            ("Prime numbers", "Enter n or a range a-b"),
+            ("Triangular numbers", "Enter first n"),
             ("Random ID Generator", "Enter how many IDs"),
             ("Random IP adress Generator", "Enter how many IP adresses"),
             ("Random Equation Generator", "Enter number")
@@ -382,11 +400,15 @@ MENU_STRUCTURE = {
         "RSA": [
             ("RSA Encrypt", "Enter text"),
             ("RSA Decrypt", "Enter text"),
+            ("RSA Sign", "Enter messages (one per line)"),
+            ("RSA Verify", "Enter signed lines"),
             ("Generate RSA Keys", "Enter key size (e.g., 2048)")
         ],
         "ECC": [
             ("ECC Encrypt", "Enter text"),
             ("ECC Decrypt", "Enter text"),
+            ("ECC Sign", "Enter messages (one per line)"),
+            ("ECC Verify", "Enter signed lines"),
             ("Generate ECC Keys", "Select curve")
         ],
         "ElGamal": [
@@ -414,7 +436,9 @@ MENU_STRUCTURE = {
             ("MD5", "Enter text"),
             ("CRC32", "Enter text"),
             ("Adler-32", "Enter text"),
-            ("SHA-1", "Enter text")
+            ("SHA-1", "Enter text"),
+            ("Directory Hash", "Enter directory path"),
+            ("Hash Identifier", "Enter hash")
         ],
         "Unit Converter": [
             ("Length", "Enter length"),
@@ -439,13 +463,15 @@ MENU_STRUCTURE = {
             ("Characters", "Enter Text"),
             ("Character Frequency", "Enter Text"),
             ("Repeated sequences detection", "Enter Text"),
-            ("Entropy", "Enter Text")
+            ("Entropy", "Enter Text"),
+            ("Entropy Profile", "Enter text or file path")
         ],
         "Number analysis": [
             ("Extract Num", "Enter Numbers"),
             ("Number Frequency", "Enter Numbers"),
             ("Basic Statistics", "Enter Numbers"), 
-            ("Special Properties", "Enter Numbers")
+            ("Special Properties", "Enter Numbers"),
+            ("Range Properties", "Enter a range a-b")
         ],
         "layout": "grid",
         "margins": (5, 5, 5, 10)
@@ -1224,7 +1250,18 @@ alphabet_base58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 alphabet_base62 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 alphabet_base36 = digits[:36]
 Bases_set = {2, 8, 10, 16, 32, 36, 58, 62, 64, 85, -1}
-ELGAMAL_PARAMETERS = {}
+ELGAMAL_PARAMETERS = {
+    # The 2048-bit MODP group from RFC 3526.
+    "p": 0xFFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F14374FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7EDEE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF0598DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3BE39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF6955817183995497CEA956AE515D2261898FA051015728E5A8AACAA68FFFFFFFFFFFFFFFF,
+    "g": 2,
+}
+KDF_PARAMETERS = {
+    "bcrypt": {"rounds": 12},
+    "scrypt": {"n": 2**14, "r": 8, "p": 1},
+    "argon2": {"time_cost": 3, "memory_cost": 65536, "parallelism": 4},
+    "derive_key": {"n": 2**14, "r": 8, "p": 1},
+}
+KEY_POOL_SETTINGS = {"enabled": True, "low_watermark": 2, "high_watermark": 8}
 characters = string.ascii_letters + string.digits + string.punctuation
 max_length = 100_000
 max_length_1 = 500_000
@@ -3,7 +3,7 @@ from .data import (
 )
 from .analyzers import (
     detect_cipher,
-    character_stats, format_character_stats, extract_numbers, number_analysis,
+    character_stats, format_character_stats, format_extracted_numbers, number_analysis,
     format_number_analysis, number_frequency_analysis, format_number_frequency, format_special_properties,
     character_frequency_analysis, format_character_frequency, format_entropy_only, analyze_special_properties, calculate_basic_statistics, format_basic_statistics,
     detect_repeated_sequences,
@@ -16,9 +16,8 @@ from .converters import (
     rot_n_decrypt, ascii_encode, ascii_decode, utf_n_encode, utf_n_decode,
     iso_n_encode, iso_n_decode, vigenere_encrypt, vigenere_decrypt, aes_encrypt, aes_decrypt, chacha20_encrypt,
     chacha20_decrypt, des_encrypt, des_decrypt, triple_des_encrypt, triple_des_decrypt,
-    blowfish_encrypt, blowfish_decrypt, rsa_generate_keys, ecc_generate_keys,
-    elgamal_generate_keys, rsa_encrypt, rsa_decrypt, ecc_encrypt, ecc_decrypt,
-    elgamal_encrypt, elgamal_decrypt, parse_pem_and_type,
+    blowfish_encrypt, blowfish_decrypt, rsa_encrypt, rsa_decrypt, ecc_encrypt, ecc_decrypt,
+    elgamal_encrypt, elgamal_decrypt, load_key, load_keys, ecc_encrypt_multi,
     sha3_hash, sha256_hash, sha512_hash, bcrypt_hash, scrypt_hash, argon2_hash,
     md5_checksum, crc32_checksum, adler32_checksum, sha1_hash,
     decimal_to_custom_base, custom_base_to_decimal, word_to_basen, basen_to_word,
@@ -27,9 +26,17 @@ from .converters import (
 )
 from .generators import (
     password_generator, letters_generator, number_generator, random_id_generator,
-    random_ip_generator, generate_coprimes,
+    random_ip_generator, generate_coprimes, prime_numbers_generator, triangular_numbers_generator,
+    stream_chunks,
 )
 from .equation_generator import generate_multiple_equations
+from .integrity import hash_directory, format_directory_hash
+from .entropy_profile import analyze_entropy_profile, format_entropy_profile
+from .auto_decoder import auto_decode, format_auto_decode, decode_base_if_encoded
+from .hash_index import analyze_hash, format_hash_analysis
+from .range_properties import range_properties
+from .key_pool import get_keypair
+from .signing import sign_lines, verify_lines
 from .checkers import (
     is_prime_check, is_divisible, find_divisors, prime_factors,
     is_perfect_square, is_perfect_cube, syntax_analysis
@@ -83,22 +90,28 @@ def setup_conversion_map():
 
         "Generate RSA Keys": lambda text, base, **kwargs: (
             lambda keys: f"PRIVATE KEY:\n{keys[0]}\nPUBLIC KEY:\n{keys[1]}"
-        )(rsa_generate_keys(key_size=int(base))),
+        )(get_keypair("RSA", base)),
 
         "Generate ECC Keys": lambda text, base, **kwargs: (
             lambda keys: f"PRIVATE KEY:\n{keys[0]}\nPUBLIC KEY:\n{keys[1]}"
-        )(ecc_generate_keys(curve_name=base)),
+        )(get_keypair("ECC", base)),
 
         "Generate ElGamal Keys": lambda text, base, **kwargs: (
             lambda keys: f"PRIVATE KEY:\n{keys[0]}\nPUBLIC KEY:\n{keys[1]}"
-        )(elgamal_generate_keys(key_size=int(base or 2048))),
-
-        "RSA Encrypt": lambda text, base, **kwargs: rsa_encrypt(text, parse_pem_and_type(base)[0]),
-        "RSA Decrypt": lambda text, base, **kwargs: rsa_decrypt(text, parse_pem_and_type(base)[0]),
-        "ECC Encrypt": lambda text, base, **kwargs: ecc_encrypt(text, parse_pem_and_type(base)[0]),
-        "ECC Decrypt": lambda text, base, **kwargs: ecc_decrypt(text, parse_pem_and_type(base)[0]),
-        "ElGamal Encrypt": lambda text, base, **kwargs: elgamal_encrypt(text, parse_pem_and_type(base)[0]),
-        "ElGamal Decrypt": lambda text, base, **kwargs: elgamal_decrypt(text, parse_pem_and_type(base)[0]),
+        )(get_keypair("ElGamal", base)),
+
+        "RSA Encrypt": lambda text, base, **kwargs: rsa_encrypt(text, load_key(base)[0]),
+        "RSA Decrypt": lambda text, base, **kwargs: rsa_decrypt(text, load_key(base)[0]),
+        "ECC Encrypt": lambda text, base, **kwargs: (
+            lambda keys: ecc_encrypt(text, keys[0]) if len(keys) == 1 else ecc_encrypt_multi(text, keys)
+        )(load_keys(base)),
+        "ECC Decrypt": lambda text, base, **kwargs: ecc_decrypt(text, load_key(base)[0]),
+        "RSA Sign": lambda text, base, **kwargs: sign_lines(text, base, "RSA"),
+        "RSA Verify": lambda text, base, **kwargs: verify_lines(text, base, "RSA"),
+        "ECC Sign": lambda text, base, **kwargs: sign_lines(text, base, "ECC"),
+        "ECC Verify": lambda text, base, **kwargs: verify_lines(text, base, "ECC"),
+        "ElGamal Encrypt": lambda text, base, **kwargs: elgamal_encrypt(text, load_key(base)[0]),
+        "ElGamal Decrypt": lambda text, base, **kwargs: elgamal_decrypt(text, load_key(base)[0]),
 
         "SHA-3": lambda text, **kwargs: sha3_hash(text),
         "SHA-256": lambda text, **kwargs: sha256_hash(text), # ChaCha20 Encrypt/Decrypt are missing
@@ -111,6 +124,8 @@ def setup_conversion_map():
         "CRC32": lambda text, **kwargs: crc32_checksum(text),
         "Adler-32": lambda text, **kwargs: adler32_checksum(text),
         "SHA-1": lambda text, **kwargs: sha1_hash(text),
+        "Directory Hash": lambda text, **kwargs: format_directory_hash(hash_directory(text)),
+        "Hash Identifier": lambda text, **kwargs: format_hash_analysis(analyze_hash(text)),
 
         "P. Checker": lambda text, **kwargs: is_prime_check(text),
         "Divisibility Checker": lambda text, base, **kwargs: is_divisible(text, base),
@@ -131,24 +146,29 @@ def setup_conversion_map():
             else "No repeated sequences found"
         )(detect_repeated_sequences(text).get("repeated_sequences")),
         "Entropy": lambda text, **kwargs: format_entropy_only(character_frequency_analysis(text)),
-        "Extract Num": lambda text, **kwargs: f"Extracted numbers: {extract_numbers(text)}" if len(extract_numbers(text)) <= 20 else f"Extracted {len(extract_numbers(text))} numbers. First 20: {extract_numbers(text)[:20]}",
+        "Entropy Profile": lambda text, **kwargs: format_entropy_profile(analyze_entropy_profile(text)),
+        "Extract Num": lambda text, **kwargs: format_extracted_numbers(text),
         "Number Frequency": lambda text, **kwargs: format_number_frequency(number_frequency_analysis(text)),
         "Basic Statistics": lambda text, **kwargs: format_basic_statistics(calculate_basic_statistics(text)),
         "Special Properties": lambda text, **kwargs: format_special_properties(analyze_special_properties(text)),
+        "Range Properties": lambda text, **kwargs: range_properties(text),
 
         "Syntax Analysis": lambda text, mode, **kwargs: syntax_analysis(text, mode),
 
         "ASCII Art": lambda text, mode, **kwargs: text_to_ascii_art(text, font=mode),
         "Cipher Detection": lambda text, **kwargs: detect_cipher(text),
+        "Auto Decode": lambda text, **kwargs: format_auto_decode(auto_decode(text)),
     }
 
     conversion_map.update({
         "Random Password Generator": lambda text, **kwargs: password_generator(text),
         "Random Letters Generator": lambda text, **kwargs: letters_generator(text),
         "Random Number Generator": lambda text, **kwargs: number_generator(text),
-        "Random ID Generator": lambda text, **kwargs: "\n".join(random_id_generator(text)),
-        "Random IP adress Generator": lambda text, **kwargs: "\n".join(random_ip_generator(text)),
-        "Coprimes Generator": lambda text, **kwargs: ", ".join(map(str, generate_coprimes(text))),
+        "Random ID Generator": lambda text, **kwargs: stream_chunks(random_id_generator(text)),
+        "Random IP adress Generator": lambda text, **kwargs: stream_chunks(random_ip_generator(text)),
+        "Coprimes Generator": lambda text, **kwargs: stream_chunks(generate_coprimes(text), separator=", "),
+        "Prime numbers": lambda text, **kwargs: stream_chunks(prime_numbers_generator(text)),
+        "Triangular numbers": lambda text, **kwargs: stream_chunks(triangular_numbers_generator(text)),
         "Random Equation Generator": lambda text, **kwargs: generate_multiple_equations(text),
     })
     return conversion_map
@@ -238,10 +258,8 @@ def detect_conversion_type(text, tab_name, base=None, mode=None, mode2=None):
             elif mode == "Base → Text":
                 return basen_to_word(text, b)
             else:
-                if all(c.isprintable() and not c.isspace() for c in text):
-                    return word_to_basen(text, b)
-                else:
-                    return basen_to_word(text, b)
+                decoded = decode_base_if_encoded(text, b)
+                return decoded if decoded is not None else word_to_basen(text, b)
 
         raise ValueError(f"Conversion not supported: {tab_name}")
 
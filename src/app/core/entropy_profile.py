@@ -0,0 +1,216 @@
+import math
+import mmap
+import os
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_WINDOW = 4096
+HIGH_ENTROPY_THRESHOLD = 7.5
+SPARKLINE_CHARS = "▁▂▃▄▅▆▇█"
+# The NumPy path keeps one 256-bin histogram per block of gcd(window, stride)
+# bytes, so smaller blocks are profiled by the incremental Python loop.
+NUMPY_MIN_BLOCK = 256
+NUMPY_CHUNK_SIZE = 4 << 20
+
+
+def _window_starts(size: int, window: int, stride: int) -> list[int]:
+    """Returns the window offsets; the last window is aligned to the end so every byte is covered."""
+    starts = list(range(0, size - window + 1, stride))
+    if starts[-1] + window < size:
+        starts.append(size - window)
+    return starts
+
+
+def _profile_python(data, window: int, stride: int, count: int) -> tuple[list, list]:
+    """Profiles the first count regular windows, updating one histogram as the window slides."""
+    table = [0.0] + [c * math.log2(c) for c in range(1, window + 1)]
+    hist = [0] * 256
+    weighted = 0.0  # sum of c * log2(c) over the histogram
+    pairs = 0       # sum of c * (c - 1) over the histogram
+    entropies, ics = [], []
+    for i in range(count):
+        start = i * stride
+        if i == 0 or stride >= window:
+            hist = [0] * 256
+            for b in data[start:start + window]:
+                hist[b] += 1
+            weighted = sum(table[c] for c in hist)
+            pairs = sum(c * (c - 1) for c in hist)
+        else:
+            for b in data[start - stride:start]:
+                c = hist[b]
+                weighted += table[c - 1] - table[c]
+                pairs -= 2 * (c - 1)
+                hist[b] = c - 1
+            for b in data[start + window - stride:start + window]:
+                c = hist[b]
+                weighted += table[c + 1] - table[c]
+                pairs += 2 * c
+                hist[b] = c + 1
+        entropies.append(max(math.log2(window) - weighted / window, 0.0))
+        ics.append(pairs / (window * (window - 1)) if window > 1 else 0.0)
+    return entropies, ics
+
+
+def _profile_numpy(data, window: int, stride: int, count: int) -> tuple[list, list]:
+    """Profiles the first count regular windows from cumulative per-block histograms."""
+    array = np.frombuffer(data, dtype=np.uint8)
+    block = math.gcd(window, stride)
+    window_blocks, stride_blocks = window // block, stride // block
+    table = np.zeros(window + 1)
+    table[1:] = np.arange(1, window + 1) * np.log2(np.arange(1, window + 1))
+    batch = max(1, min(8192, (NUMPY_CHUNK_SIZE - window) // stride))
+    entropies, ics = [], []
+    for first in range(0, count, batch):
+        windows = min(batch, count - first)
+        begin = first * stride_blocks
+        blocks = (windows - 1) * stride_blocks + window_blocks
+        chunk = array[begin * block:(begin + blocks) * block]
+        index = np.repeat(np.arange(blocks, dtype=np.int64) * 256, block) + chunk
+        cumulative = np.zeros((blocks + 1, 256), dtype=np.int64)
+        np.cumsum(np.bincount(index, minlength=blocks * 256).reshape(blocks, 256), axis=0, out=cumulative[1:])
+        offsets = np.arange(windows) * stride_blocks
+        hist = cumulative[offsets + window_blocks] - cumulative[offsets]
+        entropy = math.log2(window) - table[hist].sum(axis=1) / window
+        entropies.extend(np.maximum(entropy, 0.0).tolist())
+        if window > 1:
+            ics.extend(((hist * (hist - 1)).sum(axis=1) / (window * (window - 1))).tolist())
+        else:
+            ics.extend([0.0] * windows)
+    return entropies, ics
+
+
+def _single_window(data) -> tuple[float, float]:
+    hist = [0] * 256
+    for b in data:
+        hist[b] += 1
+    n = len(data)
+    entropy = -sum(c / n * math.log2(c / n) for c in hist if c)
+    return max(entropy, 0.0), sum(c * (c - 1) for c in hist) / (n * (n - 1)) if n > 1 else 0.0
+
+
+def entropy_profile(data, window: int = DEFAULT_WINDOW, stride: int = None) -> dict:
+    """Computes Shannon entropy and index of coincidence over a sliding window of bytes.
+
+    Both measures are byte-level: entropy is in bits per byte (0 to 8) and the
+    index of coincidence of uniformly random bytes is about 1/256.
+
+    :param data: A bytes-like object (bytes, bytearray, memoryview, mmap) or a str, encoded as UTF-8.
+    :param window: The window size in bytes; data shorter than that is one window.
+    :param stride: The distance between window starts (defaults to the window size).
+    :return: {"offsets", "entropy", "ic"} series plus "size", "window" and "stride",
+             or {"error": ...}.
+    """
+    try:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        size = len(data)
+        if not size:
+            return {"error": "No data provided"}
+        stride = stride or window
+        if window < 1 or stride < 1:
+            return {"error": "Window and stride must be positive"}
+        window = min(window, size)
+        starts = _window_starts(size, window, stride)
+        regular = len(range(0, size - window + 1, stride))
+        if np is not None and math.gcd(window, stride) >= NUMPY_MIN_BLOCK:
+            entropies, ics = _profile_numpy(data, window, stride, regular)
+        else:
+            entropies, ics = _profile_python(data, window, stride, regular)
+        for start in starts[regular:]:
+            entropy, ic = _single_window(data[start:start + window])
+            entropies.append(entropy)
+            ics.append(ic)
+        return {
+            "size": size,
+            "window": window,
+            "stride": stride,
+            "offsets": starts,
+            "entropy": entropies,
+            "ic": ics,
+        }
+    except Exception as e:
+        return {"error": f"Entropy profile failed: {e}"}
+
+
+def file_entropy_profile(path: str, window: int = DEFAULT_WINDOW, stride: int = None) -> dict:
+    """Computes the entropy profile of a file through a read-only memory map."""
+    try:
+        if not os.path.isfile(path):
+            return {"error": f"File not found: {path}"}
+        if os.path.getsize(path) == 0:
+            return {"error": "No data provided"}
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            result = entropy_profile(mapped, window, stride)
+        if "error" not in result:
+            result["path"] = path
+        return result
+    except Exception as e:
+        return {"error": f"Entropy profile failed: {e}"}
+
+
+def high_entropy_regions(profile: dict, threshold: float = HIGH_ENTROPY_THRESHOLD) -> list[tuple[int, int]]:
+    """Merges consecutive windows at or above threshold into (start, end) byte ranges."""
+    regions = []
+    window = profile["window"]
+    for offset, entropy in zip(profile["offsets"], profile["entropy"]):
+        if entropy < threshold:
+            continue
+        if regions and offset <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], max(regions[-1][1], offset + window))
+        else:
+            regions.append((offset, offset + window))
+    return regions
+
+
+def sparkline(values, width: int = 64, low: float = 0.0, high: float = 8.0) -> str:
+    """Renders values as a line of block characters, keeping the maximum of each column."""
+    values = list(values)
+    if not values:
+        return ""
+    if len(values) > width:
+        values = [max(values[i * len(values) // width:(i + 1) * len(values) // width]) for i in range(width)]
+    scale = (len(SPARKLINE_CHARS) - 1) / ((high - low) or 1)
+    return "".join(
+        SPARKLINE_CHARS[min(max(round((v - low) * scale), 0), len(SPARKLINE_CHARS) - 1)] for v in values
+    )
+
+
+def analyze_entropy_profile(source: str) -> dict:
+    """Profiles the file at source if it exists, otherwise the UTF-8 bytes of the text itself."""
+    path = source.strip()
+    if path and os.path.isfile(path):
+        return file_entropy_profile(path)
+    size = len(source.encode("utf-8"))
+    return entropy_profile(source, window=max(64, min(DEFAULT_WINDOW, size // 32)))
+
+
+def format_entropy_profile(profile: dict, limit: int = 20) -> str:
+    """Formats an entropy profile into a readable string with a sparkline."""
+    if "error" in profile:
+        return profile["error"]
+    entropy, ic = profile["entropy"], profile["ic"]
+    output = ["=== ENTROPY PROFILE ==="]
+    if "path" in profile:
+        output.append(f"File: {profile['path']}")
+    output.append(f"Size: {profile['size']} bytes, window {profile['window']}, "
+                  f"stride {profile['stride']}, {len(entropy)} windows")
+    output.append(f"Entropy (bits/byte): min {min(entropy):.4f}, mean {sum(entropy) / len(entropy):.4f}, "
+                  f"max {max(entropy):.4f}")
+    output.append(f"Index of coincidence: min {min(ic):.5f}, mean {sum(ic) / len(ic):.5f}, max {max(ic):.5f}")
+    output.append("")
+    output.append(sparkline(entropy))
+    output.append("")
+    regions = high_entropy_regions(profile)
+    if not regions:
+        output.append(f"No high-entropy regions (>= {HIGH_ENTROPY_THRESHOLD} bits/byte)")
+    else:
+        output.append(f"High-entropy regions (>= {HIGH_ENTROPY_THRESHOLD} bits/byte):")
+        for i, (start, end) in enumerate(regions):
+            if i == limit:
+                output.append(f"... {len(regions) - limit} more regions")
+                break
+            output.append(f"  0x{start:08x} - 0x{end:08x} ({end - start} bytes)")
+    return "\n".join(output)
@@ -1,8 +1,17 @@
 import math
 import random
+import re
 import secrets
 import uuid
+from itertools import islice
 from .data import ERROR_MESSAGES, characters, alphabet, numbers
+from .sieve import segmented_sieve, nth_prime_upper_bound
+
+# Lines of generator output handed to the UI at a time.
+STREAM_CHUNK_SIZE = 1000
+MAX_SEQUENCE_COUNT = 1000000
+MAX_PRIME_RANGE = 100000000
+_RANGE = re.compile(r"\s*(\d+)\s*(?:-|,|\.\.|\s)\s*(\d+)\s*")
 
 
 def password_generator(length):
@@ -97,4 +106,61 @@ def random_ip_generator(count: int) -> list:
             ips.append(ip)
         return ips
     except Exception as e:
-        raise ValueError(f"IP generation failed: {e}")
\ No newline at end of file
+        raise ValueError(f"IP generation failed: {e}")
+
+
+def stream_chunks(values, chunk_size: int = STREAM_CHUNK_SIZE, separator: str = "\n"):
+    """Joins the values of a sequence generator into chunks of text, yielded as they are produced."""
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield separator.join(map(str, chunk))
+
+
+def _sequence_count(text) -> int:
+    count = int(text)
+    if count < 1:
+        raise ValueError("Count must be at least 1")
+    if count > MAX_SEQUENCE_COUNT:
+        raise ValueError("Count cannot exceed 1,000,000")
+    return count
+
+
+def parse_range(text):
+    """Returns (a, b) for a range written as "a-b", "a, b", "a..b" or "a b", or None if text is not a range."""
+    match = _RANGE.fullmatch(str(text))
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def prime_numbers_generator(text):
+    """Returns an iterator over the first n primes, or over the primes in a range "a-b".
+
+    :raises ValueError: If the count or range is invalid.
+    """
+    try:
+        bounds = parse_range(text)
+        if bounds:
+            a, b = bounds
+            if a > b:
+                raise ValueError("The start of the range must not exceed its end")
+            if b - a > MAX_PRIME_RANGE:
+                raise ValueError("Range cannot span more than 100,000,000 numbers")
+            return segmented_sieve(a, b)
+        count = _sequence_count(text)
+        return islice(segmented_sieve(2, nth_prime_upper_bound(count)), count)
+    except Exception as e:
+        raise ValueError(ERROR_MESSAGES["prime_generator"].format(e))
+
+
+def triangular_numbers_generator(text):
+    """Returns an iterator over the first n triangular numbers k(k + 1) / 2.
+
+    :raises ValueError: If the count is invalid.
+    """
+    try:
+        count = _sequence_count(text)
+        return (k * (k + 1) // 2 for k in range(1, count + 1))
+    except Exception as e:
+        raise ValueError(ERROR_MESSAGES["triangular_number_generator"].format(e))
@@ -0,0 +1,287 @@
+import argparse
+import bisect
+import glob
+import heapq
+import mmap
+import os
+import platform
+import shutil
+import struct
+import tempfile
+from .cipher_classifier import identify_hash
+from .converters import HASH_ALGORITHMS
+
+INDEX_EXTENSION = ".chidx"
+INDEX_MAGIC = b"CKHIDX01"
+# Magic, digest size, algorithm name (NUL-padded) and entry count.
+_HEADER = struct.Struct("<8sB15sQ")
+# Offset and length of the plaintext in the string table.
+_POINTER = struct.Struct("<QI")
+# Plaintext length in the temporary sorted runs of build_hash_index().
+_RUN_LENGTH = struct.Struct("<I")
+# Wordlist lines hashed and sorted in memory at a time while building.
+BUILD_CHUNK_WORDS = 1 << 20
+
+
+def default_index_dir() -> str:
+    """Returns the directory searched for lookup indexes in the user data directory."""
+    if platform.system() == "Windows":
+        user_data_dir = os.path.join(os.getenv('APPDATA'), "AltermApp")
+    else:
+        user_data_dir = os.path.expanduser("~/.config/alterm-app")
+    return os.path.join(user_data_dir, "hash_indexes")
+
+
+def _write_run(entries: list, directory: str) -> str:
+    """Sorts (digest, word) entries and writes them to a run file of (digest, length, word) records."""
+    entries.sort()
+    with tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".run", delete=False) as run:
+        for digest, word in entries:
+            run.write(digest)
+            run.write(_RUN_LENGTH.pack(len(word)))
+            run.write(word)
+    return run.name
+
+
+def _read_run(path: str, digest_size: int):
+    """Yields the (digest, word) records of a run file in order."""
+    with open(path, "rb") as run:
+        while True:
+            digest = run.read(digest_size)
+            if not digest:
+                return
+            (length,) = _RUN_LENGTH.unpack(run.read(_RUN_LENGTH.size))
+            yield digest, run.read(length)
+
+
+def _sorted_runs(f, constructor, directory: str, chunk_words: int, runs: list) -> None:
+    """Hashes the wordlist chunk_words lines at a time and appends the paths of the sorted runs to runs."""
+    entries = []
+    for line in f:
+        word = line.rstrip(b"\r\n")
+        if word:
+            entries.append((constructor(word).digest(), word))
+        if len(entries) >= chunk_words:
+            runs.append(_write_run(entries, directory))
+            entries = []
+    if entries or not runs:
+        runs.append(_write_run(entries, directory))
+
+
+def build_hash_index(wordlist_path: str, index_path: str = None, algorithm: str = "SHA-256",
+                     chunk_words: int = BUILD_CHUNK_WORDS) -> dict:
+    """Builds a sorted digest -> plaintext table from a wordlist with one plaintext per line.
+
+    Each line is hashed as UTF-8, like the hashing tabs do. The table is a
+    header, fixed-size (digest, pointer) records sorted by digest and a string
+    table, so HashIndex can binary-search it straight from a memory map.
+
+    The wordlist is sorted externally: chunk_words lines at a time are hashed,
+    sorted and written to a run file next to the index, and the runs are then
+    merged. Memory stays bounded by one chunk, and the build needs about twice
+    the index size in free disk space.
+
+    :param wordlist_path: The wordlist file.
+    :param index_path: The index file to write (defaults to default_index_dir()).
+    :param algorithm: One of the HASH_ALGORITHMS.
+    :param chunk_words: The number of lines sorted in memory at a time.
+    :return: {"path", "algorithm", "entries"}.
+    :raises ValueError: If the algorithm is unknown, chunk_words is not positive or the wordlist cannot be read.
+    """
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    if chunk_words < 1:
+        raise ValueError("chunk_words must be positive")
+    constructor = HASH_ALGORITHMS[algorithm]
+    if index_path is None:
+        name = os.path.basename(wordlist_path)
+        index_path = os.path.join(default_index_dir(), f"{name}.{algorithm}{INDEX_EXTENSION}")
+    directory = os.path.dirname(os.path.abspath(index_path))
+    os.makedirs(directory, exist_ok=True)
+    digest_size = constructor().digest_size
+
+    runs = []
+    temporary = index_path + ".tmp"
+    strings_path = index_path + ".strings"
+    try:
+        try:
+            with open(wordlist_path, "rb") as f:
+                _sorted_runs(f, constructor, directory, chunk_words, runs)
+        except OSError as e:
+            raise ValueError(f"Cannot read wordlist: {e}")
+        count = offset = 0
+        previous = None
+        with open(temporary, "wb") as out, open(strings_path, "w+b") as strings:
+            out.write(_HEADER.pack(INDEX_MAGIC, digest_size, algorithm.encode("ascii"), 0))
+            # Equal digests are adjacent after the merge; the smallest plaintext is kept.
+            for digest, word in heapq.merge(*(_read_run(run, digest_size) for run in runs)):
+                if digest == previous:
+                    continue
+                previous = digest
+                out.write(digest)
+                out.write(_POINTER.pack(offset, len(word)))
+                strings.write(word)
+                offset += len(word)
+                count += 1
+            strings.seek(0)
+            shutil.copyfileobj(strings, out)
+            out.seek(0)
+            out.write(_HEADER.pack(INDEX_MAGIC, digest_size, algorithm.encode("ascii"), count))
+        os.replace(temporary, index_path)
+    finally:
+        for path in runs + [temporary, strings_path]:
+            if os.path.exists(path):
+                os.remove(path)
+    return {
+        "path": index_path,
+        "algorithm": algorithm,
+        "entries": count,
+    }
+
+
+class _Digests:
+    """A read-only sequence view of the digests of an index, for bisect."""
+
+    def __init__(self, index: "HashIndex"):
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, i: int) -> bytes:
+        return self._index._digest_at(i)
+
+
+class HashIndex:
+    """A lookup index written by build_hash_index(), binary-searched through a read-only memory map."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self.digest_size, name, self.count = _HEADER.unpack_from(self._map, 0)
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"Not a hash index: {path}")
+        except Exception:
+            self.close()
+            raise
+        self.algorithm = name.rstrip(b"\0").decode("ascii")
+        self._record_size = self.digest_size + _POINTER.size
+        self._strings = _HEADER.size + self.count * self._record_size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _digest_at(self, i: int) -> bytes:
+        start = _HEADER.size + i * self._record_size
+        return self._map[start:start + self.digest_size]
+
+    def lookup(self, digest):
+        """Returns the plaintext of a digest (bytes or hex string), or None if it is not indexed."""
+        if isinstance(digest, str):
+            try:
+                digest = bytes.fromhex(digest.strip())
+            except ValueError:
+                return None
+        if len(digest) != self.digest_size:
+            return None
+        i = bisect.bisect_left(_Digests(self), digest)
+        if i == self.count or self._digest_at(i) != digest:
+            return None
+        offset, length = _POINTER.unpack_from(self._map, _HEADER.size + i * self._record_size + self.digest_size)
+        start = self._strings + offset
+        return self._map[start:start + length].decode("utf-8", errors="replace")
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def lookup_hash(digest: str, index_paths=None) -> list[tuple[str, str, str]]:
+    """Looks a hex digest up in every index of matching digest size.
+
+    :param digest: The hex digest.
+    :param index_paths: The index files (defaults to those in default_index_dir()).
+    :return: (index path, algorithm, plaintext) for every match.
+    """
+    if index_paths is None:
+        index_paths = sorted(glob.glob(os.path.join(default_index_dir(), "*" + INDEX_EXTENSION)))
+    matches = []
+    for path in index_paths:
+        try:
+            with HashIndex(path) as index:
+                plaintext = index.lookup(digest)
+        except (OSError, ValueError, struct.error):
+            continue
+        if plaintext is not None:
+            matches.append((path, index.algorithm, plaintext))
+    return matches
+
+
+def analyze_hash(text: str, index_paths=None) -> dict:
+    """Identifies a hash and, for hex digests, looks it up in the local indexes."""
+    result = identify_hash(text)
+    if "error" not in result:
+        result["matches"] = lookup_hash(text.strip(), index_paths) if result["encoding"] == "hex" else []
+    return result
+
+
+def format_hash_analysis(result: dict) -> str:
+    """Formats an analyze_hash() result into a readable string."""
+    if "error" in result:
+        return result["error"]
+    output = ["=== HASH IDENTIFICATION ==="]
+    if result["encoding"] == "crypt":
+        output.append(f"Format: modular crypt ({result['candidates'][0]})")
+        for key, value in result["parameters"].items():
+            output.append(f"  {key}: {value}")
+    else:
+        output.append(f"Format: {result['encoding']} digest, {result['bits']} bits")
+        output.append(f"Candidates: {', '.join(result['candidates'])}")
+    if result.get("matches"):
+        output.append("")
+        output.append("Known values:")
+        for path, algorithm, plaintext in result["matches"]:
+            output.append(f"  {algorithm}: {plaintext} ({os.path.basename(path)})")
+    return "\n".join(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and query the local hash lookup indexes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="build an index from a wordlist")
+    build.add_argument("wordlist", help="file with one plaintext per line")
+    build.add_argument("--algorithm", default="SHA-256", choices=sorted(HASH_ALGORITHMS))
+    build.add_argument("--output", help="index file to write (defaults to the user data directory)")
+    build.add_argument("--chunk-words", type=int, default=BUILD_CHUNK_WORDS,
+                       help="lines sorted in memory at a time")
+    lookup = commands.add_parser("lookup", help="look a hex digest up in the indexes")
+    lookup.add_argument("digest")
+    lookup.add_argument("--index", nargs="+", help="index files (defaults to the user data directory)")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        try:
+            result = build_hash_index(args.wordlist, args.output, args.algorithm, args.chunk_words)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"{result['entries']} entries written to {result['path']}")
+    else:
+        matches = lookup_hash(args.digest, args.index)
+        for path, algorithm, plaintext in matches:
+            print(f"{algorithm}: {plaintext} ({path})")
+        if not matches:
+            print("No match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import os
+import platform
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .converters import HASH_ALGORITHMS, file_digest
+
+
+def default_cache_path() -> str:
+    """Returns the location of the hash cache in the user data directory."""
+    if platform.system() == "Windows":
+        user_data_dir = os.path.join(os.getenv('APPDATA'), "AltermApp")
+    else:
+        user_data_dir = os.path.expanduser("~/.config/alterm-app")
+    return os.path.join(user_data_dir, "hash_cache.sqlite3")
+
+
+class HashCache:
+    """A persistent (path, inode, size, mtime_ns) -> digest cache backed by SQLite."""
+
+    def __init__(self, path: str = None):
+        self.path = path or default_cache_path()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_digests ("
+            " path TEXT NOT NULL,"
+            " algorithm TEXT NOT NULL,"
+            " inode INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " PRIMARY KEY (path, algorithm))"
+        )
+        self._conn.commit()
+
+    def lookup(self, path: str, algorithm: str, st: os.stat_result):
+        """Returns the cached digest for path if its inode, size and mtime are unchanged."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT inode, size, mtime_ns, digest FROM file_digests WHERE path = ? AND algorithm = ?",
+                (path, algorithm)
+            ).fetchone()
+        if row and row[:3] == (st.st_ino, st.st_size, st.st_mtime_ns):
+            return row[3]
+        return None
+
+    def store_many(self, algorithm: str, entries):
+        """Stores (path, stat_result, digest) entries for algorithm."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO file_digests (path, algorithm, inode, size, mtime_ns, digest)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(path, algorithm, st.st_ino, st.st_size, st.st_mtime_ns, digest)
+                 for path, st, digest in entries]
+            )
+            self._conn.commit()
+
+    def prune(self, root: str, algorithm: str, keep):
+        """Drops cached entries under root that are not in keep (deleted files)."""
+        prefix = os.path.join(root, "")
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM file_digests WHERE algorithm = ? AND substr(path, 1, ?) = ?",
+                (algorithm, len(prefix), prefix)
+            ).fetchall()
+            stale = [(path, algorithm) for (path,) in rows if path not in keep]
+            if stale:
+                self._conn.executemany(
+                    "DELETE FROM file_digests WHERE path = ? AND algorithm = ?", stale)
+                self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _walk_files(root: str):
+    """Yields (absolute_path, relative_path, stat_result) for regular files under root.
+
+    Symbolic links are skipped so that link cycles cannot be followed.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    rel = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                    yield entry.path, rel, entry.stat()
+
+
+def merkle_root(leaves, algorithm: str = "SHA-256") -> str:
+    """Computes a Merkle root over (relative_path, hex_digest) leaves.
+
+    Leaves are sorted by path. Each leaf hashes 0x00 || path || 0x00 || digest
+    and each inner node hashes 0x01 || left || right, so a leaf can never be
+    mistaken for a node. An unpaired node is carried up to the next level.
+
+    :param leaves: An iterable of (relative_path, hex_digest) pairs.
+    :param algorithm: One of the HASH_ALGORITHMS names.
+    :return: The hex-encoded root (the hash of nothing for an empty tree).
+    """
+    constructor = HASH_ALGORITHMS[algorithm]
+    level = [constructor(b"\x00" + rel.encode("utf-8") + b"\x00" + bytes.fromhex(digest)).digest()
+             for rel, digest in sorted(leaves)]
+    if not level:
+        return constructor(b"").hexdigest()
+    while len(level) > 1:
+        paired = [constructor(b"\x01" + level[i] + level[i + 1]).digest()
+                  for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+
+def hash_directory(root: str, algorithm: str = "SHA-256", cache=None, max_workers: int = None) -> dict:
+    """Hashes every file under a directory, re-hashing only files that changed.
+
+    :param root: The directory to hash.
+    :param algorithm: One of the HASH_ALGORITHMS names.
+    :param cache: A HashCache, a path to a cache database, or None for the default cache.
+    :param max_workers: The number of hashing threads (defaults to the CPU count).
+    :return: A dictionary with the per-file digests, the Merkle root and cache statistics.
+    """
+    try:
+        root = os.path.abspath(os.path.expanduser(root.strip()))
+        if not os.path.isdir(root):
+            return {"error": f"Not a directory: {root}"}
+        if algorithm not in HASH_ALGORITHMS:
+            return {"error": f"Unsupported hash algorithm: {algorithm}"}
+        own_cache = not isinstance(cache, HashCache)
+        if own_cache:
+            cache = HashCache(cache)
+        try:
+            files = {}
+            stale = []
+            for path, rel, st in _walk_files(root):
+                digest = cache.lookup(path, algorithm, st)
+                if digest is None:
+                    stale.append((path, rel, st))
+                else:
+                    files[rel] = digest
+
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                digests = list(executor.map(lambda item: file_digest(item[0], algorithm), stale))
+            for (path, rel, st), digest in zip(stale, digests):
+                files[rel] = digest
+            cache.store_many(algorithm, [(path, st, digest) for (path, _, st), digest in zip(stale, digests)])
+            cache.prune(root, algorithm, {os.path.join(root, rel.replace("/", os.sep)) for rel in files})
+        finally:
+            if own_cache:
+                cache.close()
+
+        return {
+            "root": root,
+            "algorithm": algorithm,
+            "files": dict(sorted(files.items())),
+            "merkle_root": merkle_root(files.items(), algorithm),
+            "hashed": len(stale),
+            "cached": len(files) - len(stale),
+        }
+    except Exception as e:
+        return {"error": f"Directory hashing failed: {e}"}
+
+
+def format_directory_hash(result: dict, limit: int = 50) -> str:
+    """Formats the directory hash result into a readable string."""
+    if "error" in result:
+        return result["error"]
+    output = ["=== DIRECTORY HASH ==="]
+    output.append(f"Directory: {result['root']}")
+    output.append(f"Algorithm: {result['algorithm']}")
+    output.append(f"Merkle root: {result['merkle_root']}")
+    output.append(f"Files: {len(result['files'])} ({result['hashed']} hashed, {result['cached']} from cache)")
+    output.append("")
+    for i, (rel, digest) in enumerate(result["files"].items()):
+        if i == limit:
+            output.append(f"... {len(result['files']) - limit} more files")
+            break
+        output.append(f"{digest}  {rel}")
+    return "\n".join(output)
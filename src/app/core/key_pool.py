@@ -0,0 +1,177 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from .converters import rsa_generate_keys, ecc_generate_keys, elgamal_generate_keys
+from .data import KEY_POOL_SETTINGS
+from .parallel import worker_count
+
+
+def generate_keys(algorithm: str, param) -> tuple[str, str]:
+    """Generates one (private_pem, public_pem) pair without going through a pool.
+
+    :param algorithm: "RSA", "ECC" or "ElGamal".
+    :param param: The key size in bits (RSA, ElGamal) or the curve name (ECC).
+    :raises ValueError: If the algorithm is unknown.
+    """
+    if algorithm == "RSA":
+        return rsa_generate_keys(key_size=int(param))
+    if algorithm == "ECC":
+        return ecc_generate_keys(curve_name=param)
+    if algorithm == "ElGamal":
+        return elgamal_generate_keys(key_size=int(param or 2048))
+    raise ValueError(f"Unsupported key algorithm: {algorithm}")
+
+
+class KeyPool:
+    """Keeps pre-generated keypairs per (algorithm, size/curve) ready to hand out.
+
+    Whenever fewer than low_watermark keys are stored or being generated for a
+    slot, background tasks top it up to high_watermark. get() pops a stored key
+    in O(1) and only generates on the calling thread when the slot is empty.
+    """
+
+    def __init__(self, low_watermark: int = 2, high_watermark: int = 8, max_workers: int = None,
+                 executor=None):
+        """
+        :param low_watermark: The stock level that triggers a refill.
+        :param high_watermark: The stock level a refill tops up to.
+        :param max_workers: The number of generator threads when no executor is given.
+        :param executor: An Executor to generate on, e.g. a ProcessPoolExecutor
+                         (the pool does not shut it down).
+        """
+        if not 0 <= low_watermark <= high_watermark or high_watermark < 1:
+            raise ValueError("Watermarks must satisfy 0 <= low <= high and high >= 1")
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=worker_count(max_workers), thread_name_prefix="keypool")
+        self._lock = threading.RLock()
+        self._keys = {}
+        self._pending = {}
+        self._closed = False
+
+    @staticmethod
+    def _slot(algorithm: str, param) -> tuple:
+        return algorithm, str(param).strip().upper() if algorithm == "ECC" else int(param or 2048)
+
+    def _schedule_refill(self, slot: tuple) -> None:
+        """Submits generation tasks for slot; the lock must be held."""
+        stock = len(self._keys.setdefault(slot, deque())) + self._pending.get(slot, 0)
+        if self._closed or stock >= max(self.low_watermark, 1):
+            return
+        for _ in range(self.high_watermark - stock):
+            self._pending[slot] = self._pending.get(slot, 0) + 1
+            future = self._executor.submit(generate_keys, *slot)
+            future.add_done_callback(lambda f, slot=slot: self._store(slot, f))
+
+    def _store(self, slot: tuple, future) -> None:
+        with self._lock:
+            self._pending[slot] -= 1
+            if future.cancelled() or future.exception() is not None:
+                return
+            self._keys[slot].append(future.result())
+
+    def prefill(self, algorithm: str, param) -> None:
+        """Starts generating keys for a slot without taking any."""
+        with self._lock:
+            self._schedule_refill(self._slot(algorithm, param))
+
+    def available(self, algorithm: str, param) -> int:
+        """Returns how many keys are ready for a slot."""
+        with self._lock:
+            return len(self._keys.get(self._slot(algorithm, param), ()))
+
+    def get(self, algorithm: str, param) -> tuple[str, str]:
+        """Returns a (private_pem, public_pem) pair, generating one if none is ready."""
+        slot = self._slot(algorithm, param)
+        with self._lock:
+            keys = self._keys.setdefault(slot, deque())
+            keypair = keys.popleft() if keys else None
+            self._schedule_refill(slot)
+        return keypair or generate_keys(*slot)
+
+    def get_many(self, algorithm: str, param, count: int) -> list[tuple[str, str]]:
+        """Returns count keypairs, taking ready keys first and generating the rest in parallel."""
+        slot = self._slot(algorithm, param)
+        with self._lock:
+            keys = self._keys.setdefault(slot, deque())
+            taken = [keys.popleft() for _ in range(min(count, len(keys)))]
+        futures = [self._executor.submit(generate_keys, *slot) for _ in range(count - len(taken))]
+        taken.extend(future.result() for future in futures)
+        with self._lock:
+            self._schedule_refill(slot)
+        return taken
+
+    def shutdown(self) -> None:
+        """Stops refilling and discards queued generation tasks."""
+        with self._lock:
+            self._closed = True
+        if self._own_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def enable_key_pool(low_watermark: int = 2, high_watermark: int = 8, max_workers: int = None,
+                    executor=None) -> KeyPool:
+    """Installs a shared KeyPool used by get_keypair and generate_keys_batch."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = KeyPool(low_watermark, high_watermark, max_workers, executor)
+        return _pool
+
+
+def disable_key_pool() -> None:
+    """Shuts down the shared KeyPool; keys are generated on demand again."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = None
+
+
+def configure_key_pool(settings: dict) -> None:
+    """Enables or disables the shared KeyPool from a mapping like KEY_POOL_SETTINGS.
+
+    :param settings: {"enabled", "low_watermark", "high_watermark"}; missing fields keep their defaults.
+    :raises ValueError: If a field is unknown or the watermarks are invalid.
+    """
+    values = dict(KEY_POOL_SETTINGS)
+    unknown = set(settings or {}) - set(values)
+    if unknown:
+        raise ValueError(f"Unknown key pool settings: {', '.join(sorted(unknown))}")
+    values.update(settings or {})
+    if not values["enabled"]:
+        disable_key_pool()
+        return
+    enable_key_pool(int(values["low_watermark"]), int(values["high_watermark"]))
+
+
+def get_keypair(algorithm: str, param) -> tuple[str, str]:
+    """Returns a keypair from the shared pool when it is enabled, otherwise generates one."""
+    pool = _pool
+    if pool is None:
+        return generate_keys(algorithm, param)
+    return pool.get(algorithm, param)
+
+
+def generate_keys_batch(algorithm: str, param, count: int, max_workers: int = None) -> list[tuple[str, str]]:
+    """Returns count keypairs, drawing from the shared pool when it is enabled.
+
+    :param algorithm: "RSA", "ECC" or "ElGamal".
+    :param param: The key size in bits (RSA, ElGamal) or the curve name (ECC).
+    :param count: The number of keypairs.
+    :param max_workers: The number of generator threads when the pool is disabled.
+    """
+    if count < 0:
+        raise ValueError("Count must be non-negative")
+    pool = _pool
+    if pool is not None:
+        return pool.get_many(algorithm, param, count)
+    with ThreadPoolExecutor(max_workers=worker_count(max_workers)) as executor:
+        return list(executor.map(lambda _: generate_keys(algorithm, param), range(count)))
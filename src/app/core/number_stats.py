@@ -0,0 +1,274 @@
+import math
+import random
+from fractions import Fraction
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+HISTOGRAM_BINS = 10
+# Temporary arrays of the NumPy variance are bounded to this many elements.
+NUMPY_CHUNK = 1 << 20
+_SMALL_SELECT = 32
+
+
+def _is_array(values) -> bool:
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _is_integer_array(values) -> bool:
+    return _is_array(values) and values.dtype.kind in "iu"
+
+
+def _all_ints(values) -> bool:
+    if _is_array(values):
+        return values.dtype.kind in "iu"
+    return all(type(v) is int for v in values)
+
+
+def _interpolate(a, b, fraction: Fraction):
+    """Returns a + (b - a) * fraction; exactly for ints (an int when whole, else the nearest float)."""
+    if isinstance(a, int) and isinstance(b, int):
+        value = a + (b - a) * fraction
+        return value.numerator if value.denominator == 1 else float(value)
+    return float(a + (b - a) * float(fraction))
+
+
+def select(values, k: int):
+    """Returns the k-th smallest value (0-based) in expected linear time.
+
+    Python sequences are partitioned around random pivots instead of being
+    sorted; among equal values the one a stable sort would place at k is
+    returned, so ints and floats keep their type. NumPy arrays use np.partition.
+    """
+    if not 0 <= k < len(values):
+        raise IndexError("Selection index out of range")
+    if _is_array(values):
+        return np.partition(values, k)[k]
+    while len(values) > _SMALL_SELECT:
+        pivot = values[random.randrange(len(values))]
+        lower = [v for v in values if v < pivot]
+        if k < len(lower):
+            values = lower
+            continue
+        equal = [v for v in values if v == pivot]
+        if k < len(lower) + len(equal):
+            return equal[k - len(lower)]
+        k -= len(lower) + len(equal)
+        values = [v for v in values if v > pivot]
+    return sorted(values)[k]
+
+
+def median(values, is_sorted: bool = False):
+    """Returns the median; the middle value itself for an odd count, else the mean of the two middle values."""
+    n = len(values)
+    if not n:
+        raise ValueError("Median of an empty sequence")
+    if is_sorted:
+        return values[n // 2] if n % 2 else (values[n // 2 - 1] + values[n // 2]) / 2
+    if n % 2:
+        return select(values, n // 2)
+    low = select(values, n // 2 - 1)
+    if _is_array(values):
+        high = values[values > low].min() if np.count_nonzero(values <= low) <= n // 2 else low
+    else:
+        # Take the element a stable sort would put next, so 0 and -0.0 stay apart.
+        less = sum(v < low for v in values)
+        equal = [v for v in values if v == low]
+        high = equal[n // 2 - less] if less + len(equal) > n // 2 else min(v for v in values if v > low)
+    return (low + high) / 2
+
+
+def percentiles(values, qs=DEFAULT_PERCENTILES, is_sorted: bool = False) -> dict:
+    """Returns {q: value} with linear interpolation between the closest ranks (NumPy's default).
+
+    Integers are interpolated exactly, so values beyond 2**53 keep their
+    precision; the result is an int when it falls on a whole number.
+    """
+    n = len(values)
+    if not n:
+        raise ValueError("Percentiles of an empty sequence")
+    if _is_array(values) and not _is_integer_array(values):
+        return {q: float(v) for q, v in zip(qs, np.percentile(values, qs))}
+    positions = {q: (n - 1) * Fraction(q) / 100 for q in qs}
+    ranks = sorted({k for p in positions.values() for k in (math.floor(p), min(math.floor(p) + 1, n - 1))})
+    if _is_integer_array(values):
+        partitioned = np.partition(values, ranks)
+        at = {k: int(partitioned[k]) for k in ranks}
+    elif is_sorted or len(qs) > 2:
+        ordered = values if is_sorted else sorted(values)
+        at = {k: ordered[k] for k in ranks}
+    else:
+        at = {k: select(values, k) for k in ranks}
+    result = {}
+    for q, position in positions.items():
+        low = math.floor(position)
+        result[q] = _interpolate(at[low], at[min(low + 1, n - 1)], position - low)
+    return result
+
+
+def mean_variance(values, mean: float = None) -> tuple[float, float]:
+    """Returns the mean and population variance with compensated (fsum / pairwise) summation."""
+    n = len(values)
+    if not n:
+        raise ValueError("Mean of an empty sequence")
+    if _is_array(values):
+        if mean is None:
+            mean = float(np.sum(values, dtype=np.float64)) / n
+        squares = math.fsum(
+            float(np.sum(np.square(values[i:i + NUMPY_CHUNK] - mean, dtype=np.float64)))
+            for i in range(0, n, NUMPY_CHUNK)
+        )
+        return mean, squares / n
+    if mean is None:
+        mean = math.fsum(values) / n
+    return mean, math.fsum((v - mean) ** 2 for v in values) / n
+
+
+def histogram(values, bins: int = HISTOGRAM_BINS) -> list[tuple[float, float, int]]:
+    """Splits the range of values into equal-width bins and returns (low, high, count) tuples.
+
+    Integers get integer-width bins with inclusive integer bounds (fewer bins
+    when the range is narrower than bins), computed exactly at any magnitude.
+    """
+    if not len(values):
+        return []
+    if _all_ints(values):
+        return _integer_histogram(values, bins)
+    if _is_array(values):
+        counts, edges = np.histogram(values, bins=bins)
+        return [(float(edges[i]), float(edges[i + 1]), int(counts[i])) for i in range(len(counts))]
+    low, high = min(values), max(values)
+    if low == high:
+        return [(float(low), float(high), len(values))]
+    width = (high - low) / bins
+    counts = [0] * bins
+    for v in values:
+        counts[min(int((v - low) / width), bins - 1)] += 1
+    return [(low + i * width, high if i == bins - 1 else low + (i + 1) * width, counts[i]) for i in range(bins)]
+
+
+def _integer_histogram(values, bins: int) -> list[tuple[int, int, int]]:
+    low, high = int(min(values)), int(max(values))
+    width = -(-(high - low + 1) // bins)
+    bins = -(-(high - low + 1) // width)
+    if _is_array(values):
+        # Offsets from low are below 2**64 even when the range overflows int64.
+        offsets = values.astype(np.uint64) - np.uint64(low % (1 << 64))
+        counts = np.bincount((offsets // np.uint64(width)).astype(np.int64), minlength=bins).tolist()
+    else:
+        counts = [0] * bins
+        for v in values:
+            counts[(v - low) // width] += 1
+    return [(low + i * width, min(low + (i + 1) * width - 1, high), counts[i]) for i in range(bins)]
+
+
+class P2Quantile:
+    """Estimates one quantile of a stream in constant memory with the P-square algorithm.
+
+    Five markers track the minimum, the quantile, the maximum and two points
+    between them; their heights are adjusted with piecewise-parabolic
+    interpolation as observations arrive (Jain and Chlamtac, 1985).
+    """
+
+    def __init__(self, q: float):
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.q = q
+        self.count = 0
+        self._heights = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * q, 4 * q, 2 + 2 * q, 4]
+        self._increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def add(self, x: float) -> None:
+        """Adds one observation."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(x)
+            heights.sort()
+            return
+        positions, desired = self._positions, self._desired
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= heights[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            desired[i] += self._increments[i]
+        for i in (1, 2, 3):
+            d = desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                d = 1 if d > 0 else -1
+                h = heights[i] + d / (positions[i + 1] - positions[i - 1]) * (
+                    (positions[i] - positions[i - 1] + d) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i])
+                    + (positions[i + 1] - positions[i] - d) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1])
+                )
+                if not heights[i - 1] < h < heights[i + 1]:
+                    h = heights[i] + d * (heights[i + d] - heights[i]) / (positions[i + d] - positions[i])
+                heights[i] = h
+                positions[i] += d
+
+    def value(self) -> float:
+        """Returns the current estimate (exact while five or fewer values were added)."""
+        if not self.count:
+            raise ValueError("No observations")
+        if self.count <= 5:
+            return percentiles(self._heights, (self.q * 100,))[self.q * 100]
+        return float(self._heights[2])
+
+
+class RunningStats:
+    """Exact count, mean, variance, minimum and maximum of a stream, plus approximate percentiles.
+
+    Batches are combined with Chan's parallel form of Welford's update, so
+    memory stays constant however many values are added; percentiles come
+    from one P2Quantile per requested percentile.
+    """
+
+    def __init__(self, percentiles=DEFAULT_PERCENTILES):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self._quantiles = {q: P2Quantile(q / 100) for q in percentiles}
+
+    def update(self, values) -> "RunningStats":
+        """Adds a batch of values (a sequence or NumPy array)."""
+        n = len(values)
+        if not n:
+            return self
+        mean, variance = mean_variance(values)
+        low, high = (float(values.min()), float(values.max())) if _is_array(values) else (min(values), max(values))
+        self._combine(n, mean, variance * n, low, high)
+        for estimator in self._quantiles.values():
+            for v in values.tolist() if _is_array(values) else values:
+                estimator.add(v)
+        return self
+
+    def _combine(self, n: int, mean: float, m2: float, low, high) -> None:
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def variance(self) -> float:
+        """Returns the population variance."""
+        return self.m2 / self.count if self.count else 0.0
+
+    def percentiles(self) -> dict:
+        """Returns the estimated {percentile: value}."""
+        return {q: estimator.value() for q, estimator in self._quantiles.items()} if self.count else {}
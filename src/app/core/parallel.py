@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+def available_memory() -> int:
+    """Returns the physical memory currently available in bytes, or None if unknown."""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def worker_count(max_workers: int = None, per_task_memory: int = 0, memory_budget: int = None) -> int:
+    """Sizes a worker pool to the CPU count and, optionally, a memory budget.
+
+    :param max_workers: An explicit upper bound (defaults to the CPU count).
+    :param per_task_memory: The memory in bytes a single task needs.
+    :param memory_budget: The memory in bytes all running tasks may use together
+                          (defaults to half of the available memory).
+    :return: The number of workers, at least 1.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if per_task_memory and memory_budget is None:
+        available = available_memory()
+        memory_budget = available // 2 if available else None
+    if per_task_memory and memory_budget:
+        workers = min(workers, memory_budget // per_task_memory)
+    return max(1, workers)
+
+
+def imap_unordered(fn, items, max_workers: int = None, executor=None, backlog: int = 4):
+    """Applies fn to every item on a pool and yields (index, result) as tasks complete.
+
+    At most max_workers * backlog tasks are in flight, so arbitrarily long
+    iterables are consumed lazily with bounded memory. Exceptions raised by
+    fn propagate to the caller when their result is reached.
+
+    :param fn: The function to call with each item.
+    :param items: An iterable of items.
+    :param max_workers: The pool size when no executor is given.
+    :param executor: An existing Executor to submit to (it is not shut down).
+    :param backlog: How many tasks to keep queued per worker.
+    """
+    own_executor = executor is None
+    if own_executor:
+        max_workers = worker_count(max_workers)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    limit = max(1, (max_workers or os.cpu_count() or 1) * backlog)
+    try:
+        pending = {}
+        iterator = iter(enumerate(items))
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    index, item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(fn, item)] = index
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,218 @@
+import math
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from .checkers import is_happy, integer_root, DIGIT_SQUARES
+from .generators import parse_range
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PROPERTY_COLUMNS = (
+    "prime", "perfect", "abundant", "deficient", "happy", "palindromic",
+    "square", "cube", "fibonacci", "triangular", "armstrong",
+)
+MAX_VALUE = 10 ** 12
+MAX_RANGE = 10 ** 7
+# Rows classified at a time when streaming CSV.
+CSV_BLOCK = 1 << 16
+
+# Digit-square sums of numbers up to MAX_VALUE are below this, so one table decides happiness.
+_DIGIT_SQUARE_LIMIT = 81 * 13 + 1
+_HAPPY = bytes(is_happy(n) for n in range(_DIGIT_SQUARE_LIMIT))
+
+
+def _fibonacci_numbers(limit: int) -> frozenset:
+    numbers, a, b = set(), 0, 1
+    while a <= limit:
+        numbers.add(a)
+        a, b = b, a + b
+    return frozenset(numbers)
+
+
+FIBONACCI_NUMBERS = _fibonacci_numbers(MAX_VALUE)
+
+
+@lru_cache(maxsize=None)
+def _armstrong_numbers(digits: int) -> frozenset:
+    """Returns the Armstrong numbers with the given number of digits.
+
+    Only the sum of d**digits depends on which digits occur, so every
+    multiset of digits is tried once instead of every number in the range.
+    """
+    powers = [d ** digits for d in range(10)]
+    low = 10 ** (digits - 1) if digits > 1 else 0
+    found = set()
+    for combination in combinations_with_replacement(range(10), digits):
+        total = sum(powers[d] for d in combination)
+        if low <= total < 10 ** digits and sorted(map(int, str(total))) == list(combination):
+            found.add(total)
+    return frozenset(found)
+
+
+def _members(a: int, b: int):
+    """Yields (column, members in [a, b]) for the properties decided by their short list of members."""
+    yield "square", (k * k for k in range(math.isqrt(a - 1) + 1 if a else 0, math.isqrt(b) + 1))
+    yield "cube", (k ** 3 for k in range(integer_root(a - 1, 3) + 1 if a else 0, integer_root(b, 3) + 1))
+    first = (math.isqrt(8 * a + 1) - 1) // 2
+    if first * (first + 1) // 2 < a:
+        first += 1
+    yield "triangular", (k * (k + 1) // 2 for k in range(first, (math.isqrt(8 * b + 1) - 1) // 2 + 1))
+    yield "fibonacci", (n for n in FIBONACCI_NUMBERS if a <= n <= b)
+    digits = range(len(str(a)), len(str(b)) + 1)
+    yield "armstrong", (n for d in digits for n in _armstrong_numbers(d) if a <= n <= b)
+
+
+def _divisor_sums(a: int, b: int) -> list:
+    """Returns sigma(n) for every n in [a, b] (a >= 1) by adding each divisor pair d, n / d with d <= sqrt(n)."""
+    sums = [0] * (b - a + 1)
+    for d in range(1, math.isqrt(b) + 1):
+        square = d * d
+        first = max(-(-a // d) * d, square)
+        for m in range(first, b + 1, d):
+            sums[m - a] += d + m // d
+        if a <= square:
+            sums[square - a] -= d
+    return sums
+
+
+def _divisor_sums_numpy(a: int, b: int, n):
+    """NumPy version of _divisor_sums(), one slice per small divisor and one scatter for the large ones."""
+    length = b - a + 1
+    sums = np.zeros(length, dtype=np.int64)
+    root = math.isqrt(b)
+    for d in range(1, min(root, length) + 1):
+        square = d * d
+        first = max(-(-a // d) * d, square)
+        if first > b:
+            continue
+        view = slice(first - a, None, d)
+        sums[view] += d + n[view] // d
+        if a <= square:
+            sums[square - a] -= d
+    if root > length:
+        # A divisor longer than the range divides at most one of its numbers.
+        d = np.arange(length + 1, root + 1, dtype=np.int64)
+        m = np.maximum(-(-a // d) * d, d * d)
+        keep = m <= b
+        d, m = d[keep], m[keep]
+        np.add.at(sums, m - a, d + m // d - np.where(m == d * d, d, 0))
+    return sums
+
+
+def _classify_numpy(a: int, b: int) -> dict:
+    n = np.arange(a, b + 1, dtype=np.int64)
+    columns = {"n": n}
+    start = max(a, 1)
+    sums = np.zeros(len(n), dtype=np.int64)
+    if start <= b:
+        sums[start - a:] = _divisor_sums_numpy(start, b, n[start - a:])
+    proper = sums - n
+    positive = n > 0
+    columns["prime"] = sums == n + 1
+    columns["perfect"] = positive & (proper == n)
+    columns["abundant"] = positive & (proper > n)
+    columns["deficient"] = positive & (proper < n)
+
+    rest, digit_squares, reverse = n.copy(), np.zeros_like(n), np.zeros_like(n)
+    while True:
+        nonzero = rest > 0
+        if not nonzero.any():
+            break
+        digit = rest % 10
+        digit_squares += digit * digit
+        reverse = np.where(nonzero, reverse * 10 + digit, reverse)
+        rest //= 10
+    columns["happy"] = np.frombuffer(_HAPPY, dtype=np.uint8)[digit_squares].astype(bool)
+    columns["palindromic"] = reverse == n
+
+    for name, members in _members(a, b):
+        column = np.zeros(len(n), dtype=bool)
+        column[np.fromiter(members, dtype=np.int64) - a] = True
+        columns[name] = column
+    return columns
+
+
+def _classify_python(a: int, b: int) -> dict:
+    numbers = range(a, b + 1)
+    columns = {"n": list(numbers)}
+    start = max(a, 1)
+    sums = [0] * (start - a) + (_divisor_sums(start, b) if start <= b else [])
+    columns["prime"] = [s == n + 1 for n, s in zip(numbers, sums)]
+    columns["perfect"] = [n > 0 and s - n == n for n, s in zip(numbers, sums)]
+    columns["abundant"] = [n > 0 and s - n > n for n, s in zip(numbers, sums)]
+    columns["deficient"] = [n > 0 and s - n < n for n, s in zip(numbers, sums)]
+
+    happy = []
+    for n in numbers:
+        total = 0
+        while n:
+            n, chunk = divmod(n, 1000)
+            total += DIGIT_SQUARES[chunk]
+        happy.append(bool(_HAPPY[total]))
+    columns["happy"] = happy
+    columns["palindromic"] = [s == s[::-1] for s in map(str, numbers)]
+
+    for name, members in _members(a, b):
+        column = [False] * len(numbers)
+        for m in members:
+            column[m - a] = True
+        columns[name] = column
+    return columns
+
+
+def _check_range(a: int, b: int):
+    if a < 0 or a > b:
+        raise ValueError("The range must satisfy 0 <= a <= b")
+    if b > MAX_VALUE:
+        raise ValueError(f"Numbers cannot exceed {MAX_VALUE:,}")
+    if b - a + 1 > MAX_RANGE:
+        raise ValueError(f"Range cannot span more than {MAX_RANGE:,} numbers")
+
+
+def classify_range(a: int, b: int) -> dict:
+    """Classifies every integer in [a, b] by the properties in PROPERTY_COLUMNS at once.
+
+    Perfect, abundant, deficient and prime come from one divisor-sum sieve,
+    happiness from a table indexed by digit-square sums, and the sparse
+    properties (squares, cubes, triangular, Fibonacci and Armstrong numbers)
+    from their members in the range.
+
+    :param a: The lower bound, at least 0.
+    :param b: The upper bound, at most MAX_VALUE.
+    :return: {"n": numbers, property: column}, with NumPy arrays (boolean columns) when NumPy is
+             installed and lists otherwise.
+    :raises ValueError: If the range is invalid or spans more than MAX_RANGE numbers.
+    """
+    _check_range(a, b)
+    return _classify_numpy(a, b) if np is not None else _classify_python(a, b)
+
+
+def _csv_blocks(a: int, b: int, block: int):
+    yield ",".join(("n",) + PROPERTY_COLUMNS)
+    for lo in range(a, b + 1, block):
+        columns = classify_range(lo, min(lo + block - 1, b))
+        values = [columns["n"]] + [columns[name] for name in PROPERTY_COLUMNS]
+        if np is not None:
+            values = [column.astype(np.int64).tolist() for column in values]
+        else:
+            values = [values[0]] + [list(map(int, column)) for column in values[1:]]
+        yield "\n".join(",".join(map(str, row)) for row in zip(*values))
+
+
+def range_properties_csv(a: int, b: int, block: int = CSV_BLOCK):
+    """Returns an iterator over the classification of [a, b] as CSV text: the header, then block rows per chunk.
+
+    :raises ValueError: If the range is invalid.
+    """
+    _check_range(a, b)
+    return _csv_blocks(a, b, block)
+
+
+def range_properties(text: str):
+    """Parses a range "a-b" and returns its range_properties_csv() stream."""
+    bounds = parse_range(text)
+    if bounds is None:
+        raise ValueError("Enter a range such as 1-1000")
+    return range_properties_csv(*bounds)
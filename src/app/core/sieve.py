@@ -0,0 +1,248 @@
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, islice
+from .checkers import is_prime
+from .parallel import worker_count
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Odd numbers per segment: one byte each, so a segment stays in a 128 KiB L2 cache.
+SEGMENT_SIZE = 1 << 17
+# Ranges at least this wide are split into blocks sieved on a process pool.
+PARALLEL_MIN_RANGE = 1 << 26
+PARALLEL_BLOCK = 1 << 24
+# Multiples of these primes are cleared by copying a precomputed wheel pattern.
+WHEEL_PRIMES = (3, 5, 7, 11, 13)
+# Base primes are sieved up to at most SIEVE_MAX_BASE, and up to about the range width
+# (but at least PRESIEVE_MIN_BASE) for narrow ranges; when that stops short of
+# sqrt(b), the numbers left unmarked are confirmed with is_prime().
+SIEVE_MAX_BASE = 1 << 24
+PRESIEVE_MIN_BASE = 1 << 16
+_WHEEL_PERIOD = math.prod(WHEEL_PRIMES)
+
+
+def _base_primes(limit: int) -> list:
+    """Returns the odd primes up to limit with a plain odd-only sieve."""
+    if limit < 3:
+        return []
+    size = (limit - 1) // 2
+    flags = bytearray([1]) * size
+    for i in range((math.isqrt(limit) - 1) // 2):
+        if flags[i]:
+            p = 2 * i + 3
+            start = (p * p - 3) // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+    return list(compress(range(3, limit + 1, 2), flags))
+
+
+def _wheel_pattern() -> bytearray:
+    """Returns flags of the odd numbers 1, 3, 5, ... with the multiples of WHEEL_PRIMES cleared.
+
+    The pattern repeats every _WHEEL_PERIOD odd numbers; it is stored
+    one segment longer than that so any segment is a single slice of it.
+    """
+    pattern = bytearray([1]) * (_WHEEL_PERIOD + SEGMENT_SIZE)
+    for p in WHEEL_PRIMES:
+        start = p // 2
+        pattern[start::p] = bytes(len(range(start, len(pattern), p)))
+    return pattern
+
+
+_PATTERN = _wheel_pattern()
+
+
+def _sieve_segment(lo: int, size: int, primes: list):
+    """Sieves the odd numbers lo, lo + 2, ... (size of them) and returns their primality flags.
+
+    :param lo: The first number, which must be odd.
+    :param size: The number of odd numbers, at most SEGMENT_SIZE.
+    :param primes: The odd primes up to the square root of the last number.
+    :return: A bytearray, or a NumPy uint8 array when NumPy is installed.
+    """
+    offset = (lo // 2) % _WHEEL_PERIOD
+    if np is not None:
+        flags = np.frombuffer(_PATTERN, dtype=np.uint8, count=size, offset=offset).copy()
+    else:
+        flags = _PATTERN[offset:offset + size]
+    hi = lo + 2 * size
+    if lo <= WHEEL_PRIMES[-1]:
+        # The pattern also cleared the wheel primes themselves and kept 1.
+        for p in WHEEL_PRIMES:
+            if lo <= p < hi:
+                flags[(p - lo) // 2] = 1
+        if lo == 1:
+            flags[0] = 0
+    zeros = bytes(size)
+    for p in primes:
+        if p <= WHEEL_PRIMES[-1]:
+            continue
+        square = p * p
+        if square >= hi:
+            break
+        if square >= lo:
+            start = (square - lo) // 2
+        else:
+            # The first odd multiple of p at or after lo.
+            multiple = -(-lo // p) * p
+            if not multiple & 1:
+                multiple += p
+            start = (multiple - lo) // 2
+        if np is not None:
+            flags[start::p] = 0
+        else:
+            flags[start::p] = zeros[:len(range(start, size, p))]
+    return flags
+
+
+def _segments(a: int, b: int, primes: list):
+    """Yields (first odd number, flags) for consecutive segments covering the odd numbers in [a, b]."""
+    lo = a | 1
+    while lo <= b:
+        size = min(SEGMENT_SIZE, (b - lo) // 2 + 1)
+        yield lo, _sieve_segment(lo, size, primes)
+        lo += 2 * size
+
+
+def _sieving_primes(a: int, b: int) -> tuple:
+    """Returns (base primes, complete) for sieving [a, b]; complete is False when they stop short of sqrt(b)."""
+    root = math.isqrt(b)
+    limit = min(root, SIEVE_MAX_BASE, max(b - a + 1, PRESIEVE_MIN_BASE))
+    return _base_primes(limit), limit == root
+
+
+def _segment_primes(lo: int, flags, complete: bool = True) -> list:
+    if np is not None and lo + 2 * len(flags) < 1 << 63:
+        found = (np.flatnonzero(flags) * 2 + lo).tolist()
+    elif np is not None:
+        found = [lo + 2 * i for i in np.flatnonzero(flags).tolist()]
+    else:
+        found = list(compress(range(lo, lo + 2 * len(flags), 2), flags))
+    return found if complete else [n for n in found if is_prime(n)]
+
+
+def _segment_count(lo: int, flags, complete: bool = True) -> int:
+    if not complete:
+        return len(_segment_primes(lo, flags, False))
+    if np is not None:
+        return int(np.count_nonzero(flags))
+    return flags.count(1)
+
+
+def _block_primes(a: int, b: int, primes: list, complete: bool) -> list:
+    """Returns the odd primes in [a, b]; the unit of work of the process pool."""
+    result = []
+    for lo, flags in _segments(a, b, primes):
+        result.extend(_segment_primes(lo, flags, complete))
+    return result
+
+
+def _block_count(a: int, b: int, primes: list, complete: bool) -> int:
+    """Returns the number of odd primes in [a, b]; the unit of work of the process pool."""
+    return sum(_segment_count(lo, flags, complete) for lo, flags in _segments(a, b, primes))
+
+
+def _blocks(a: int, b: int):
+    return [(lo, min(lo + PARALLEL_BLOCK - 1, b)) for lo in range(a, b + 1, PARALLEL_BLOCK)]
+
+
+def _map_blocks(fn, a: int, b: int, primes: list, complete: bool, workers: int):
+    """Yields fn(lo, hi, primes, complete) for the blocks of [a, b] in order, with at most 2 * workers in flight."""
+    blocks = iter(_blocks(a, b))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(fn, lo, hi, primes, complete) for lo, hi in islice(blocks, 2 * workers))
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for lo, hi in islice(blocks, 1):
+                    pending.append(executor.submit(fn, lo, hi, primes, complete))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _pool_size(a: int, b: int, max_workers: int) -> int:
+    if b - a < PARALLEL_MIN_RANGE:
+        return 1
+    return worker_count(max_workers)
+
+
+def segmented_sieve(a: int, b: int, max_workers: int = None):
+    """Yields the primes in [a, b] in increasing order.
+
+    Odd numbers are sieved in SEGMENT_SIZE segments, each started from a
+    copy of a wheel pattern with the multiples of 3 to 13 already cleared, so
+    memory stays constant however wide the range is. The base primes stop at
+    SIEVE_MAX_BASE, or near the range width for narrow ranges, so a short
+    range of huge numbers does not sieve up to sqrt(b); the survivors are then
+    confirmed with is_prime(). Ranges of at least PARALLEL_MIN_RANGE numbers are
+    split into blocks sieved on a process pool.
+
+    :param a: The lower bound (inclusive).
+    :param b: The upper bound (inclusive).
+    :param max_workers: The size of the process pool (defaults to the CPU count).
+    """
+    a = max(a, 2)
+    if b < a:
+        return
+    if a == 2:
+        yield 2
+        a = 3
+    primes, complete = _sieving_primes(a, b)
+    workers = _pool_size(a, b, max_workers)
+    if workers > 1:
+        for block in _map_blocks(_block_primes, a, b, primes, complete, workers):
+            yield from block
+        return
+    for lo, flags in _segments(a, b, primes):
+        yield from _segment_primes(lo, flags, complete)
+
+
+def count_primes(a: int, b: int = None, max_workers: int = None) -> int:
+    """Counts the primes in [a, b], or the primes up to a when b is omitted.
+
+    :param a: The lower bound, or the upper bound when b is omitted.
+    :param b: The upper bound (inclusive).
+    :param max_workers: The size of the process pool for wide ranges.
+    """
+    if b is None:
+        a, b = 2, a
+    a = max(a, 2)
+    if b < a:
+        return 0
+    count = 0
+    if a == 2:
+        count, a = 1, 3
+    primes, complete = _sieving_primes(a, b)
+    workers = _pool_size(a, b, max_workers)
+    if workers > 1:
+        return count + sum(_map_blocks(_block_count, a, b, primes, complete, workers))
+    return count + _block_count(a, b, primes, complete)
+
+
+def nth_prime_upper_bound(n: int) -> int:
+    """Returns an upper bound of the n-th prime: n (ln n + ln ln n), valid for n >= 6."""
+    if n < 6:
+        return 13
+    return int(n * (math.log(n) + math.log(math.log(n)))) + 1
+
+
+def nth_prime(n: int) -> int:
+    """Returns the n-th prime (nth_prime(1) == 2), counting whole segments until the one that holds it."""
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    if n == 1:
+        return 2
+    bound = nth_prime_upper_bound(n)
+    primes = _base_primes(math.isqrt(bound))
+    remaining = n - 1
+    for lo, flags in _segments(3, bound, primes):
+        count = _segment_count(lo, flags)
+        if count >= remaining:
+            return _segment_primes(lo, flags)[remaining - 1]
+        remaining -= count
+    raise ValueError(f"No prime found below {bound}")
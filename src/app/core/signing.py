@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+from cryptography.hazmat.primitives import serialization
+from .converters import rsa_sign, rsa_verify, ecc_sign, ecc_verify, file_digest, load_key
+from .parallel import imap_unordered
+
+SIGNATURE_ALGORITHMS = {
+    "RSA": (rsa_sign, rsa_verify),
+    "ECC": (ecc_sign, ecc_verify),
+}
+MANIFEST_VERSION = 2
+
+
+def _signature_functions(algorithm: str):
+    try:
+        return SIGNATURE_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unsupported signature algorithm: {algorithm}")
+
+
+def _load(key, password: str = None):
+    return load_key(key, password)[0] if isinstance(key, str) else key
+
+
+def _public(key):
+    key = _load(key)
+    return key.public_key() if hasattr(key, "public_key") else key
+
+
+def _sign_with(sign, private_key, password):
+    # rsa_sign takes a password; ecc_sign does not, and a loaded key needs none.
+    if sign is rsa_sign:
+        return lambda message: sign(message, private_key, password)
+    return lambda message: sign(message, private_key)
+
+
+def sign_messages(messages, private_pem, algorithm: str = "RSA", password: str = None,
+                  max_workers: int = None):
+    """Signs many messages with one private key, loading the key once.
+
+    :param messages: An iterable of strings; it is consumed lazily.
+    :param private_pem: The PEM-encoded private key or a loaded key object.
+    :param algorithm: "RSA" (PSS, SHA-256) or "ECC" (ECDSA, SHA-256).
+    :param password: The password for an encrypted private key.
+    :param max_workers: The number of worker threads.
+    :return: A generator of (index, signature_b64) tuples in completion order.
+    :raises ValueError: If the algorithm is unknown or the key cannot be loaded.
+    """
+    sign, _ = _signature_functions(algorithm)
+    private_key = _load(private_pem, password)
+    yield from imap_unordered(_sign_with(sign, private_key, password), messages, max_workers)
+
+
+def verify_messages(items, public_pem, algorithm: str = "RSA", max_workers: int = None):
+    """Verifies many (message, signature_b64) pairs with one public key, loading the key once.
+
+    :param items: An iterable of (message, signature_b64) pairs; it is consumed lazily.
+    :param public_pem: The PEM-encoded public key or a loaded key object.
+    :param algorithm: "RSA" or "ECC".
+    :param max_workers: The number of worker threads.
+    :return: A generator of (index, valid) tuples in completion order.
+    :raises ValueError: If the algorithm is unknown or the key cannot be loaded.
+    """
+    _, verify = _signature_functions(algorithm)
+    public_key = _public(public_pem)
+
+    def check(item):
+        message, signature = item
+        try:
+            return verify(message, signature, public_key)
+        except Exception:
+            return False
+
+    yield from imap_unordered(check, items, max_workers)
+
+
+def sign_lines(text: str, private_pem, algorithm: str = "RSA") -> str:
+    """Signs each non-empty line and returns "<signature> <message>" lines."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    signatures = dict(sign_messages(lines, private_pem, algorithm))
+    return "\n".join(f"{signatures[i]} {line}" for i, line in enumerate(lines))
+
+
+def verify_lines(text: str, public_pem, algorithm: str = "RSA") -> str:
+    """Verifies "<signature> <message>" lines as produced by sign_lines."""
+    items = []
+    for line in text.splitlines():
+        if line.strip():
+            # sign_lines signed the line as is, so only the separator after the signature is removed.
+            signature, _, message = line.partition(" ")
+            items.append((message, signature))
+    results = dict(verify_messages(items, public_pem, algorithm))
+    output = [f"{'OK' if results[i] else 'FAILED'}: {message}" for i, (message, _) in enumerate(items)]
+    output.append(f"{sum(results.values())}/{len(items)} signatures valid")
+    return "\n".join(output)
+
+
+def _key_fingerprint(public_key) -> str:
+    der = public_key.public_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return hashlib.sha256(der).hexdigest()
+
+
+def _manifest_name(path: str, base_dir: str) -> str:
+    return os.path.relpath(path, base_dir).replace(os.sep, "/")
+
+
+def _manifest_message(name: str, digest: str) -> str:
+    """Returns the signed text of a manifest entry, which binds the digest to the file name."""
+    return f"{name}\0{digest}"
+
+
+def create_signature_manifest(paths, private_pem, algorithm: str = "RSA", base_dir: str = None,
+                              password: str = None, max_workers: int = None) -> dict:
+    """Creates a detached-signature manifest for a set of files.
+
+    Each file is hashed with SHA-256 and its name and hex digest are signed
+    together, so large artifacts are streamed from disk rather than loaded into
+    memory and an entry cannot be moved to another file name.
+
+    :param paths: An iterable of file paths.
+    :param private_pem: The PEM-encoded private key or a loaded key object.
+    :param algorithm: "RSA" or "ECC".
+    :param base_dir: The directory that manifest entries are relative to (defaults to the CWD).
+    :param password: The password for an encrypted private key.
+    :param max_workers: The number of worker threads.
+    :return: The manifest as a JSON-serializable dictionary.
+    """
+    sign, _ = _signature_functions(algorithm)
+    private_key = _load(private_pem, password)
+    base_dir = os.path.abspath(base_dir or os.getcwd())
+    paths = [os.path.abspath(path) for path in paths]
+    sign_message = _sign_with(sign, private_key, password)
+
+    def sign_file(path):
+        digest = file_digest(path, "SHA-256")
+        return digest, sign_message(_manifest_message(_manifest_name(path, base_dir), digest))
+
+    files = {}
+    for index, (digest, signature) in imap_unordered(sign_file, paths, max_workers):
+        files[_manifest_name(paths[index], base_dir)] = {"sha256": digest, "signature": signature}
+    return {
+        "version": MANIFEST_VERSION,
+        "algorithm": algorithm,
+        "digest": "SHA-256",
+        "key_fingerprint": _key_fingerprint(private_key.public_key()),
+        "files": dict(sorted(files.items())),
+    }
+
+
+def write_signature_manifest(manifest: dict, path: str) -> None:
+    """Writes a signature manifest as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+
+
+def read_signature_manifest(path: str) -> dict:
+    """Reads a signature manifest and checks its version."""
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version: {manifest.get('version')}")
+    return manifest
+
+
+def verify_signature_manifest(manifest, public_pem, base_dir: str = None, max_workers: int = None) -> dict:
+    """Verifies every file listed in a signature manifest.
+
+    :param manifest: A manifest dictionary or the path of a manifest file.
+    :param public_pem: The PEM-encoded public key or a loaded key object.
+    :param base_dir: The directory the entries are relative to (defaults to the
+                     manifest's directory, or the CWD for a dictionary).
+    :param max_workers: The number of worker threads.
+    :return: A dictionary mapping each entry to "valid", "invalid", "missing" or
+             "error" (a name outside base_dir or not a regular file, which is
+             never opened), or {"error": ...} if the manifest was made with another key.
+    """
+    if isinstance(manifest, str):
+        base_dir = base_dir or os.path.dirname(os.path.abspath(manifest))
+        manifest = read_signature_manifest(manifest)
+    base_dir = os.path.realpath(base_dir or os.getcwd())
+    _, verify = _signature_functions(manifest.get("algorithm", "RSA"))
+    public_key = _public(public_pem)
+    if manifest.get("key_fingerprint") not in (None, _key_fingerprint(public_key)):
+        return {"error": "The manifest was signed with a different key"}
+
+    entries = list(manifest.get("files", {}).items())
+
+    def check(entry):
+        name, record = entry
+        # Names come from the manifest, so absolute names, "..", symlinks out of
+        # base_dir and devices or FIFOs are refused before anything is opened.
+        path = os.path.realpath(os.path.join(base_dir, name.replace("/", os.sep)))
+        if os.path.commonpath([path, base_dir]) != base_dir:
+            return "error"
+        if not os.path.lexists(path):
+            return "missing"
+        if not os.path.isfile(path):
+            return "error"
+        digest = file_digest(path, "SHA-256")
+        if digest != record.get("sha256"):
+            return "invalid"
+        try:
+            message = _manifest_message(name, digest)
+            return "valid" if verify(message, record.get("signature", ""), public_key) else "invalid"
+        except Exception:
+            return "invalid"
+
+    results = {}
+    for index, status in imap_unordered(check, entries, max_workers):
+        results[entries[index][0]] = status
+    return dict(sorted(results.items()))
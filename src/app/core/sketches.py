@@ -0,0 +1,125 @@
+import heapq
+from collections import Counter
+from itertools import islice
+
+SKETCH_CAPACITY = 4096
+_BATCH_SIZE = 1 << 16
+
+
+class SpaceSaving:
+    """Approximate heavy hitters of a stream in bounded memory (Metwally et al.'s Space-Saving).
+
+    At most capacity items are monitored. An unmonitored item replaces the
+    one with the smallest count and inherits that count as its error, so for
+    every reported item count - error <= true count <= count, and any item
+    that is not reported occurred at most min_count() times. The minimum is
+    found with a lazy heap: increments do not touch it, and stale entries are
+    refreshed only when they reach the top.
+    """
+
+    def __init__(self, capacity: int = SKETCH_CAPACITY):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self.evictions = 0
+        self._counts = {}
+        self._heap = []
+        self._tick = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _entry(self, count: int, item) -> tuple:
+        # The tick keeps heap entries with equal counts from comparing items.
+        self._tick += 1
+        return count, self._tick, item
+
+    def _pop_min(self, remove: bool):
+        """Returns the monitored item with the smallest count, refreshing stale heap entries."""
+        heap, counts = self._heap, self._counts
+        while True:
+            count, _, item = heap[0]
+            current = counts[item][0]
+            if current == count:
+                if remove:
+                    heapq.heappop(heap)
+                return item, count
+            heapq.heapreplace(heap, self._entry(current, item))
+
+    def update(self, item, weight: int = 1) -> None:
+        """Counts weight occurrences of item."""
+        self.total += weight
+        entry = self._counts.get(item)
+        if entry is not None:
+            entry[0] += weight
+            return
+        if len(self._counts) < self.capacity:
+            self._counts[item] = [weight, 0]
+            heapq.heappush(self._heap, self._entry(weight, item))
+            return
+        victim, floor = self._pop_min(remove=True)
+        del self._counts[victim]
+        self.evictions += 1
+        self._counts[item] = [floor + weight, floor]
+        heapq.heappush(self._heap, self._entry(floor + weight, item))
+
+    def update_counts(self, counts) -> None:
+        """Counts a mapping of item -> occurrences, e.g. a Counter of one batch."""
+        for item, weight in counts.items():
+            self.update(item, weight)
+
+    def update_many(self, items) -> None:
+        """Counts an iterable of items, pre-aggregating each batch with a Counter."""
+        iterator = iter(items)
+        while True:
+            batch = Counter(islice(iterator, _BATCH_SIZE))
+            if not batch:
+                return
+            self.update_counts(batch)
+
+    def min_count(self) -> int:
+        """Returns the largest count an unreported item can have (0 while nothing was evicted)."""
+        if not self.evictions:
+            return 0
+        return self._pop_min(remove=False)[1]
+
+    def is_exact(self) -> bool:
+        """Returns whether nothing was evicted, so every count is exact."""
+        return self.evictions == 0
+
+    def top(self, k: int = None) -> list[tuple]:
+        """Returns up to k (item, count, error) tuples, highest count first."""
+        items = ((item, count, error) for item, (count, error) in self._counts.items())
+        if k is None:
+            return sorted(items, key=lambda x: x[1], reverse=True)
+        return heapq.nlargest(k, items, key=lambda x: x[1])
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Merges another summary into this one, keeping the error guarantee.
+
+        An item missing from one summary may have occurred up to that
+        summary's min_count() times there, so that amount is added to both its
+        count and its error before the largest capacity counts are kept.
+        """
+        floor_a, floor_b = self.min_count(), other.min_count()
+        merged = {}
+        for item in self._counts.keys() | other._counts.keys():
+            count_a, error_a = self._counts.get(item, (floor_a, floor_a))
+            count_b, error_b = other._counts.get(item, (floor_b, floor_b))
+            merged[item] = [count_a + count_b, error_a + error_b]
+        kept = heapq.nlargest(self.capacity, merged.items(), key=lambda x: x[1][0])
+        self.evictions += other.evictions + len(merged) - len(kept)
+        self.total += other.total
+        self._counts = dict(kept)
+        self._heap = [self._entry(count, item) for item, (count, _) in kept]
+        heapq.heapify(self._heap)
+        return self
+
+
+def top_counts(counts, k: int) -> list[tuple]:
+    """Returns the k (item, count) pairs with the highest counts, ties in insertion order.
+
+    Equivalent to sorting all items by count, but in O(n log k).
+    """
+    return heapq.nlargest(k, counts.items(), key=lambda x: x[1])
@@ -0,0 +1,308 @@
+import codecs
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from .analyzers import (
+    NumberScan, number_tail_start, profile_from_counts, sketch_frequency_result, character_stats_from_profile,
+    character_frequency_from_profile
+)
+from .number_stats import DEFAULT_PERCENTILES, RunningStats
+from .parallel import worker_count
+from .sketches import SKETCH_CAPACITY, SpaceSaving, top_counts
+
+STREAM_CHUNK_SIZE = 1 << 20
+FILE_SEGMENT_SIZE = 64 << 20
+NUMBER_SAMPLE_SIZE = 10
+# Once this many distinct numbers are counted, the exact Counter is folded
+# into a Space-Saving sketch so memory stays bounded.
+FREQUENCY_SKETCH_DISTINCT = 1 << 18
+
+
+class TextAccumulator:
+    """Mergeable partial state of the character and number analyzers.
+
+    Feed consecutive chunks with feed(), call close() at the end of the
+    segment, and combine segments in order with merge(). Segments processed
+    separately must be split at a newline so that no number token spans two
+    of them. Memory is bounded by the distinct characters and, when
+    track_frequency is set, by FREQUENCY_SKETCH_DISTINCT numbers; beyond
+    that, number frequencies become approximate.
+    """
+
+    def __init__(self, track_frequency: bool = True, frequency_capacity: int = SKETCH_CAPACITY):
+        self.counts = Counter()
+        self.total = 0
+        self.words = 0
+        self.starts_in_word = None
+        self.ends_in_word = False
+        self.track_frequency = track_frequency
+        self.frequency_capacity = frequency_capacity
+        self.number_counts = Counter()
+        self.number_count = 0
+        self.int_sum = 0
+        self.float_sum = 0.0
+        self.min = None
+        self.max = None
+        self.integers = 0
+        self.positive = 0
+        self.negative = 0
+        self.zero = 0
+        self.even = 0
+        self.sample = []
+        self._carry = ""
+
+    def feed(self, chunk: str) -> None:
+        """Adds the next chunk of text."""
+        if not chunk:
+            return
+        self.counts.update(chunk)
+        self.total += len(chunk)
+        words = len(chunk.split())
+        if words:
+            if self.ends_in_word and not chunk[0].isspace():
+                words -= 1
+            self.words += words
+        if self.starts_in_word is None:
+            self.starts_in_word = not chunk[0].isspace()
+        self.ends_in_word = not chunk[-1].isspace()
+
+        text = self._carry + chunk
+        cut = number_tail_start(text)
+        self._add_numbers(text[:cut])
+        self._carry = text[cut:]
+
+    def close(self) -> "TextAccumulator":
+        """Flushes the number token held back at the end of the fed text."""
+        self._add_numbers(self._carry)
+        self._carry = ""
+        return self
+
+    def _add_numbers(self, text: str) -> None:
+        scan = NumberScan.from_text(text)
+        if not len(scan):
+            return
+        self.number_count += len(scan)
+        if len(self.sample) < NUMBER_SAMPLE_SIZE:
+            self.sample.extend(scan.head(NUMBER_SAMPLE_SIZE - len(self.sample)))
+        if self.track_frequency:
+            if isinstance(self.number_counts, SpaceSaving):
+                self.number_counts.update_many(scan.iter_numbers())
+            else:
+                self.number_counts.update(scan.numbers())
+                if len(self.number_counts) > FREQUENCY_SKETCH_DISTINCT:
+                    self.number_counts = self._as_sketch(self.number_counts)
+        low, high = scan.min(), scan.max()
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        self.int_sum += scan.int_sum()
+        self.float_sum = sum(scan.floats, self.float_sum)
+        counts = scan.counts()
+        for attr in ("integers", "positive", "negative", "zero", "even"):
+            setattr(self, attr, getattr(self, attr) + counts[attr])
+
+    def _as_sketch(self, counts) -> SpaceSaving:
+        if isinstance(counts, SpaceSaving):
+            return counts
+        sketch = SpaceSaving(self.frequency_capacity)
+        sketch.update_counts(counts)
+        return sketch
+
+    def merge(self, other: "TextAccumulator") -> "TextAccumulator":
+        """Appends the state of the segment that directly follows this one."""
+        if self._carry or other._carry:
+            raise ValueError("Close both accumulators before merging")
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.words += other.words
+        if self.ends_in_word and other.starts_in_word:
+            self.words -= 1
+        if other.total:
+            if self.starts_in_word is None:
+                self.starts_in_word = other.starts_in_word
+            self.ends_in_word = other.ends_in_word
+        self.track_frequency = self.track_frequency and other.track_frequency
+        if isinstance(self.number_counts, SpaceSaving) or isinstance(other.number_counts, SpaceSaving):
+            self.number_counts = self._as_sketch(self.number_counts).merge(self._as_sketch(other.number_counts))
+        else:
+            self.number_counts.update(other.number_counts)
+        self.number_count += other.number_count
+        self.int_sum += other.int_sum
+        self.float_sum += other.float_sum
+        for attr, pick in (("min", min), ("max", max)):
+            mine, theirs = getattr(self, attr), getattr(other, attr)
+            setattr(self, attr, theirs if mine is None else mine if theirs is None else pick(mine, theirs))
+        for attr in ("integers", "positive", "negative", "zero", "even"):
+            setattr(self, attr, getattr(self, attr) + getattr(other, attr))
+        self.sample.extend(other.sample[:NUMBER_SAMPLE_SIZE - len(self.sample)])
+        return self
+
+    def profile(self) -> dict:
+        """Returns the text_profile dictionary of everything fed so far."""
+        return profile_from_counts(self.counts, self.total, self.words)
+
+    def character_stats(self) -> dict:
+        """Returns the same dictionary as analyzers.character_stats."""
+        if not self.total:
+            return {"error": "No text provided"}
+        return character_stats_from_profile(self.profile())
+
+    def character_frequency(self) -> dict:
+        """Returns the same dictionary as analyzers.character_frequency_analysis."""
+        if not self.total:
+            return {"error": "No text provided"}
+        return character_frequency_from_profile(self.profile())
+
+    def number_analysis(self) -> dict:
+        """Returns the analyzers.number_analysis dictionary; numbers_list holds the first numbers only."""
+        if not self.number_count:
+            return {"error": "No numbers found in text"}
+        total = self.int_sum + self.float_sum if self.integers < self.number_count else self.int_sum
+        return {
+            "total_numbers": self.number_count,
+            "sum": total,
+            "average": round(total / self.number_count, 4),
+            "min": self.min,
+            "max": self.max,
+            "integers": self.integers,
+            "floats": self.number_count - self.integers,
+            "positive": self.positive,
+            "negative": self.negative,
+            "zero": self.zero,
+            "even": self.even,
+            "odd": self.integers - self.even,
+            "numbers_list": list(self.sample)
+        }
+
+    def number_frequency(self, top_k: int = 15) -> dict:
+        """Returns the same dictionary as analyzers.number_frequency_analysis."""
+        if not self.number_count:
+            return {"error": "No numbers found in text"}
+        if not self.track_frequency:
+            return {"error": "Number frequencies were not tracked"}
+        if isinstance(self.number_counts, SpaceSaving):
+            return sketch_frequency_result(self.number_counts, top_k)
+        frequency = dict(self.number_counts)
+        return {
+            "number_frequency": frequency,
+            "most_common_numbers": top_counts(frequency, top_k),
+            "unique_numbers": len(frequency),
+            "total_numbers": self.number_count
+        }
+
+
+def analyze_stream(stream, chunk_size: int = STREAM_CHUNK_SIZE, track_frequency: bool = True) -> TextAccumulator:
+    """Feeds a text stream (an object with read(size) returning str) into a closed accumulator."""
+    accumulator = TextAccumulator(track_frequency)
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return accumulator.close()
+        accumulator.feed(chunk)
+
+
+def basic_statistics_stream(stream, chunk_size: int = STREAM_CHUNK_SIZE,
+                            percentile_points=DEFAULT_PERCENTILES) -> dict:
+    """Summarizes the numbers of a text stream in constant memory.
+
+    Count, mean, variance, minimum and maximum are exact; the median and the
+    percentiles are P-square estimates, so the result is marked "approximate".
+    """
+    stats = RunningStats(sorted(set(percentile_points) | {50}))
+    carry = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        text = carry + chunk
+        cut = number_tail_start(text) if chunk else len(text)
+        carry = text[cut:]
+        stats.update(NumberScan.from_text(text[:cut]).numbers())
+        if not chunk:
+            break
+    if not stats.count:
+        return {"error": "No numbers found for statistical analysis"}
+    estimates = stats.percentiles()
+    variance = stats.variance()
+    return {
+        "count": stats.count,
+        "mean": stats.mean,
+        "median": estimates[50],
+        "variance": variance,
+        "standard_deviation": variance ** 0.5,
+        "min": stats.min,
+        "max": stats.max,
+        "percentiles": {q: estimates[q] for q in percentile_points},
+        "approximate": True,
+    }
+
+
+def _analyze_segment(path: str, start: int, end: int, encoding: str, chunk_size: int,
+                     track_frequency: bool) -> TextAccumulator:
+    """Analyzes bytes [start, end) of a file; runs in a worker process."""
+    accumulator = TextAccumulator(track_frequency)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = f.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            accumulator.feed(decoder.decode(data))
+    accumulator.feed(decoder.decode(b"", final=True))
+    return accumulator.close()
+
+
+def _segment_bounds(path: str, segment_size: int) -> list[tuple[int, int]]:
+    """Splits a file into byte ranges that each end just after a newline."""
+    size = os.path.getsize(path)
+    bounds = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = min(start + segment_size, size)
+            f.seek(end)
+            while end < size:
+                block = f.read(STREAM_CHUNK_SIZE)
+                newline = block.find(b"\n")
+                if newline >= 0:
+                    end += newline + 1
+                    break
+                end += len(block)
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def analyze_file(path: str, encoding: str = "utf-8", max_workers: int = None,
+                 segment_size: int = FILE_SEGMENT_SIZE, chunk_size: int = STREAM_CHUNK_SIZE,
+                 track_frequency: bool = True) -> TextAccumulator:
+    """Analyzes a file of any size, splitting it at newlines across worker processes.
+
+    Each worker reads its segment in chunk_size pieces, so memory stays bounded
+    however large the file is. Encodings whose newline is not the single byte
+    0x0A (such as UTF-16) are processed as one segment.
+
+    :param path: The file to analyze.
+    :param encoding: The text encoding; undecodable bytes are replaced.
+    :param max_workers: The number of worker processes (1 analyzes in this process).
+    :param segment_size: The approximate number of bytes per worker task.
+    :param chunk_size: The number of bytes read at a time.
+    :param track_frequency: Whether to count number frequencies (approximately once there are many distinct numbers).
+    :return: A closed TextAccumulator for the whole file.
+    """
+    if "\n".encode(encoding) == b"\n":
+        bounds = _segment_bounds(path, segment_size)
+    else:
+        bounds = [(0, os.path.getsize(path))]
+    workers = min(worker_count(max_workers), len(bounds))
+    if workers <= 1:
+        parts = [_analyze_segment(path, start, end, encoding, chunk_size, track_frequency)
+                 for start, end in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_analyze_segment, *zip(*[
+                (path, start, end, encoding, chunk_size, track_frequency) for start, end in bounds])))
+    result = TextAccumulator(track_frequency)
+    for part in parts:
+        result.merge(part)
+    return result
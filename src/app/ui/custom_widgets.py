@@ -1,3 +1,4 @@
+import inspect
 from PyQt6.QtWidgets import QSlider, QKeySequenceEdit
 from PyQt6.QtCore import pyqtSignal, QObject, Qt
 from PyQt6.QtGui import QKeyEvent
@@ -6,6 +7,8 @@ from PyQt6.QtWidgets import QStyle, QStyleOptionSlider, QWidget
 class Worker(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
+    # Emitted for every chunk when the task returns a generator; finished then carries None.
+    chunk = pyqtSignal(str)
 
     def __init__(self, fn, *args, **kwargs):
         super().__init__()
@@ -16,6 +19,10 @@ class Worker(QObject):
     def run(self):
         try:
             result = self.fn(*self.args, **self.kwargs)
+            if inspect.isgenerator(result):
+                for part in result:
+                    self.chunk.emit(part)
+                result = None
             self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
@@ -1,5 +1,6 @@
 from ..core.dispatcher import detect_conversion_type
-from ..core.converters import convert_color
+from ..core.converters import convert_color, set_kdf_parameters
+from ..core.key_pool import configure_key_pool, disable_key_pool
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QLineEdit, QTextEdit, QFrame,
     QVBoxLayout, QHBoxLayout, QTabWidget, QGridLayout, QGraphicsOpacityEffect,
@@ -31,7 +32,7 @@ from .ui_cipher_detection import setup_cipher_detection_page, apply_cipher_detec
 from .ui_repl import setup_repl_page
 from .widget_factory import WidgetFactory
 from .ui_regex_tester import setup_regex_visualizer_page
-from ..core.data import APP_CONFIG, SHORT_NAMES, SOUNDS, REPL_CONTEXT, STYLES, DARK_MODE_STYLES, BRAILLE_CHARS, MENU_DEFINITIONS, PRESERVE_NEWLINES_MODES, UNIT_CATEGORIES, MENU_STRUCTURE
+from ..core.data import APP_CONFIG, SHORT_NAMES, SOUNDS, REPL_CONTEXT, STYLES, DARK_MODE_STYLES, BRAILLE_CHARS, MENU_DEFINITIONS, PRESERVE_NEWLINES_MODES, UNIT_CATEGORIES, MENU_STRUCTURE, KEY_POOL_SETTINGS
 import os
 
 
@@ -437,12 +438,27 @@ class Window(QMainWindow):
                 {"key": "", "action": "None"},
                 {"key": "", "action": "None"},
                 {"key": "", "action": "None"}
-            ]
+            ],
+            "kdf_parameters": {},
+            "key_pool": dict(KEY_POOL_SETTINGS)
         }
 
         self.settings = defaults
         self.settings.update(loaded_settings)
 
+        try:
+            set_kdf_parameters(self.settings.get("kdf_parameters"))
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"Ignoring invalid KDF parameters: {e}")
+            self.settings["kdf_parameters"] = {}
+
+        try:
+            configure_key_pool(self.settings.get("key_pool"))
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"Ignoring invalid key pool settings: {e}")
+            self.settings["key_pool"] = dict(KEY_POOL_SETTINGS)
+            configure_key_pool(self.settings["key_pool"])
+
         # Ensure shortcuts list is the correct length
         num_shortcuts = 4
         if len(self.settings.get("shortcuts", [])) < num_shortcuts:
@@ -471,7 +487,9 @@ class Window(QMainWindow):
             "volume": int(self.settings.get("volume", 80)),
             "language": str(self.settings.get("language", "English")),
             "dark_mode": bool(self.settings.get("dark_mode", False)),
-            "shortcuts": clean_shortcuts
+            "shortcuts": clean_shortcuts,
+            "kdf_parameters": self.settings.get("kdf_parameters", {}),
+            "key_pool": self.settings.get("key_pool", dict(KEY_POOL_SETTINGS))
         }
 
         with open(self.settings_file, 'w', encoding='utf-8') as f:
@@ -732,9 +750,24 @@ class Window(QMainWindow):
 
             return detect_conversion_type(text, tab_name, base=base_value, mode=mode, mode2=mode2)
 
+        streamed = []
+
+        def on_chunk(part):
+            """Appends a chunk of a streamed generator result as soon as it is produced."""
+            if not streamed:
+                safe_text = text.replace('<', '&lt;').replace('>', '&gt;')
+                black_rect.append(f">>> {safe_text}")
+                black_rect.append("<<<")
+            streamed.append(True)
+            black_rect.append(part)
+
         def on_finished(result):
             """Handles the successful result from the worker thread."""
-            self.display_result(result, text, tab_name, black_rect, line_edit)
+            if streamed:
+                black_rect.append("")
+                line_edit.clear()
+            else:
+                self.display_result(result, text, tab_name, black_rect, line_edit)
             QApplication.restoreOverrideCursor()
             self.thread.quit() 
 
@@ -752,6 +785,7 @@ class Window(QMainWindow):
         self.thread.finished.connect(self.thread.deleteLater)
         self.worker.finished.connect(self.worker.deleteLater)
         self.thread.started.connect(self.worker.run)
+        self.worker.chunk.connect(on_chunk)
         self.worker.finished.connect(on_finished)
         self.worker.error.connect(on_error)
         self.thread.start()
@@ -922,6 +956,10 @@ class Window(QMainWindow):
                               alignment=Qt.AlignmentFlag.AlignHCenter)
         layout.addStretch(3)
 
+    def closeEvent(self, event):
+        disable_key_pool()
+        super().closeEvent(event)
+
     def apply_settings(self):
         self.set_sound_volume(self.settings["volume"])
         self.update_ui_text()
@@ -30,6 +30,17 @@ def setup_cipher_detection_page(window_instance):
         button_type='icon_inside', parent_widget=window_instance.cipher_detection_input)
     run_button.clicked.connect(partial(window_instance.update_black_rect, window_instance.cipher_detection_input, window_instance.cipher_detection_output, None, "Cipher Detection"))
     window_instance.create_btn(None, copy_btn=True, black_rect_widget=window_instance.cipher_detection_output)
+
+    window_instance.auto_decode_button = QPushButton(window_instance.tr("Auto Decode"))
+    window_instance.auto_decode_button.setCursor(window_instance.Cursor)
+    window_instance.auto_decode_button.setFont(window_instance.Font1)
+    window_instance.auto_decode_button.setFixedSize(190, 45)
+    window_instance.auto_decode_button.setObjectName("mainMenuButton")
+    button_style = DARK_MODE_STYLES["mainMenuButton_dark"] if window_instance.settings.get("dark_mode") else STYLES["menu_button"]
+    window_instance.auto_decode_button.setStyleSheet(button_style)
+    window_instance.auto_decode_button.clicked.connect(partial(window_instance.play_sound, "click"))
+    window_instance.auto_decode_button.clicked.connect(partial(window_instance.update_black_rect, window_instance.cipher_detection_input, window_instance.cipher_detection_output, None, "Auto Decode"))
+    view_layout.addWidget(window_instance.auto_decode_button, alignment=Qt.AlignmentFlag.AlignCenter)
     layout.addWidget(container_widget, 0, Qt.AlignmentFlag.AlignCenter)
     return page
 
@@ -43,9 +54,11 @@ def apply_cipher_detection_theme(window_instance):
     if dark_mode:
         window_instance.cipher_detection_input.setStyleSheet(DARK_MODE_STYLES["text_edit"])
         window_instance.cipher_detection_output.setStyleSheet(DARK_MODE_STYLES["text_edit"])
+        window_instance.auto_decode_button.setStyleSheet(DARK_MODE_STYLES["mainMenuButton_dark"])
     else: 
         window_instance.cipher_detection_input.setStyleSheet(STYLES["text_edit_light"])
         window_instance.cipher_detection_output.setStyleSheet(STYLES["text_edit"])
+        window_instance.auto_decode_button.setStyleSheet(STYLES["menu_button"])
     
     if hasattr(window_instance.cipher_detection_input, 'run_button'):
         icon_path = window_instance.run_button_svg_path if dark_mode else window_instance.run_button_black_svg_path
@@ -140,7 +140,7 @@ def setup_tabs_widget(window_instance, tabs_info, base_placeholder="Base", paren
                 line_edit.move(start_x, y_pos)
                 window_instance.line_edits.append(line_edit)
 
-                placeholder_text = window_instance.tr("Public Key") if "Encrypt" in name else window_instance.tr("Private Key")
+                placeholder_text = window_instance.tr("Public Key") if "Encrypt" in name or "Verify" in name else window_instance.tr("Private Key")
                 base_input = window_instance.widget_factory.create_line_edit(
                     style=text_edit_style, text_edit=True, w=345, h=150, placeholder=placeholder_text, parent=widget)
                 base_input.setWordWrapMode(QTextOption.WrapMode.WrapAnywhere)
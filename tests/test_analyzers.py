@@ -1,6 +1,8 @@
 import unittest
 import sys
 import os
+import time
+from collections import Counter
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
@@ -8,8 +10,14 @@ from app.core.analyzers import (
     calculate_ic,
     calculate_entropy,
     character_stats,
-    extract_numbers
+    detect_repeated_sequences,
+    extract_numbers,
+    number_analysis,
+    NumberScan,
+    format_extracted_numbers,
+    text_profile
 )
+from app.core import analyzers
 
 class TestAnalyzers(unittest.TestCase):
 
@@ -27,9 +35,69 @@ class TestAnalyzers(unittest.TestCase):
         self.assertEqual(stats["digit_count"], 3)
         self.assertEqual(stats["punctuation_count"], 1)
 
+    def test_text_profile_paths_agree(self):
+        """Tests that the Counter and NumPy profile paths give the same result."""
+        text = ("Hello  World\t42!\nÉtude ٣ 😀 " * 5000)[:-1]
+        profile = text_profile(text)
+        self.assertEqual(profile["word_count"], len(text.split()))
+        self.assertEqual(profile["line_count"], text.count("\n") + 1)
+        self.assertAlmostEqual(profile["entropy"], calculate_entropy(text))
+        saved = analyzers.np
+        analyzers.np = None
+        try:
+            fallback = text_profile(text)
+        finally:
+            analyzers.np = saved
+        self.assertEqual(list(fallback.pop("character_frequency").items()),
+                         list(profile.pop("character_frequency").items()))
+        self.assertAlmostEqual(fallback.pop("entropy"), profile.pop("entropy"))
+        self.assertEqual(fallback, profile)
+
+    def test_text_profile_many_distinct_characters(self):
+        """Tests that first-occurrence order is found in one pass when a long text has many distinct characters."""
+        text = "ab c\n" * 400000 + "".join(chr(0x4E00 + i) for i in reversed(range(20000)))
+        start = time.perf_counter()
+        profile = text_profile(text)
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertEqual(list(profile["character_frequency"].items()), list(Counter(text).items()))
+
     def test_extract_numbers(self):
         """Tests the number extraction function."""
         self.assertEqual(extract_numbers("data 10, -3.14, and 42."), [10, -3.14, 42])
 
+    def test_number_scan(self):
+        """Tests typed-array scanning with big integers, chunked input and the analysis built on it."""
+        text = "a 7, -2.5 then 123456789012345678901234 and 4. -8 0"
+        scan = NumberScan.from_text(text)
+        self.assertEqual(scan.numbers(), [7, -2.5, 123456789012345678901234, 4.0, -8, 0])
+        self.assertEqual(list(scan.ints), [7, -8, 0])
+        self.assertEqual(scan.big_ints, {2: 123456789012345678901234})
+        chunked = NumberScan()
+        for i in range(0, len(text), 3):
+            chunked.feed(text[i:i + 3])
+        self.assertEqual(chunked.close().numbers(), scan.numbers())
+        stats = number_analysis(text)
+        self.assertEqual((stats["sum"], stats["min"], stats["max"]), (123456789012345678901234 - 6.5, -8, 123456789012345678901234))
+        self.assertEqual((stats["integers"], stats["even"], stats["zero"], stats["negative"]), (4, 3, 1, 2))
+
+    def test_number_scan_skips_unconvertible_integers(self):
+        """Tests that an integer beyond the int string-conversion limit is skipped like before, not fatal."""
+        text = "1 2.5 " + "9" * 5000 + " 3 -4"
+        self.assertEqual(NumberScan.from_text(text).numbers(), [1, 2.5, 3, -4])
+        self.assertEqual(extract_numbers(text), [1, 2.5, 3, -4])
+        self.assertEqual(number_analysis(text)["total_numbers"], 4)
+        self.assertEqual(format_extracted_numbers(text), "Extracted numbers: [1, 2.5, 3, -4]")
+
+    def test_detect_repeated_sequences(self):
+        """Tests that repeats are counted like str.count and ranked by count or length."""
+        result = detect_repeated_sequences("abcabcabc")
+        self.assertEqual(result["repeated_sequences"],
+                         [("abc", 3), ("ab", 3), ("bc", 3), ("bca", 2), ("cab", 2), ("ca", 2)])
+        self.assertEqual(detect_repeated_sequences("aaaa  aaaa")["repeated_sequences"][0], ("aa", 4))
+        text = "the key is KEYWORD; again KEYWORD, and KEYWORD"
+        result = detect_repeated_sequences(text, max_length=None, top_k=1, sort_by="length", positions=True)
+        self.assertEqual(result["repeated_sequences"], [(" KEYWORD", 3)])
+        self.assertEqual(result["positions"][" KEYWORD"], [10, 25, 38])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
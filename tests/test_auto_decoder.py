@@ -0,0 +1,38 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core.auto_decoder import auto_decode, plaintext_score
+from app.core.converters import word_to_basen, rot_n_encrypt, text_to_morse
+from app.core.dispatcher import detect_conversion_type
+
+PLAINTEXT = "The quick brown fox jumps over the lazy dog and the secret key is hidden here"
+
+
+class TestAutoDecoder(unittest.TestCase):
+
+    def test_auto_decode_layers(self):
+        """Tests that layered encodings are peeled off in the right order."""
+        layered = word_to_basen(word_to_basen(rot_n_encrypt(PLAINTEXT, 5), 32), 64)
+        for max_workers in (1, 2):
+            result = auto_decode(layered, max_workers=max_workers)
+            self.assertTrue(result["solved"])
+            self.assertEqual(result["results"][0]["chain"], ["Base64", "Base32", "ROT-5"])
+            self.assertEqual(result["results"][0]["output"], PLAINTEXT)
+        result = auto_decode(text_to_morse(PLAINTEXT))
+        self.assertEqual(result["results"][0]["output"], PLAINTEXT.upper())
+        self.assertIn("error", auto_decode("  "))
+
+    def test_scoring_and_base_fallback(self):
+        """Tests the plaintext score and the Base-N direction guess without a mode."""
+        self.assertGreater(plaintext_score(PLAINTEXT), plaintext_score(word_to_basen(PLAINTEXT, 64)))
+        self.assertGreater(plaintext_score(PLAINTEXT), plaintext_score(rot_n_encrypt(PLAINTEXT, 7)))
+        self.assertEqual(detect_conversion_type("SGVsbG8gd29ybGQ=", "Base64"), "Hello world")
+        self.assertEqual(detect_conversion_type("48 65 6C 6C 6F", "Base16"), "Hello")
+        self.assertEqual(detect_conversion_type("hello world", "Base16"), word_to_basen("hello world", 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
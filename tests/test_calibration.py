@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+import copy
+import base64
+import struct
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core.calibration import calibrate
+from app.core.converters import (
+    set_kdf_parameters, bcrypt_hash, scrypt_hash, scrypt_verify, aes_encrypt, aes_decrypt,
+    des_decrypt, blowfish_decrypt, derive_key, batch_hash_passwords, KDF_HEADER_MAGIC,
+    LEGACY_DERIVE_KEY_PARAMETERS,
+)
+from Crypto.Cipher import Blowfish
+from cryptography.hazmat.primitives import padding
+from app.core.data import KDF_PARAMETERS
+
+
+class TestCalibration(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = copy.deepcopy(KDF_PARAMETERS)
+
+    def tearDown(self):
+        set_kdf_parameters(self.saved)
+
+    def test_calibrate_respects_limits(self):
+        """Tests that calibrated parameters stay within the memory limit and can be applied."""
+        params = calibrate(target_ms=5, max_memory=1024 * 1024, samples=1)
+        self.assertLessEqual(128 * params["scrypt"]["r"] * params["scrypt"]["n"], 1024 * 1024)
+        self.assertLessEqual(params["argon2"]["memory_cost"], 1024)
+        set_kdf_parameters(params)
+        self.assertTrue(bcrypt_hash("pw").startswith(f"$2b${params['bcrypt']['rounds']:02d}$"))
+
+    def test_set_kdf_parameters(self):
+        """Tests that new scrypt costs apply and invalid parameters are rejected."""
+        old = scrypt_hash("pw", b"salt")
+        set_kdf_parameters({"scrypt": {"n": 2**10}})
+        self.assertNotEqual(scrypt_hash("pw", b"salt"), old)
+        self.assertTrue(scrypt_verify("pw", old, b"salt", n=2**14))
+        with self.assertRaises(ValueError):
+            set_kdf_parameters({"bcrypt": {"cost": 10}})
+
+    def test_invalid_kdf_values_are_rejected(self):
+        """Tests that out-of-range costs are rejected and leave the current parameters unchanged."""
+        for parameters in ({"scrypt": {"n": 1000}}, {"derive_key": {"n": 1}}, {"scrypt": {"r": 0}},
+                           {"bcrypt": {"rounds": 3}}, {"bcrypt": {"rounds": 32}},
+                           {"argon2": {"time_cost": 0}}, {"argon2": {"parallelism": -1}}):
+            with self.assertRaises(ValueError):
+                set_kdf_parameters(parameters)
+        self.assertEqual(KDF_PARAMETERS, self.saved)
+
+    def test_ciphertexts_survive_derive_key_changes(self):
+        """Tests that ciphertexts record their scrypt cost and still decrypt after it changes."""
+        set_kdf_parameters({"derive_key": {"n": 2**10, "r": 4}})
+        ciphertext = aes_encrypt("secret", "pw")
+        set_kdf_parameters({"derive_key": {"n": 2**11, "r": 8}})
+        self.assertEqual(aes_decrypt(ciphertext, "pw"), "secret")
+
+    def test_excessive_ciphertext_costs_are_rejected(self):
+        """Tests that crafted KDF headers are rejected before any key is derived."""
+        start = time.perf_counter()
+        for log_n, r, p in ((22, 8, 1), (14, 8, 1000), (40, 8, 1), (0, 8, 1), (14, 0, 1)):
+            data = struct.pack(">4sBII", KDF_HEADER_MAGIC, log_n, r, p) + bytes(40)
+            for decrypt in (aes_decrypt, des_decrypt):
+                with self.assertRaises(ValueError):
+                    decrypt(base64.b64encode(data).decode(), "pw")
+        self.assertLess(time.perf_counter() - start, 1)
+        with self.assertRaises(ValueError):
+            set_kdf_parameters({"derive_key": {"n": 2**21}})
+
+    def test_legacy_ciphertexts_decrypt(self):
+        """Tests that ciphertexts without the KDF header are decrypted with the original cost."""
+        set_kdf_parameters({"derive_key": {"n": 2**10}})
+        salt, iv = b"s" * 16, b"i" * 8
+        key = derive_key("pw", salt, 32, LEGACY_DERIVE_KEY_PARAMETERS)
+        padder = padding.PKCS7(64).padder()
+        ct = Blowfish.new(key, Blowfish.MODE_CBC, iv).encrypt(padder.update(b"old") + padder.finalize())
+        self.assertEqual(blowfish_decrypt(base64.b64encode(salt + iv + ct).decode(), "pw"), "old")
+
+
+    def test_batch_hashing_uses_new_argon2_costs(self):
+        """Tests that the batch API hashes with the Argon2 costs set after import."""
+        set_kdf_parameters({"argon2": {"memory_cost": 8, "time_cost": 1, "parallelism": 1}})
+        [(_, hashed, _)] = batch_hash_passwords(["pw"], "Argon2")
+        self.assertTrue(hashed.startswith("$argon2id$v=19$m=8,t=1,p=1$"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,12 +5,22 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from app.core.checkers import (
+    is_prime,
     is_prime_check,
+    factorize,
+    prime_factors,
+    get_proper_divisors,
     is_divisible,
     find_divisors,
     is_perfect_square,
     is_armstrong,
-    is_happy
+    is_happy,
+    is_perfect_cube,
+    is_perfect_power,
+    is_fibonacci,
+    is_triangular,
+    check_batch,
+    BATCH_CHECKS
 )
 
 class TestCheckers(unittest.TestCase):
@@ -22,6 +32,35 @@ class TestCheckers(unittest.TestCase):
         self.assertEqual(is_prime_check("1"), "False")
         self.assertEqual(is_prime_check("invalid"), "Error: Invalid input")
 
+    def test_is_prime_engine(self):
+        """Tests trial division, deterministic Miller-Rabin and BPSW against known primes and pseudoprimes."""
+        limit = 20000
+        sieve = [True] * limit
+        sieve[0] = sieve[1] = False
+        for i in range(2, int(limit ** 0.5) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = [False] * len(range(i * i, limit, i))
+        self.assertEqual([n for n in range(limit) if is_prime(n)], [n for n in range(limit) if sieve[n]])
+        pseudoprimes = [561, 2047, 3215031751, 3825123056546413051, 318665857834031151167461,
+                        3317044064679887385961981, (2**61 - 1) * (2**89 - 1), (2**127 - 1) ** 2]
+        self.assertFalse(any(is_prime(n) for n in pseudoprimes))
+        self.assertTrue(all(is_prime(n) for n in (18446744073709551557, 2**89 - 1, 2**127 - 1, 2**521 - 1)))
+        self.assertEqual(is_prime_check(str(2**607 - 1)), "True")
+        self.assertEqual(is_prime_check("-7"), "False")
+
+    def test_factorization_engine(self):
+        """Tests Pollard-Brent/ECM factorization and the divisors generated from it."""
+        p, q, r = 1000000007, 998244353, 1000000000000000003
+        self.assertEqual(factorize(2**10 * 3**4 * p * q**2 * r), ({2: 10, 3: 4, q: 2, p: 1, r: 1}, 1))
+        self.assertEqual(factorize(100000000000000000039 ** 3), ({100000000000000000039: 3}, 1))
+        self.assertEqual(prime_factors(str(p * r)), [p, r])
+        self.assertEqual(prime_factors("360"), [2, 2, 2, 3, 3, 5])
+        self.assertEqual(find_divisors(str(p * q)), [1, q, p, p * q])
+        self.assertEqual(find_divisors("-12"), [1, 2, 3, 4, 6, 12])
+        self.assertEqual(get_proper_divisors(28), [1, 2, 4, 7, 14])
+        semiprime = (2**89 - 1) * (2**107 - 1)
+        self.assertEqual(factorize(semiprime, time_budget=0), ({}, semiprime))
+
     def test_is_divisible(self):
         """Tests the divisibility checker."""
         self.assertEqual(is_divisible("10", "2"), "True")
@@ -37,5 +76,34 @@ class TestCheckers(unittest.TestCase):
         self.assertEqual(is_perfect_square("16"), "True")
         self.assertEqual(is_perfect_square("17"), "False")
 
+    def test_exact_checks_for_big_integers(self):
+        """Tests the integer-root and closed-form checkers on 1000-digit numbers and the batch API."""
+        big = 10 ** 999 + 7
+        self.assertEqual(is_perfect_cube(str(big ** 3)), "True")
+        self.assertEqual(is_perfect_cube(str(big ** 3 + 1)), "False")
+        self.assertEqual(is_perfect_cube("-27"), "True")
+        self.assertTrue(is_perfect_power(big ** 5, 5))
+        self.assertFalse(is_perfect_power(big ** 5 - 1, 5))
+        a, b = 0, 1
+        while len(str(a)) < 1000:
+            a, b = b, a + b
+        self.assertTrue(is_fibonacci(a))
+        self.assertFalse(is_fibonacci(a + 1))
+        self.assertTrue(is_triangular(big * (big + 1) // 2))
+        self.assertFalse(is_triangular(big * (big + 1) // 2 + 1))
+        self.assertTrue(is_armstrong(115132219018763992565095597973971522401))
+        self.assertFalse(is_armstrong(big))
+        self.assertTrue(is_happy(10 ** 1000))
+        numbers = list(range(-20, 2000)) + [2 ** 49 - 1, 12586269025]
+        scalar = check_batch(numbers)
+        self.assertEqual(scalar["fibonacci"][:26], [False] * 20 + [True, True, True, True, False, True])
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        vectorized = check_batch(np.array(numbers))
+        for name in BATCH_CHECKS:
+            self.assertEqual(vectorized[name].tolist(), scalar[name], name)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+import base64
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core.analyzers import calculate_entropy, calculate_ic, detect_cipher
+from app.core.cipher_classifier import classify, classify_batch, identify_hash
+from app.core.converters import rot_n_encrypt
+
+
+class TestCipherClassifier(unittest.TestCase):
+
+    def test_classify_formats(self):
+        """Tests that each supported encoding is recognised from its charset."""
+        samples = {
+            "0100 1000 0110": "binary",
+            "0755 0644": "octal",
+            "deadBEEF 00ff": "hex",
+            "d41d8cd98f00b204e9800998ecf8427e": "hex_digest",
+            base64.b32encode(b"hello world, this is base32").decode(): "base32",
+            base64.b64encode(b"hello world, this is base64").decode(): "base64",
+            base64.b64encode(bytes(range(200, 232))).decode(): "base64_digest",
+            base64.a85encode(b"hello world, this is ascii85 text").decode(): "ascii85",
+            base64.b85encode(b"hello world, this is base85 text").decode(): "base85",
+            ".... . .-.. .-.. --- / .-- --- .-. .-.. -..": "morse",
+            "⠓⠑⠇⠇⠕ ⠺⠕⠗⠇⠙": "braille",
+            "hello%20world%21": "url",
+            "Hello world, this is plain text.": "text",
+        }
+        for text, expected in samples.items():
+            self.assertEqual(classify(text)["format"], expected, text)
+        self.assertIn("error", classify(" \n"))
+
+    def test_single_case_ciphertext_is_text(self):
+        """Tests that uppercase Caesar ciphertext is not mistaken for Base32/64/85 or a Base64 digest."""
+        plaintexts = ["HELLOWORLDHELLOWORLDHELLO", "THEQUICKBROWNFOXJUMPSOVERTHELAZYDOG",
+                      "ATTACKATDAWNATTACKATDAWNATTACKATDAWNATTACKS", "MEETMEATTHEOLDBRIDGEATMIDNIGHTTONIGHTX"]
+        for plaintext in plaintexts:
+            for shift in range(26):
+                ciphertext = rot_n_encrypt(plaintext, shift)
+                self.assertEqual(classify(ciphertext)["format"], "text", ciphertext)
+                self.assertIn("error", identify_hash(ciphertext))
+        # 43 letters padded to 44 decode to 32 bytes, the size of a SHA-256 digest.
+        self.assertIn("error", identify_hash("A" * 43))
+        self.assertEqual(classify("ABCDEFGHIJKLMNOPQRSTUVWXYZABCDEFGHIJKLMNOPQ")["format"], "text")
+
+    def test_statistics_and_batch(self):
+        """Tests that the single pass matches calculate_ic/calculate_entropy and that batches keep order."""
+        text = "Straße über Wolken, the quick brown fox jumps over the lazy dog."
+        result = classify(text)
+        self.assertAlmostEqual(result["ic"], calculate_ic(text))
+        self.assertAlmostEqual(result["entropy"], calculate_entropy(text))
+        self.assertEqual(detect_cipher("0101 1100"), {"Conclusion": "Looks like Binary (Base2)."})
+        self.assertEqual(set(detect_cipher(text)), {"Index of Coincidence (IC)", "Shannon Entropy", "Conclusion"})
+
+        samples = [f"sample {i} text" if i % 3 else format(i, "b") for i in range(600)]
+        expected = [classify(s) for s in samples]
+        self.assertEqual(classify_batch(samples, max_workers=1), expected)
+        self.assertEqual(classify_batch(samples, max_workers=2, chunksize=100), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
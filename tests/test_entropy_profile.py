@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+import random
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core import entropy_profile
+from app.core.analyzers import calculate_entropy
+from app.core.entropy_profile import file_entropy_profile, high_entropy_regions, sparkline
+
+
+class TestEntropyProfile(unittest.TestCase):
+
+    def test_sliding_window_matches_direct_computation(self):
+        """Tests that the sliding histogram and the NumPy path match per-window entropy."""
+        rng = random.Random(7)
+        data = bytes(rng.randrange(256 if i % 3000 < 1500 else 4) for i in range(9000))
+        results = [entropy_profile.entropy_profile(data, window=1024, stride=512)]
+        saved = entropy_profile.np
+        entropy_profile.np = None
+        try:
+            results.append(entropy_profile.entropy_profile(data, window=1024, stride=512))
+        finally:
+            entropy_profile.np = saved
+        for result in results:
+            self.assertEqual(result["offsets"][-1], len(data) - 1024)
+            for offset, entropy in zip(result["offsets"], result["entropy"]):
+                window = data[offset:offset + 1024].decode("latin-1")
+                self.assertAlmostEqual(entropy, calculate_entropy(window), places=9)
+
+    def test_file_profile_finds_random_region(self):
+        """Tests that a random region inside a zero-filled file is located."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "image.bin")
+            with open(path, "wb") as f:
+                f.write(bytes(8192) + os.urandom(16384) + bytes(8192))
+            profile = file_entropy_profile(path, window=4096)
+        self.assertEqual(high_entropy_regions(profile), [(8192, 24576)])
+        self.assertEqual(sparkline(profile["entropy"])[0], "▁")
+        self.assertIn("error", file_entropy_profile(os.path.join(tmp, "missing.bin")))
+
+
+if __name__ == '__main__':
+    unittest.main()
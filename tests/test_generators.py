@@ -11,7 +11,10 @@ from app.core.generators import (
     letters_generator,
     number_generator,
     random_id_generator,
-    random_ip_generator
+    random_ip_generator,
+    prime_numbers_generator,
+    triangular_numbers_generator,
+    stream_chunks
 )
 
 class TestGenerators(unittest.TestCase):
@@ -55,5 +58,18 @@ class TestGenerators(unittest.TestCase):
         ip_pattern = re.compile(r"^(?:[0-9]{1,3}\.){3}[0-9]{1,3}$")
         self.assertTrue(ip_pattern.match(ips[0]))
 
+    def test_sequence_generators_stream(self):
+        """Tests the prime and triangular generators and their chunked output."""
+        self.assertEqual(list(prime_numbers_generator("10")), [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+        self.assertEqual(list(prime_numbers_generator("90-110")), [97, 101, 103, 107, 109])
+        self.assertEqual(list(triangular_numbers_generator("5")), [1, 3, 6, 10, 15])
+        chunks = list(stream_chunks(prime_numbers_generator("2500"), chunk_size=1000))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual("\n".join(chunks).split("\n")[-1], "22307")
+        with self.assertRaises(ValueError):
+            prime_numbers_generator("20-10")
+        with self.assertRaises(ValueError):
+            triangular_numbers_generator("0")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
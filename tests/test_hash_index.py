@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import hashlib
+import tempfile
+import contextlib
+import io
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core.cipher_classifier import identify_hash
+from app.core.converters import bcrypt_hash, argon2_hash, md5_checksum, sha1_hash, sha256_hash
+from app.core.hash_index import HashIndex, analyze_hash, build_hash_index, lookup_hash, main
+
+
+class TestHashIndex(unittest.TestCase):
+
+    def test_identify_hash(self):
+        """Tests identification by prefix, length and alphabet."""
+        self.assertEqual(identify_hash(md5_checksum("audit"))["candidates"][0], "MD5")
+        self.assertEqual(identify_hash(sha1_hash("audit"))["candidates"][0], "SHA-1")
+        self.assertEqual(identify_hash(sha256_hash("audit"))["bits"], 256)
+        bcrypt_result = identify_hash(bcrypt_hash("audit"))
+        self.assertEqual((bcrypt_result["encoding"], bcrypt_result["candidates"]), ("crypt", ["bcrypt"]))
+        argon2_result = identify_hash(argon2_hash("audit"))
+        self.assertEqual(argon2_result["candidates"], ["Argon2"])
+        self.assertEqual(argon2_result["parameters"]["variant"], "argon2id")
+        self.assertIn("error", identify_hash("not a hash"))
+
+    def test_build_and_lookup(self):
+        """Tests that every wordlist entry is found by binary search and unknown digests are not."""
+        words = [f"value-{i}" for i in range(500)] + ["pässwörd", "value-3"]
+        with tempfile.TemporaryDirectory() as tmp:
+            wordlist = os.path.join(tmp, "words.txt")
+            with open(wordlist, "w", encoding="utf-8") as f:
+                f.write("\n".join(words) + "\n\n")
+            built = build_hash_index(wordlist, os.path.join(tmp, "words.chidx"), "SHA-256")
+            self.assertEqual(built["entries"], 501)
+            with HashIndex(built["path"]) as index:
+                self.assertEqual(index.algorithm, "SHA-256")
+                for word in words:
+                    self.assertEqual(index.lookup(hashlib.sha256(word.encode()).hexdigest()), word)
+                self.assertIsNone(index.lookup(hashlib.sha256(b"missing").hexdigest()))
+                self.assertIsNone(index.lookup(hashlib.md5(b"value-1").hexdigest()))
+            md5_index = build_hash_index(wordlist, os.path.join(tmp, "words-md5.chidx"), "MD5")["path"]
+            paths = [built["path"], md5_index]
+            self.assertEqual(lookup_hash(md5_checksum("value-7"), paths), [(md5_index, "MD5", "value-7")])
+            result = analyze_hash(sha256_hash("pässwörd"), paths)
+            self.assertEqual(result["matches"], [(built["path"], "SHA-256", "pässwörd")])
+            with self.assertRaises(ValueError):
+                build_hash_index(wordlist, os.path.join(tmp, "x.chidx"), "CRC-7")
+
+
+    def test_external_sort_and_command_line(self):
+        """Tests that a build merged from many sorted runs matches the in-memory one and that the CLI works."""
+        words = [f"word-{i % 300}" for i in range(1000)]
+        with tempfile.TemporaryDirectory() as tmp:
+            wordlist = os.path.join(tmp, "words.txt")
+            with open(wordlist, "w", encoding="utf-8") as f:
+                f.write("\n".join(words))
+            whole = build_hash_index(wordlist, os.path.join(tmp, "whole.chidx"), "MD5")
+            merged = build_hash_index(wordlist, os.path.join(tmp, "merged.chidx"), "MD5", chunk_words=7)
+            self.assertEqual(merged["entries"], 300)
+            with open(whole["path"], "rb") as a, open(merged["path"], "rb") as b:
+                self.assertEqual(a.read(), b.read())
+            self.assertEqual(sorted(os.listdir(tmp)), ["merged.chidx", "whole.chidx", "words.txt"])
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                main(["build", wordlist, "--algorithm", "SHA-1", "--output", os.path.join(tmp, "cli.chidx")])
+                main(["lookup", sha1_hash("word-42"), "--index", os.path.join(tmp, "cli.chidx")])
+            self.assertIn("300 entries", output.getvalue())
+            self.assertIn("SHA-1: word-42", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+import hashlib
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core.integrity import hash_directory, HashCache
+
+class TestIntegrity(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp.name, "tree")
+        os.makedirs(os.path.join(self.root, "sub"))
+        for rel, content in (("a.txt", b"alpha"), ("sub/b.txt", b"beta")):
+            with open(os.path.join(self.root, rel), "wb") as f:
+                f.write(content)
+        self.cache_path = os.path.join(self.tmp.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hash_directory_uses_cache(self):
+        """Tests that unchanged files are served from the cache and changed ones re-hashed."""
+        first = hash_directory(self.root, "SHA-256", cache=self.cache_path)
+        self.assertEqual(first["hashed"], 2)
+        self.assertEqual(first["files"]["sub/b.txt"], hashlib.sha256(b"beta").hexdigest())
+
+        second = hash_directory(self.root, "SHA-256", cache=self.cache_path)
+        self.assertEqual((second["hashed"], second["cached"]), (0, 2))
+        self.assertEqual(second["merkle_root"], first["merkle_root"])
+
+        with open(os.path.join(self.root, "a.txt"), "wb") as f:
+            f.write(b"alpha, longer")
+        third = hash_directory(self.root, "SHA-256", cache=self.cache_path)
+        self.assertEqual((third["hashed"], third["cached"]), (1, 1))
+        self.assertNotEqual(third["merkle_root"], first["merkle_root"])
+
+    def test_missing_directory(self):
+        """Tests that a missing directory is reported as an error."""
+        with HashCache(":memory:") as cache:
+            result = hash_directory(os.path.join(self.root, "nope"), cache=cache)
+        self.assertIn("error", result)
+
+if __name__ == '__main__':
+    unittest.main()
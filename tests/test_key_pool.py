@@ -0,0 +1,60 @@
+import unittest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core import key_pool
+from app.core.key_pool import (
+    KeyPool, enable_key_pool, disable_key_pool, generate_keys_batch, configure_key_pool
+)
+from app.core.dispatcher import detect_conversion_type
+
+
+class TestKeyPool(unittest.TestCase):
+
+    def test_refills_to_high_watermark(self):
+        """Tests that the pool refills in the background and hands out distinct keys."""
+        pool = KeyPool(low_watermark=2, high_watermark=4, max_workers=2)
+        try:
+            pool.prefill("ECC", "SECP256R1")
+            deadline = time.time() + 10
+            while pool.available("ECC", "secp256r1") < 4 and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(pool.available("ECC", "SECP256R1"), 4)
+            keys = {pool.get("ECC", "SECP256R1") for _ in range(6)}
+            self.assertEqual(len(keys), 6)
+            self.assertTrue(all("BEGIN EC PRIVATE KEY" in private for private, _ in keys))
+        finally:
+            pool.shutdown()
+
+    def test_dispatcher_and_batch_use_shared_pool(self):
+        """Tests that the Generate tab and the batch API work with the shared pool enabled."""
+        enable_key_pool(low_watermark=1, high_watermark=2)
+        try:
+            result = detect_conversion_type("", "Generate ECC Keys", base="SECP256R1")
+            self.assertIn("PUBLIC KEY:", result)
+            self.assertEqual(len(set(generate_keys_batch("ECC", "SECP256R1", 3))), 3)
+        finally:
+            disable_key_pool()
+        self.assertEqual(len(generate_keys_batch("ECC", "SECP256R1", 2)), 2)
+
+
+    def test_configure_from_settings(self):
+        """Tests that the key pool setting enables, disables and validates the shared pool."""
+        try:
+            configure_key_pool({"low_watermark": 1, "high_watermark": 3})
+            self.assertEqual(key_pool._pool.high_watermark, 3)
+            configure_key_pool({"enabled": False})
+            self.assertIsNone(key_pool._pool)
+            with self.assertRaises(ValueError):
+                configure_key_pool({"low_watermark": 5, "high_watermark": 3})
+            with self.assertRaises(ValueError):
+                configure_key_pool({"size": 3})
+        finally:
+            disable_key_pool()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import io
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core import analyzers
+from app.core.analyzers import calculate_basic_statistics
+from app.core.number_stats import select, median, percentiles, histogram, RunningStats
+from app.core.stream_analyzers import basic_statistics_stream
+
+
+class TestNumberStats(unittest.TestCase):
+
+    def test_selection_and_percentiles(self):
+        """Tests that selection and percentiles agree with sorting."""
+        rng = random.Random(3)
+        values = [rng.choice([rng.randint(-50, 50), rng.random() * 10]) for _ in range(501)]
+        ordered = sorted(values)
+        self.assertEqual([select(values, k) for k in (0, 250, 500)], [ordered[0], ordered[250], ordered[500]])
+        self.assertEqual(median(values[:500]), (sorted(values[:500])[249] + sorted(values[:500])[250]) / 2)
+        self.assertEqual(percentiles([1, 2, 3, 4], (0, 50, 90)), {0: 1.0, 50: 2.5, 90: 3.7})
+
+    def test_basic_statistics_paths_agree(self):
+        """Tests the NumPy path, the Python path and the constant-memory stream against each other."""
+        rng = random.Random(5)
+        text = " ".join(str(rng.randint(-1000, 1000)) for _ in range(4001))
+        python_stats = calculate_basic_statistics(text)
+        saved = analyzers.NUMPY_STATS_THRESHOLD
+        analyzers.NUMPY_STATS_THRESHOLD = 1
+        try:
+            numpy_stats = calculate_basic_statistics(text + " ")
+        finally:
+            analyzers.NUMPY_STATS_THRESHOLD = saved
+        for key in ("count", "median", "modes", "min", "max"):
+            self.assertEqual(numpy_stats[key], python_stats[key])
+        self.assertEqual([c for _, _, c in numpy_stats["histogram"]], [c for _, _, c in python_stats["histogram"]])
+        for key in ("mean", "variance"):
+            self.assertAlmostEqual(numpy_stats[key], python_stats[key])
+        stream = basic_statistics_stream(io.StringIO(text), chunk_size=100)
+        self.assertEqual((stream["count"], stream["min"], stream["max"]), (4001, python_stats["min"], python_stats["max"]))
+        self.assertAlmostEqual(stream["mean"], python_stats["mean"])
+        self.assertAlmostEqual(stream["variance"], python_stats["variance"], places=6)
+        self.assertLess(abs(stream["median"] - python_stats["median"]), 50)
+        self.assertEqual(RunningStats().update([2, 4, 4, 4, 5, 5, 7, 9]).variance(), 4.0)
+
+    def test_integers_beyond_float_precision(self):
+        """Tests that integers above 2**53 keep exact medians, modes, percentiles and histogram bounds."""
+        text = " ".join(str(2 ** 60 + i) for i in range(4000)) + " " + str(2 ** 60 + 7)
+        saved = analyzers.NUMPY_STATS_THRESHOLD
+        try:
+            for threshold in (1, saved):
+                analyzers.NUMPY_STATS_THRESHOLD = threshold
+                stats = calculate_basic_statistics(text)
+                self.assertEqual(stats["modes"], [2 ** 60 + 7])
+                self.assertEqual(stats["percentiles"][50], 2 ** 60 + 1999)
+                lows = [low for low, _, _ in stats["histogram"]]
+                self.assertEqual(lows, sorted(set(lows)))
+        finally:
+            analyzers.NUMPY_STATS_THRESHOLD = saved
+        bins = histogram([9007199254740993 + i for i in range(5)])
+        self.assertEqual(bins, [(9007199254740993 + i, 9007199254740993 + i, 1) for i in range(5)])
+        self.assertEqual(percentiles([2 ** 60, 2 ** 60 + 2], (50,)), {50: 2 ** 60 + 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
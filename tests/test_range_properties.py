@@ -0,0 +1,51 @@
+import unittest
+import sys
+import os
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core import range_properties
+from app.core.range_properties import PROPERTY_COLUMNS, classify_range, range_properties_csv
+from app.core.checkers import is_prime, is_happy, is_armstrong, is_fibonacci, is_palindrome, get_proper_divisors
+
+
+def _reference(n):
+    divisor_sum = sum(get_proper_divisors(n))
+    root, cube = int(n ** 0.5), round(n ** (1 / 3))
+    k = int((8 * n + 1) ** 0.5)
+    return {
+        "prime": is_prime(n), "perfect": n > 0 and divisor_sum == n, "abundant": n > 0 and divisor_sum > n,
+        "deficient": n > 0 and divisor_sum < n, "happy": is_happy(n), "palindromic": is_palindrome(n),
+        "square": root * root == n, "cube": cube ** 3 == n, "fibonacci": is_fibonacci(n),
+        "triangular": k * k == 8 * n + 1, "armstrong": is_armstrong(n),
+    }
+
+
+class TestRangeProperties(unittest.TestCase):
+
+    def test_classify_range_matches_checkers(self):
+        """Tests every column against the single-number checkers, with and without NumPy."""
+        for numpy_module in (range_properties.np, None):
+            with mock.patch.object(range_properties, "np", numpy_module):
+                for a, b in [(0, 1000), (8100, 8200), (10**9, 10**9 + 100)]:
+                    columns = classify_range(a, b)
+                    for i, n in enumerate(range(a, b + 1)):
+                        expected = _reference(n)
+                        for name in PROPERTY_COLUMNS:
+                            self.assertEqual(bool(columns[name][i]), expected[name], (name, n))
+        with self.assertRaises(ValueError):
+            classify_range(10, 5)
+
+    def test_csv_stream(self):
+        """Tests the CSV header, row layout and block boundaries."""
+        chunks = list(range_properties_csv(1, 30, block=8))
+        self.assertEqual(chunks[0], "n," + ",".join(PROPERTY_COLUMNS))
+        self.assertEqual(len(chunks), 5)
+        rows = "\n".join(chunks[1:]).split("\n")
+        self.assertEqual(len(rows), 30)
+        self.assertEqual(rows[5], "6,0,1,0,0,0,1,0,0,0,1,1")
+
+
+if __name__ == '__main__':
+    unittest.main()
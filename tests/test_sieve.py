@@ -0,0 +1,50 @@
+import unittest
+import sys
+import os
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core import sieve
+from app.core.checkers import is_prime
+from app.core.sieve import segmented_sieve, count_primes, nth_prime
+
+
+class TestSieve(unittest.TestCase):
+
+    def test_segmented_sieve_matches_primality(self):
+        """Tests ranges across segment boundaries, near the wheel primes and far from zero."""
+        for a, b in [(0, 50), (13, 13), (14, 16), (200000, 500000), (10**12, 10**12 + 20000)]:
+            expected = [n for n in range(a, b + 1) if is_prime(n)]
+            self.assertEqual(list(segmented_sieve(a, b)), expected)
+            self.assertEqual(count_primes(a, b), len(expected))
+        self.assertEqual(count_primes(10**6), 78498)
+        self.assertEqual([nth_prime(n) for n in range(1, 8)], [2, 3, 5, 7, 11, 13, 17])
+        self.assertEqual(nth_prime(10**5), 1299709)
+
+    def test_process_pool_blocks(self):
+        """Tests that blocks sieved on a process pool come back complete and in order."""
+        with mock.patch.object(sieve, "PARALLEL_MIN_RANGE", 1 << 16), mock.patch.object(sieve, "PARALLEL_BLOCK", 1 << 15):
+            primes = list(segmented_sieve(10**6, 10**6 + 200000, max_workers=2))
+            self.assertEqual(count_primes(10**6, 10**6 + 200000, max_workers=2), len(primes))
+        self.assertEqual(primes, list(segmented_sieve(10**6, 10**6 + 200000, max_workers=1)))
+
+
+    def test_narrow_ranges_of_huge_numbers(self):
+        """Tests that narrow ranges far beyond the sieving limit are fast and confirmed with is_prime."""
+        start = time.perf_counter()
+        for a in (10**16, 10**18, 10**30):
+            expected = [n for n in range(a, a + 1001) if is_prime(n)]
+            self.assertEqual(list(segmented_sieve(a, a + 1000)), expected)
+            self.assertEqual(count_primes(a, a + 1000), len(expected))
+        self.assertLess(time.perf_counter() - start, 2)
+        with mock.patch.object(sieve, "SIEVE_MAX_BASE", 1 << 8), mock.patch.object(sieve, "PRESIEVE_MIN_BASE", 1 << 4), \
+                mock.patch.object(sieve, "PARALLEL_MIN_RANGE", 1 << 12), mock.patch.object(sieve, "PARALLEL_BLOCK", 1 << 11):
+            expected = [n for n in range(10**7, 10**7 + 10000) if is_prime(n)]
+            self.assertEqual(list(segmented_sieve(10**7, 10**7 + 9999, max_workers=2)), expected)
+            self.assertEqual(count_primes(10**7, 10**7 + 9999, max_workers=2), len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
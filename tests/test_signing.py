@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core.converters import ecc_generate_keys, rsa_generate_keys, file_digest
+from app.core.dispatcher import detect_conversion_type
+from app.core.signing import (
+    sign_messages, verify_messages, create_signature_manifest,
+    write_signature_manifest, verify_signature_manifest
+)
+
+
+class TestSigning(unittest.TestCase):
+
+    def test_batch_sign_and_verify(self):
+        """Tests batch signing, per-item verification and the line-based tabs."""
+        private_key, public_key = ecc_generate_keys()
+        messages = [f"artifact-{i}" for i in range(20)]
+        signatures = dict(sign_messages(messages, private_key, "ECC", max_workers=4))
+        items = [(message, signatures[i]) for i, message in enumerate(messages)]
+        items[3] = ("tampered", items[3][1])
+        results = dict(verify_messages(items, public_key, "ECC", max_workers=4))
+        self.assertEqual([i for i, ok in results.items() if not ok], [3])
+
+        signed = detect_conversion_type("first\n  second  \nthird", "ECC Sign", base=private_key)
+        report = detect_conversion_type(signed, "ECC Verify", base=public_key)
+        self.assertTrue(report.endswith("3/3 signatures valid"))
+
+    def test_signature_manifest(self):
+        """Tests that a manifest verifies and reports modified and missing files."""
+        private_key, public_key = rsa_generate_keys(key_size=2048)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name in ("a.bin", "b.bin", "c.bin"):
+                paths.append(os.path.join(tmp, name))
+                with open(paths[-1], "wb") as f:
+                    f.write(name.encode() * 1000)
+            manifest_path = os.path.join(tmp, "SIGNATURES.json")
+            write_signature_manifest(create_signature_manifest(paths, private_key, base_dir=tmp), manifest_path)
+            with open(paths[1], "ab") as f:
+                f.write(b"!")
+            os.remove(paths[2])
+            self.assertEqual(verify_signature_manifest(manifest_path, public_key),
+                             {"a.bin": "valid", "b.bin": "invalid", "c.bin": "missing"})
+            self.assertIn("error", verify_signature_manifest(manifest_path, rsa_generate_keys()[1]))
+
+    def test_manifest_entries_are_bound_to_names(self):
+        """Tests that an entry moved to another file with the same content does not verify."""
+        private_key, public_key = ecc_generate_keys()
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, name) for name in ("a.bin", "b.bin")]
+            for path in paths:
+                with open(path, "wb") as f:
+                    f.write(b"same")
+            manifest = create_signature_manifest(paths, private_key, "ECC", base_dir=tmp)
+            manifest["files"]["b.bin"] = manifest["files"]["a.bin"]
+            self.assertEqual(verify_signature_manifest(manifest, public_key, base_dir=tmp),
+                             {"a.bin": "valid", "b.bin": "invalid"})
+
+
+    def test_manifest_names_cannot_escape_base_dir(self):
+        """Tests that entries outside the base directory or naming non-regular files are never opened."""
+        private_key, public_key = ecc_generate_keys()
+        with tempfile.TemporaryDirectory() as tmp:
+            base = os.path.join(tmp, "base")
+            os.makedirs(os.path.join(base, "sub"))
+            path = os.path.join(base, "a.bin")
+            with open(path, "wb") as f:
+                f.write(b"data")
+            with open(os.path.join(tmp, "secret"), "wb") as f:
+                f.write(b"secret")
+            manifest = create_signature_manifest([path], private_key, "ECC", base_dir=base)
+            record = manifest["files"]["a.bin"]
+            for name in ("../secret", os.path.join(tmp, "secret").replace(os.sep, "/"), "sub", "nothere"):
+                manifest["files"][name] = record
+            with mock.patch("app.core.signing.file_digest", wraps=file_digest) as digest:
+                results = verify_signature_manifest(manifest, public_key, base_dir=base)
+            self.assertEqual(results["a.bin"], "valid")
+            self.assertEqual(results["nothere"], "missing")
+            self.assertEqual({results[name] for name in results if name not in ("a.bin", "nothere")}, {"error"})
+            self.assertEqual([call.args[0] for call in digest.call_args_list], [os.path.realpath(path)])
+
+
+if __name__ == '__main__':
+    unittest.main()
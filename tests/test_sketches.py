@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import random
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core import analyzers, stream_analyzers
+from app.core.analyzers import number_frequency_analysis
+from app.core.sketches import SpaceSaving, top_counts
+from app.core.stream_analyzers import TextAccumulator
+
+
+class TestSketches(unittest.TestCase):
+
+    def test_space_saving_bounds(self):
+        """Tests the Space-Saving error guarantees, including after a merge."""
+        rng = random.Random(11)
+        data = [int(rng.paretovariate(1.1)) for _ in range(5000)]
+        first, second = SpaceSaving(20), SpaceSaving(20)
+        first.update_many(data[:2000])
+        for item in data[2000:]:
+            second.update(item)
+        sketch = first.merge(second)
+        true = Counter(data)
+        self.assertEqual(sketch.total, len(data))
+        self.assertFalse(sketch.is_exact())
+        for item, count, error in sketch.top():
+            self.assertLessEqual(count - error, true[item])
+            self.assertLessEqual(true[item], count)
+        monitored = {item for item, _, _ in sketch.top()}
+        self.assertTrue(all(c <= sketch.min_count() for item, c in true.items() if item not in monitored))
+        self.assertEqual([item for item, _, _ in sketch.top(3)], [item for item, _ in true.most_common(3)])
+        counts = {i: i % 7 for i in range(100)}
+        self.assertEqual(top_counts(counts, 15), sorted(counts.items(), key=lambda x: x[1], reverse=True)[:15])
+
+    def test_frequency_switches_to_sketch(self):
+        """Tests that exact and sketch modes are picked by input size and agree on heavy hitters."""
+        text = " ".join(str(i % 50 if i % 3 else i) for i in range(3000))
+        exact = number_frequency_analysis(text)
+        self.assertNotIn("approximate", exact)
+        saved = analyzers.FREQUENCY_SKETCH_THRESHOLD, stream_analyzers.FREQUENCY_SKETCH_DISTINCT
+        analyzers.FREQUENCY_SKETCH_THRESHOLD = stream_analyzers.FREQUENCY_SKETCH_DISTINCT = 100
+        try:
+            approximate = number_frequency_analysis(text, capacity=200)
+            accumulator = TextAccumulator(frequency_capacity=200)
+            for i in range(0, len(text), 500):
+                accumulator.feed(text[i:i + 500])
+            streamed = accumulator.close().number_frequency()
+        finally:
+            analyzers.FREQUENCY_SKETCH_THRESHOLD, stream_analyzers.FREQUENCY_SKETCH_DISTINCT = saved
+        for result in (approximate, streamed):
+            self.assertTrue(result["approximate"])
+            self.assertIsNone(result["unique_numbers"])
+            self.assertEqual({n for n, _ in result["most_common_numbers"][:5]},
+                             {n for n, _ in exact["most_common_numbers"][:5]})
+
+
+if __name__ == '__main__':
+    unittest.main()
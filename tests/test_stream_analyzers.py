@@ -0,0 +1,40 @@
+import unittest
+import sys
+import os
+import io
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from app.core.analyzers import character_stats, character_frequency_analysis, number_analysis, number_frequency_analysis
+from app.core.stream_analyzers import analyze_stream, analyze_file
+
+TEXT = "Alpha 12 beta -3.5 gamma\n7. 1000 delta-42 x\n\tepsilon 0 99 zeta 3.14159\n" * 40
+
+
+class TestStreamAnalyzers(unittest.TestCase):
+
+    def test_stream_matches_string_analyzers(self):
+        """Tests that small chunks give the same results as analyzing the whole string."""
+        acc = analyze_stream(io.StringIO(TEXT), chunk_size=7)
+        self.assertEqual(acc.character_stats(), character_stats(TEXT))
+        self.assertEqual(acc.character_frequency(), character_frequency_analysis(TEXT))
+        self.assertEqual(acc.number_frequency(), number_frequency_analysis(TEXT))
+        expected = number_analysis(TEXT)
+        expected["numbers_list"] = expected["numbers_list"][:10]
+        self.assertEqual(acc.number_analysis(), expected)
+
+    def test_analyze_file_in_segments(self):
+        """Tests that a file split into segments across workers merges to the full result."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(TEXT)
+            acc = analyze_file(path, max_workers=2, segment_size=200, chunk_size=64)
+        self.assertEqual(acc.character_stats(), character_stats(TEXT))
+        self.assertEqual(acc.number_frequency(), number_frequency_analysis(TEXT))
+        self.assertEqual(acc.number_analysis()["sum"], number_analysis(TEXT)["sum"])
+
+
+if __name__ == '__main__':
+    unittest.main()